@@ -0,0 +1,57 @@
+import numpy as np
+
+from pong.physics_profile import PhysicsProfile
+
+from .physics_profiles import play_rallies
+
+
+def compare_adaptive_stepping(n_rallies=1000, seed=0, max_time=50.0, coarse_ticks=(1, 2, 4)):
+    """Compare fixed and adaptive stepping against fixed stepping of EXACT profile at 1/60 s.
+    Controllers are updated once per Game.update(), so with a coarse delta time they react less often too.
+
+    Parameters
+    --------------------
+    n_rallies: int, optional
+        number of seeded rallies played by each configuration
+
+    seed: int, optional
+        root seed of rallies
+
+    max_time: float, optional
+        maximum time of a rally in seconds
+
+    coarse_ticks: tuple, optional
+        delta times to try, as multiples of 1/60 s
+
+    Return
+    --------------------
+    reports: dict
+        report of each configuration (profile, ticks per update). It contains "game_time_per_second"
+        (seconds of game simulated per second spent on Game.update), "speedup" over reference,
+        "same_outcome" (fraction of rallies with same winner) and "mean_duration_error" (mean of
+        absolute difference of rally durations in seconds)"""
+
+    reports = {}
+    reference = None
+    for n_ticks in coarse_ticks:
+        delta_time = n_ticks / 60.0
+        for profile in (PhysicsProfile.EXACT, PhysicsProfile.ADAPTIVE):
+            winners, trajectories, update_time = play_rallies(profile, n_rallies, seed, int(max_time / delta_time), delta_time)
+            durations = np.array([(len(trajectory) + 1) * delta_time for trajectory in trajectories])
+            game_time = durations.sum()
+
+            if reference is None:
+                reference = (winners, durations, game_time / update_time)
+
+            reports[(profile, n_ticks)] = {"game_time_per_second": game_time / update_time,
+                                           "speedup": (game_time / update_time) / reference[2],
+                                           "same_outcome": np.mean(winners == reference[0]),
+                                           "mean_duration_error": np.mean(np.abs(durations - reference[1]))}
+
+    return reports
+
+
+if __name__ == "__main__":
+    for (profile, n_ticks), report in compare_adaptive_stepping().items():
+        print("- {} at {}/60 s: {:.0f} game s/s (x{:.2f}); same outcome = {:.1%}; mean duration error = {:.3f} s".format(
+                profile.name, n_ticks, report["game_time_per_second"], report["speedup"], report["same_outcome"], report["mean_duration_error"]))
\ No newline at end of file
@@ -0,0 +1,114 @@
+import sys
+
+from functools import partial
+from time import perf_counter
+
+from pong.game import Game, spawn_seeds
+from pong.controller.controller import PaddlePosition, MovingType, PADDLE_VELOCITIES_Y
+from pong.controller.bot_controller import BotController
+
+from rl.common.utils import get_full_inverse_observation_normalized, FULL_OBSERVATION_SIZE
+from rl.common.sp.training_sp_session import MODEL_PATH
+from rl.deep_q_networks.common.inference_server import InferenceServer, load_dqn_model
+from rl.deep_q_networks.dueling_ddqn.sp_per.costants import MODEL_NAME
+from rl.deep_q_networks.dueling_ddqn.sp_per.dueling_ddqn import DuelingDDQN
+from rl.deep_q_networks.dueling_ddqn.sp_per.dddqn_per_sp_controller import DuelingDDQN_PER_SPController
+
+
+def _new_games(n_games, seed):
+    """Create started games with BotController on left paddle."""
+
+    games = [Game(seed=game_seed) for game_seed in spawn_seeds(seed, n_games)]
+    for game in games:
+        game.start()
+
+    return games, [BotController(game.paddle_1, PaddlePosition.LEFT, game) for game in games]
+
+def _play_local(n_games, n_ticks, seed):
+    """Play games where each DQN controller runs its own batch-of-one forward pass."""
+
+    games, bots = _new_games(n_games, seed)
+    controllers = [DuelingDDQN_PER_SPController(PaddlePosition.RIGHT, game) for game in games]
+
+    actions = []
+    start_time = perf_counter()
+    for _ in range(n_ticks):
+        for game, bot, controller in zip(games, bots, controllers):
+            bot.update(1.0/60.0)
+            controller.update(1.0/60.0)
+            game.update(1.0/60.0)
+            actions.append(game.paddle_2.velocity.y)
+
+    return perf_counter() - start_time, actions
+
+def _play_served(n_games, n_ticks, seed, batch_window):
+    """Play games where DQN actions of all games are chosen by an inference server with one forward pass per tick."""
+
+    server = InferenceServer({MODEL_NAME: partial(load_dqn_model, DuelingDDQN, FULL_OBSERVATION_SIZE, MODEL_PATH + MODEL_NAME + ".pth")},
+                             batch_window=batch_window)
+    clients = [server.connect() for _ in range(n_games)]
+    server.start()
+    games, bots = _new_games(n_games, seed)
+
+    actions = []
+    start_time = perf_counter()
+    for _ in range(n_ticks):
+        for game, client in zip(games, clients):
+            client.submit(MODEL_NAME, get_full_inverse_observation_normalized(game))
+
+        for game, bot, client in zip(games, bots, clients):
+            bot.update(1.0/60.0)
+            game.paddle_2.set_velocity_y(PADDLE_VELOCITIES_Y[MovingType(client.receive())])
+            game.update(1.0/60.0)
+            actions.append(game.paddle_2.velocity.y)
+    elapsed_time = perf_counter() - start_time
+
+    server.close()
+    return elapsed_time, actions, server.mean_batch_size
+
+def compare_batched_inference(n_games_list=(1, 8, 32, 128), n_ticks=300, seed=0, batch_window=0.002):
+    """Compare throughput of games whose DQN controllers run their own forward pass against games served
+    by an in-process inference server, which batches requests of all games.
+
+    Parameters
+    --------------------
+    n_games_list: tuple, optional
+        numbers of concurrent games to compare
+
+    n_ticks: int, optional
+        number of ticks played by each game
+
+    seed: int, optional
+        seed of games
+
+    batch_window: float, optional
+        batch window of inference server
+
+    Return
+    --------------------
+    reports: dict
+        report of each number of games. It contains "local_ticks_per_s", "served_ticks_per_s",
+        "mean_batch_size" and "same_actions" (True if served games chose same actions of local ones)"""
+
+    reports = {}
+    for n_games in n_games_list:
+        local_time, local_actions = _play_local(n_games, n_ticks, seed)
+        served_time, served_actions, mean_batch_size = _play_served(n_games, n_ticks, seed, batch_window)
+        reports[n_games] = {"local_ticks_per_s": n_games * n_ticks / local_time,
+                            "served_ticks_per_s": n_games * n_ticks / served_time,
+                            "mean_batch_size": mean_batch_size,
+                            "same_actions": local_actions == served_actions}
+
+    return reports
+
+
+if __name__ == "__main__":
+    reports = compare_batched_inference()
+    for n_games, report in reports.items():
+        print("- {} games: local {:.0f} ticks/s; served {:.0f} ticks/s (x{:.2f}); mean batch = {:.1f}; {}".format(
+                n_games, report["local_ticks_per_s"], report["served_ticks_per_s"],
+                report["served_ticks_per_s"] / report["local_ticks_per_s"], report["mean_batch_size"],
+                "same actions" if report["same_actions"] else "DIFFERENT ACTIONS"))
+
+    if not all(report["same_actions"] for report in reports.values()):
+        sys.exit(1)
\ No newline at end of file
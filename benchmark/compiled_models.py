@@ -0,0 +1,88 @@
+import shutil
+import tempfile
+import numpy as np
+
+from time import perf_counter
+
+from rl.common.utils import FULL_OBSERVATION_SIZE
+from rl.common.sp.training_sp_session import MODEL_PATH
+from rl.deep_q_networks.common.model_registry import ModelRegistry
+from rl.deep_q_networks.common.compiled_models import weights_hash, load_compiled_model
+from rl.deep_q_networks.common.policy_inference import PolicyInference
+from rl.deep_q_networks.dueling_ddqn.sp_per.costants import MODEL_NAME
+from rl.deep_q_networks.dueling_ddqn.sp_per.dueling_ddqn import DuelingDDQN
+
+
+def _time_load(path, is_compiled, n_repeats):
+    """Get best time to load a model on an empty registry."""
+
+    best_time = np.inf
+    for _ in range(n_repeats):
+        start_time = perf_counter()
+        ModelRegistry().get(DuelingDDQN, FULL_OBSERVATION_SIZE, path, is_compiled)
+        best_time = min(best_time, perf_counter() - start_time)
+
+    return best_time
+
+def _time_inference(model, observations):
+    """Get mean time of an inference of an observation and actions chosen."""
+
+    inference = PolicyInference(model)
+    inference.choose_action(observations[0])
+
+    start_time = perf_counter()
+    actions = [inference.choose_action(observation) for observation in observations]
+
+    return (perf_counter() - start_time) / len(observations), actions
+
+def compare_compiled_model(path=MODEL_PATH + MODEL_NAME + ".pth", n_observations=20000, n_repeats=5, seed=0):
+    """Compare eager model against its compiled (TorchScript) artifact: load time (with fresh and stale artifact)
+    and per-call latency of inference.
+
+    Parameters
+    --------------------
+    path: str, optional
+        path of .pth file of a Dueling DDQN model
+
+    n_observations: int, optional
+        number of random observations evaluated
+
+    n_repeats: int, optional
+        number of loads timed (best one is reported)
+
+    seed: int, optional
+        seed of observations
+
+    Return
+    --------------------
+    report: dict
+        it contains "eager_load_s", "compiled_load_s" (fresh artifact), "compile_s" (stale artifact),
+        "eager_call_us", "compiled_call_us" and "same_actions" (True if both models chose same actions)"""
+
+    file_hash = weights_hash(path)
+    cache_path = tempfile.mkdtemp()
+    start_time = perf_counter()
+    load_compiled_model(DuelingDDQN, FULL_OBSERVATION_SIZE, path, file_hash, cache_path=cache_path)           #An empty cache has no fresh artifact.
+    compile_time = perf_counter() - start_time
+    shutil.rmtree(cache_path)
+    load_compiled_model(DuelingDDQN, FULL_OBSERVATION_SIZE, path, file_hash)                                    #Artifact of current weights is on cache.
+
+    observations = np.random.default_rng(seed).uniform(-1.0, 1.0, (n_observations, FULL_OBSERVATION_SIZE))
+    eager_call_time, eager_actions = _time_inference(ModelRegistry().get(DuelingDDQN, FULL_OBSERVATION_SIZE, path), observations)
+    compiled_call_time, compiled_actions = _time_inference(ModelRegistry().get(DuelingDDQN, FULL_OBSERVATION_SIZE, path, True), observations)
+
+    return {"eager_load_s": _time_load(path, False, n_repeats),
+            "compiled_load_s": _time_load(path, True, n_repeats),
+            "compile_s": compile_time,
+            "eager_call_us": 1e6 * eager_call_time,
+            "compiled_call_us": 1e6 * compiled_call_time,
+            "same_actions": eager_actions == compiled_actions}
+
+
+if __name__ == "__main__":
+    report = compare_compiled_model()
+    print("- load: eager {:.1f} ms; compiled {:.1f} ms (compiling a stale artifact {:.1f} ms)".format(
+            1000 * report["eager_load_s"], 1000 * report["compiled_load_s"], 1000 * report["compile_s"]))
+    print("- inference: eager {:.1f} us; compiled {:.1f} us (x{:.2f}); {}".format(
+            report["eager_call_us"], report["compiled_call_us"], report["eager_call_us"] / report["compiled_call_us"],
+            "same actions" if report["same_actions"] else "DIFFERENT ACTIONS"))
\ No newline at end of file
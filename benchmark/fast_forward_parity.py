@@ -0,0 +1,132 @@
+import sys
+import numpy as np
+
+from time import perf_counter
+from pygame.math import Vector2
+
+from pong.game import Game, spawn_seeds
+
+
+SCORE_GOAL = 3
+"""Score goal of matches played."""
+
+MAX_TICKS = 36000
+"""Maximum number of ticks of a match."""
+
+DELTA_TIME = 1.0 / 60.0
+"""Delta time of an update step."""
+
+TICK_TOLERANCE = 1
+"""Maximum difference of tick of an event between fast-forward and stepping tick by tick."""
+
+WALL, PADDLE, GOAL = "wall", "paddle", "goal"
+"""Kinds of events of ball."""
+
+
+def _play_match(match_seed, paddle_ys, is_fast_forward):
+    """Play a match where both paddles hold still and record events of ball.
+
+    Parameters
+    --------------------
+    match_seed: SeedSequence
+        seed of serves of match
+
+    paddle_ys: ndarray
+        positions y of paddles, as fractions (from -1 to 1) of range they can reach
+
+    is_fast_forward: bool
+        True to skip free flights of ball with advance_until_event(), False to step update() tick by tick
+
+    Returns
+    --------------------
+    events: list
+        events of ball, as (tick, kind). Tick is index of update step where event happened
+
+    scores: tuple
+        final scores of paddles
+
+    elapsed_time: float
+        time spent on advance_until_event() and update() in seconds"""
+
+    def place_paddles():
+        for paddle, paddle_y in zip((game.paddle_1, game.paddle_2), paddle_ys):
+            paddle.position = Vector2(paddle.position.x, game.field.center_position.y + paddle_y * (game.field.height - paddle.height)/2)
+
+    game = Game(score_goal=SCORE_GOAL, seed=match_seed)
+    game.start()
+    place_paddles()
+
+    events = []
+    tick = 0
+    elapsed_time = 0.0
+    while tick < MAX_TICKS and not game.is_ended():
+        start_time = perf_counter()
+        if is_fast_forward:
+            tick += game.advance_until_event((MAX_TICKS - 1 - tick) * DELTA_TIME, DELTA_TIME)
+        _, _, vel_x, vel_y = game.ball.state.tolist()
+        n_points = game.score_paddle_1 + game.score_paddle_2
+        game.update(DELTA_TIME)
+        elapsed_time += perf_counter() - start_time
+
+        _, _, new_vel_x, new_vel_y = game.ball.state.tolist()
+        if game.score_paddle_1 + game.score_paddle_2 > n_points:
+            events.append((tick, GOAL))
+            #Paddles are centered on every serve.
+            place_paddles()
+        elif (new_vel_x > 0) != (vel_x > 0):
+            events.append((tick, PADDLE))
+        elif (new_vel_y > 0) != (vel_y > 0):
+            events.append((tick, WALL))
+        tick += 1
+
+    return events, (game.score_paddle_1, game.score_paddle_2), elapsed_time
+
+def check_fast_forward(n_matches=200, seed=0):
+    """Compare matches played with advance_until_event() against same matches stepped tick by tick with update().
+
+    Parameters
+    --------------------
+    n_matches: int, optional
+        number of seeded matches
+
+    seed: int, optional
+        root seed of matches
+
+    Return
+    --------------------
+    report: dict
+        it contains "n_events", "same_events" (fraction of matches with same kinds of events in same order),
+        "max_tick_error" (maximum difference of tick of an event), "same_scores" (fraction of matches
+        with same final scores) and "speedup" of fast-forward"""
+
+    n_events = 0
+    same_events = 0
+    same_scores = 0
+    max_tick_error = 0
+    times = np.zeros(2)
+    paddles_ys = np.random.default_rng(seed).uniform(-1.0, 1.0, (n_matches, 2))
+    for match_seed, paddle_ys in zip(spawn_seeds(seed, n_matches), paddles_ys):
+        step_events, step_scores, step_time = _play_match(match_seed, paddle_ys, False)
+        ff_events, ff_scores, ff_time = _play_match(match_seed, paddle_ys, True)
+        times += (step_time, ff_time)
+
+        n_events += len(step_events)
+        same_scores += step_scores == ff_scores
+        if [kind for _, kind in step_events] == [kind for _, kind in ff_events]:
+            same_events += 1
+            max_tick_error = max([max_tick_error] + [abs(a - b) for (a, _), (b, _) in zip(step_events, ff_events)])
+
+    return {"n_events": n_events,
+            "same_events": same_events / n_matches,
+            "max_tick_error": max_tick_error,
+            "same_scores": same_scores / n_matches,
+            "speedup": times[0] / times[1]}
+
+
+if __name__ == "__main__":
+    report = check_fast_forward()
+    print("- {} events: same events = {:.1%}; max tick error = {}; same scores = {:.1%}; x{:.1f} faster".format(
+            report["n_events"], report["same_events"], report["max_tick_error"], report["same_scores"], report["speedup"]))
+
+    if report["same_events"] < 1.0 or report["same_scores"] < 1.0 or report["max_tick_error"] > TICK_TOLERANCE:
+        sys.exit(1)
\ No newline at end of file
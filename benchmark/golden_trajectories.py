@@ -0,0 +1,249 @@
+import os
+import sys
+import numpy as np
+
+from time import perf_counter
+
+from pong.game import Game
+from pong.controller.controller import PaddlePosition
+from pong.controller.bot_controller import BotController
+from pong.controller.basic_bot_controller import BasicBotController
+
+
+# ==================================================
+# ================ GLOBAL VARIABLES ================
+# ==================================================
+
+GOLDEN_PATH = os.path.join(os.path.dirname(__file__), "golden", "golden_trajectories.npz")
+"""Path of golden trajectories stored on disk."""
+
+TIMES_PATH = os.path.join(os.path.dirname(__file__), "golden", "local_times.npz")
+"""Path of throughput baseline of golden matches. It is recorded on this machine and never shared, since times
+are only comparable with ones measured on same machine."""
+
+GOLDEN_MATCHES = [("bot_vs_basic_bot", seed) for seed in range(3)] + [("bot_vs_bot", seed) for seed in range(3)]
+"""Scripted matches of golden trajectories. A match is represented as (kind, seed)."""
+
+SCORE_GOAL = 5
+"""Score to reach to win a match."""
+
+MAX_TICKS = 6000
+"""Maximum number of ticks of a match."""
+
+DELTA_TIME = 1.0 / 60.0
+"""Delta time of a tick."""
+
+
+# ==================================================
+# ================ GOLDEN FUNCTIONS ================
+# ==================================================
+
+def play_match(kind, seed):
+    """Play a seeded scripted match. BotController plays left paddle, right paddle is played by
+    BasicBotController ("bot_vs_basic_bot") or by BotController too ("bot_vs_bot").
+
+    Parameters
+    --------------------
+    kind: str
+        kind of match
+
+    seed: int
+        seed of match
+
+    Returns
+    --------------------
+    states: ndarray
+        per-tick state (y of paddle 1, y of paddle 2, x, y, vel_x and vel_y of ball) at float32 precision
+
+    scores: ndarray
+        per-tick scores of paddle 1 and paddle 2
+
+    update_time: float
+        time spent on Game.update in seconds
+
+    total_time: float
+        wall-clock time of match in seconds"""
+
+    game = Game(score_goal=SCORE_GOAL, seed=seed)
+    game.start()
+    controller_1 = BotController(game.paddle_1, PaddlePosition.LEFT, game)
+    if kind == "bot_vs_basic_bot":
+        controller_2 = BasicBotController(game.paddle_2, PaddlePosition.RIGHT, game.ball)
+    elif kind == "bot_vs_bot":
+        controller_2 = BotController(game.paddle_2, PaddlePosition.RIGHT, game)
+    else:
+        raise ValueError("unknown kind of match {}".format(kind))
+
+    states = []
+    scores = []
+    update_time = 0.0
+    start_match_time = perf_counter()
+    for _ in range(MAX_TICKS):
+        controller_1.update(DELTA_TIME)
+        controller_2.update(DELTA_TIME)
+
+        start_time = perf_counter()
+        game.update(DELTA_TIME)
+        update_time += perf_counter() - start_time
+
+        state = game.state
+        states.append((state[1], state[5], state[8], state[9], state[10], state[11]))
+        scores.append((game.score_paddle_1, game.score_paddle_2))
+
+        if game.is_ended():
+            break
+    total_time = perf_counter() - start_match_time
+
+    return np.array(states, dtype=np.float32), np.array(scores, dtype=np.uint8), update_time, total_time
+
+def _play_best_of(kind, seed, n_repeats):
+    """Play a match many times and keep its best times (they are less noisy)."""
+
+    best = None
+    for _ in range(n_repeats):
+        states, scores, update_time, total_time = play_match(kind, seed)
+        if best is None:
+            best = [states, scores, update_time, total_time]
+        else:
+            best[2] = min(best[2], update_time)
+            best[3] = min(best[3], total_time)
+
+    return best
+
+def record_golden_trajectories(path=GOLDEN_PATH):
+    """Play golden matches with current Game and store their trajectories on disk.
+
+    Parameter
+    --------------------
+    path: str, optional
+        path of file to write"""
+
+    golden = {}
+    for kind, seed in GOLDEN_MATCHES:
+        states, scores, _, _ = play_match(kind, seed)
+        name = "{}_{}".format(kind, seed)
+        golden[name + "__states"] = states
+        golden[name + "__scores"] = scores
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    np.savez_compressed(path, **golden)
+
+def record_times(path=TIMES_PATH, n_repeats=5):
+    """Play golden matches with current Game and store their times on disk as throughput baseline of this machine.
+
+    Parameters
+    --------------------
+    path: str, optional
+        path of file to write
+
+    n_repeats: int, optional
+        number of times each match is played to measure its times"""
+
+    times = {}
+    for kind, seed in GOLDEN_MATCHES:
+        states, _, update_time, total_time = _play_best_of(kind, seed, n_repeats)
+        times["{}_{}".format(kind, seed)] = np.array([update_time, total_time]) / len(states)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    np.savez_compressed(path, **times)
+
+def check_golden_trajectories(path=GOLDEN_PATH, atol=1e-3):
+    """Replay golden matches against current Game, checking behavioral drift.
+
+    Parameters
+    --------------------
+    path: str, optional
+        path of golden trajectories
+
+    atol: float, optional
+        maximum absolute difference (in pixels) allowed between a state and its golden one
+
+    Return
+    --------------------
+    reports: dict
+        report of each match. It contains "is_drifted", "first_drift_tick" (-1 if none), "max_error" and "same_scores\""""
+
+    golden = np.load(path)
+
+    reports = {}
+    for kind, seed in GOLDEN_MATCHES:
+        name = "{}_{}".format(kind, seed)
+        golden_states = golden[name + "__states"]
+        golden_scores = golden[name + "__scores"]
+        states, scores, _, _ = play_match(kind, seed)
+
+        #Drift is searched over common ticks, then a different length of match is a drift too.
+        n_common = min(len(states), len(golden_states))
+        errors = np.max(np.abs(states[:n_common].astype(np.float64) - golden_states[:n_common]), axis=1)
+        drift_ticks = np.flatnonzero((errors > atol) | np.any(scores[:n_common] != golden_scores[:n_common], axis=1))
+        if drift_ticks.size == 0 and len(states) != len(golden_states):
+            drift_ticks = np.array([n_common])
+
+        reports[name] = {"is_drifted": drift_ticks.size > 0,
+                         "first_drift_tick": drift_ticks[0] if drift_ticks.size > 0 else -1,
+                         "max_error": np.max(errors, initial=0.0),
+                         "same_scores": np.array_equal(scores[-1], golden_scores[-1])}
+
+    return reports
+
+def check_times(path=TIMES_PATH, max_slowdown=0.2, n_repeats=5):
+    """Replay golden matches against throughput baseline recorded on this machine by record_times().
+
+    Parameters
+    --------------------
+    path: str, optional
+        path of throughput baseline
+
+    max_slowdown: float, optional
+        maximum fraction of throughput that can be lost before a regression is flagged
+
+    n_repeats: int, optional
+        number of times each match is played to measure its times
+
+    Return
+    --------------------
+    throughput: dict
+        throughput over all matches, which is less noisy than one of a single match. It contains
+        "update_speedup", "total_speedup" and "is_slower" (True if a throughput regression is flagged)"""
+
+    baseline = np.load(path)
+
+    times = np.zeros(4)                 #Baseline update time, baseline total time, update time and total time per tick summed.
+    for kind, seed in GOLDEN_MATCHES:
+        states, _, update_time, total_time = _play_best_of(kind, seed, n_repeats)
+        times[:2] += baseline["{}_{}".format(kind, seed)]
+        times[2:] += np.array([update_time, total_time]) / len(states)
+
+    throughput = {"update_speedup": times[0] / times[2], "total_speedup": times[1] / times[3]}
+    throughput["is_slower"] = min(throughput["update_speedup"], throughput["total_speedup"]) < 1 - max_slowdown
+
+    return throughput
+
+if __name__ == "__main__":
+    #Throughput is only checked on request ("times"), against a baseline recorded on this machine ("record-times").
+    command = sys.argv[1] if len(sys.argv) > 1 else "check"
+    if command == "record":
+        record_golden_trajectories()
+        print("Golden trajectories recorded on {}".format(GOLDEN_PATH))
+    elif command == "record-times":
+        record_times()
+        print("Throughput baseline recorded on {}".format(TIMES_PATH))
+    elif command in ("check", "times"):
+        reports = check_golden_trajectories()
+        for name, report in reports.items():
+            print("- {}: {}; max error = {:.5f} px".format(
+                    name, "DRIFT at tick {}".format(report["first_drift_tick"]) if report["is_drifted"] else "same game", report["max_error"]))
+        is_failed = any(report["is_drifted"] for report in reports.values())
+
+        if command == "times":
+            if not os.path.exists(TIMES_PATH):
+                sys.exit("No throughput baseline on {}, record it first with 'record-times'".format(TIMES_PATH))
+            throughput = check_times()
+            print("- all matches: update x{:.2f}; total x{:.2f}{}".format(
+                    throughput["update_speedup"], throughput["total_speedup"], "; SLOWER" if throughput["is_slower"] else ""))
+            is_failed = is_failed or throughput["is_slower"]
+
+        if is_failed:
+            sys.exit(1)
+    else:
+        sys.exit("Unknown command {}: expected record, record-times, check or times".format(command))
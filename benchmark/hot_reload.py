@@ -0,0 +1,121 @@
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import numpy as np
+
+from time import perf_counter, sleep
+
+from pong.game import Game
+from pong.controller.controller import PaddlePosition
+from pong.controller.bot_controller import BotController
+
+from rl.common.sp.training_sp_session import MODEL_PATH
+from rl.deep_q_networks.common.inference_backend import InferenceBackend
+from rl.deep_q_networks.dueling_ddqn.sp_per.dddqn_per_sp_controller import DuelingDDQN_PER_SPController
+
+WEIGHTS_PATHS = [MODEL_PATH + "pong_dueling_ddqn_sp_per_ep400_best.pth", MODEL_PATH + "pong_dueling_ddqn_sp_per.pth"]
+"""Model files (same network) written in turn on watched file."""
+
+DELTA_TIME = 1.0 / 60.0
+"""Delta time of a frame."""
+
+def _write_weights(watched_path, n_writes, write_interval):
+    """Write model files in turn on watched file (non atomically, as tc.save() does), with a corrupted write in between."""
+
+    for i in range(n_writes):
+        sleep(write_interval)
+        if i == n_writes // 2:
+            with open(watched_path, "wb") as watched_file:
+                watched_file.write(b"not a model")
+        else:
+            shutil.copyfile(WEIGHTS_PATHS[i % len(WEIGHTS_PATHS)], watched_path)
+
+def measure_hot_reload(backend=InferenceBackend.NUMPY, n_writes=5, write_interval=1.0, poll_interval=0.1):
+    """Play a real-time match (60 fps) while model file watched by a DQN controller is rewritten, and measure frame times.
+
+    Parameters
+    --------------------
+    backend: InferenceBackend, optional
+        backend of controller
+
+    n_writes: int, optional
+        number of times watched file is written (one of them is a corrupted file)
+
+    write_interval: float, optional
+        time (in seconds) between two writes
+
+    poll_interval: float, optional
+        time (in seconds) between two checks of watched file
+
+    Return
+    --------------------
+    report: dict
+        it contains "n_frames", "max_frame_ms", "p99_frame_ms", "swap_frames" (frames where new weights were swapped in),
+        "n_reloads", "n_failed_loads" and "n_registry_models" (models held by model registry, None on numpy backend)"""
+
+    watched_path = os.path.join(tempfile.mkdtemp(), "watched.pth")
+    shutil.copyfile(WEIGHTS_PATHS[-1], watched_path)
+
+    game = Game()
+    controller_1 = BotController(game.paddle_1, PaddlePosition.LEFT, game)
+    controller_2 = DuelingDDQN_PER_SPController(PaddlePosition.RIGHT, game, backend=backend)
+    controller_2.enable_hot_reload(watched_path, poll_interval)
+    writer = threading.Thread(target=_write_weights, args=(watched_path, n_writes, write_interval))
+
+    frame_times = []
+    swap_frames = []
+    model_watcher = controller_2.model_watcher
+    game.start()
+    writer.start()
+    while writer.is_alive() or len(frame_times) * DELTA_TIME < (n_writes + 1) * write_interval:
+        start_time = perf_counter()
+        n_reloads = model_watcher.n_reloads
+        controller_1.update(DELTA_TIME)
+        controller_2.update(DELTA_TIME)
+        game.update(DELTA_TIME)
+        if game.is_ended():
+            game.reset()
+            game.start()
+        frame_times.append(perf_counter() - start_time)
+
+        if model_watcher.n_reloads > n_reloads:
+            swap_frames.append(len(frame_times) - 1)
+        sleep(max(0.0, DELTA_TIME - frame_times[-1]))
+
+    controller_2.disable_hot_reload()
+    shutil.rmtree(os.path.dirname(watched_path))
+
+    n_registry_models = None
+    if backend == InferenceBackend.TORCH:
+        #PyTorch is imported only by torch backend.
+        from rl.deep_q_networks.common.model_registry import MODEL_REGISTRY
+        n_registry_models = MODEL_REGISTRY.n_models
+
+    return {"n_frames": len(frame_times),
+            "max_frame_ms": 1000 * max(frame_times),
+            "p99_frame_ms": 1000 * np.percentile(frame_times, 99),
+            "swap_frames": swap_frames,
+            "n_reloads": model_watcher.n_reloads,
+            "n_failed_loads": model_watcher.n_failed_loads,
+            "n_registry_models": n_registry_models}
+
+
+if __name__ == "__main__":
+    backend = InferenceBackend[sys.argv[1]] if len(sys.argv) > 1 else InferenceBackend.NUMPY
+
+    n_writes = 5
+    report = measure_hot_reload(backend, n_writes)
+    print("- {} frames: max {:.2f} ms; p99 {:.2f} ms (budget {:.1f} ms)".format(report["n_frames"], report["max_frame_ms"], report["p99_frame_ms"], 1000 * DELTA_TIME))
+    print("- {} reloads swapped in at frames {}; {} failed loads".format(report["n_reloads"], report["swap_frames"], report["n_failed_loads"]))
+    if report["n_registry_models"] is not None:
+        print("- {} models held by model registry".format(report["n_registry_models"]))
+
+    #Single slow frames are scheduling noise (they do not match swap frames), so budget is checked on 99th percentile.
+    #Initial load of watched file and good writes are swapped in, corrupted write is not.
+    #Model registry holds initial model of controller and last version of watched file only.
+    if report["p99_frame_ms"] > 1000 * DELTA_TIME or report["n_reloads"] != n_writes or report["n_failed_loads"] != 1:
+        sys.exit(1)
+    if report["n_registry_models"] is not None and report["n_registry_models"] != 2:
+        sys.exit(1)
\ No newline at end of file
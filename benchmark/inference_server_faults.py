@@ -0,0 +1,151 @@
+import os
+import sys
+import shutil
+import tempfile
+import numpy as np
+
+from functools import partial
+from time import sleep
+from multiprocessing.connection import Client
+
+from rl.common.utils import FULL_OBSERVATION_SIZE
+from rl.common.sp.training_sp_session import MODEL_PATH
+from rl.deep_q_networks.common.numpy_policy import NumpyDQNPolicy
+from rl.deep_q_networks.common.inference_server import InferenceServer, InferenceClient
+from rl.deep_q_networks.dueling_ddqn.sp_per.costants import MODEL_NAME
+
+N_HEALTHY_CLIENTS = 3
+"""Number of clients that only send good requests."""
+
+N_ROUNDS = 20
+"""Number of rounds of requests of healthy clients after each fault."""
+
+RECEIVE_TIMEOUT = 2.0
+"""Maximum time (in seconds) to wait for an answer of server before it is considered dead."""
+
+
+def _expect(expectations, name, is_ok):
+    """Record outcome of an expectation and print it."""
+
+    expectations.append(is_ok)
+    print("- {}: {}".format(name, "ok" if is_ok else "FAILED"))
+
+def _receive(client):
+    """Receive answer of a request, failing if server does not answer in time."""
+
+    if not client.poll(RECEIVE_TIMEOUT):
+        raise TimeoutError("inference server stopped answering")
+
+    return client.receive()
+
+def _answers_healthy_clients(clients, reference, rng):
+    """Check that every healthy client gets action of reference policy for N_ROUNDS rounds of concurrent requests."""
+
+    for _ in range(N_ROUNDS):
+        observations = rng.uniform(-1.0, 1.0, (len(clients), FULL_OBSERVATION_SIZE)).astype(np.float32)
+        for client, observation in zip(clients, observations):
+            client.submit(MODEL_NAME, observation)
+        for client, observation in zip(clients, observations):
+            if _receive(client) != reference.choose_action(observation):
+                return False
+
+    return True
+
+def _receive_error(client):
+    """Receive answer of a request that must fail, and get its error (None if an action is received)."""
+
+    try:
+        _receive(client)
+    except (ValueError, KeyError, RuntimeError) as error:
+        return error
+
+    return None
+
+def check_inference_server_faults(batch_window=0.005, seed=0):
+    """Send malformed requests, bad observations and requests of clients that disconnect mid-batch to an inference
+    server on a Unix socket, checking that it keeps answering other clients after each fault.
+    A NumPy model is served, so the check runs without PyTorch.
+
+    Parameters
+    --------------------
+    batch_window: float, optional
+        batch window of server
+
+    seed: int, optional
+        seed of observations
+
+    Return
+    --------------------
+    expectations: list
+        outcome of each expectation (True if met)"""
+
+    model_path = MODEL_PATH + MODEL_NAME + ".pth"
+    reference = NumpyDQNPolicy.load(model_path)
+    rng = np.random.default_rng(seed)
+
+    address = os.path.join(tempfile.mkdtemp(), "inference.sock")
+    server = InferenceServer({MODEL_NAME: partial(NumpyDQNPolicy.load, model_path)}, address, batch_window)
+    server.start()
+    while not os.path.exists(address):
+        sleep(0.01)
+
+    expectations = []
+    clients = [InferenceClient.connect(address) for _ in range(N_HEALTHY_CLIENTS)]
+    _expect(expectations, "healthy clients answered", _answers_healthy_clients(clients, reference, rng))
+
+    #Malformed request sent in same batch of good requests.
+    raw_connection = Client(address, family="AF_UNIX")
+    raw_connection.send("not a request")
+    for client in clients:
+        client.submit(MODEL_NAME, np.zeros(FULL_OBSERVATION_SIZE, dtype=np.float32))
+    _expect(expectations, "malformed request answered by ValueError", raw_connection.poll(RECEIVE_TIMEOUT) and isinstance(raw_connection.recv(), ValueError))
+    _expect(expectations, "good requests of batch of malformed request answered", all([isinstance(_receive(client), int) for client in clients]))
+    raw_connection.close()
+    _expect(expectations, "healthy clients answered after malformed request", _answers_healthy_clients(clients, reference, rng))
+
+    #Bad observation (wrong size) and unknown model sent in same batch of good requests.
+    faulty_client = InferenceClient.connect(address)
+    for model_name, observation_size, error_type in ((MODEL_NAME, FULL_OBSERVATION_SIZE + 1, RuntimeError), ("unknown", FULL_OBSERVATION_SIZE, KeyError)):
+        faulty_client.submit(model_name, np.zeros(observation_size, dtype=np.float32))
+        observations = rng.uniform(-1.0, 1.0, (len(clients), FULL_OBSERVATION_SIZE)).astype(np.float32)
+        for client, observation in zip(clients, observations):
+            client.submit(MODEL_NAME, observation)
+        _expect(expectations, "{} answered by {}".format("bad observation" if model_name == MODEL_NAME else "unknown model", error_type.__name__),
+                isinstance(_receive_error(faulty_client), error_type))
+        _expect(expectations, "good requests of same batch answered",
+                all([_receive(client) == reference.choose_action(observation) for client, observation in zip(clients, observations)]))
+    faulty_client.close()
+    _expect(expectations, "healthy clients answered after bad observation", _answers_healthy_clients(clients, reference, rng))
+
+    #Clients that disconnect mid-batch, after their request is sent and before it is answered.
+    for _ in range(N_ROUNDS):
+        leaving_client = InferenceClient.connect(address)
+        leaving_client.submit(MODEL_NAME, np.zeros(FULL_OBSERVATION_SIZE, dtype=np.float32))
+        leaving_client.close()
+        for client in clients:
+            client.submit(MODEL_NAME, np.zeros(FULL_OBSERVATION_SIZE, dtype=np.float32))
+        for client in clients:
+            _receive(client)
+    _expect(expectations, "healthy clients answered after clients closed mid-batch", _answers_healthy_clients(clients, reference, rng))
+
+    #Every client that left is dropped by server.
+    sleep(10 * batch_window)
+    _expect(expectations, "clients closed are dropped", _answers_healthy_clients(clients, reference, rng) and server.n_clients == N_HEALTHY_CLIENTS)
+
+    for client in clients:
+        client.close()
+    server.close()
+    shutil.rmtree(os.path.dirname(address), ignore_errors=True)
+
+    return expectations
+
+
+if __name__ == "__main__":
+    try:
+        expectations = check_inference_server_faults()
+    except TimeoutError as error:
+        print("- {}: FAILED".format(error))
+        sys.exit(1)
+
+    if not all(expectations):
+        sys.exit(1)
@@ -0,0 +1,114 @@
+import sys
+import importlib.util
+import numpy as np
+
+from time import perf_counter
+
+from pong.game import Game, spawn_seeds
+from pong.controller.controller import PaddlePosition
+from pong.controller.bot_controller import BotController
+
+from rl.common.utils import get_full_inverse_observation_normalized
+from rl.common.sp.training_sp_session import MODEL_PATH
+from rl.deep_q_networks.common.numpy_policy import NumpyDQNPolicy
+from rl.deep_q_networks.dueling_ddqn.sp_per.costants import MODEL_NAME
+
+
+def played_observations(n_observations, seed):
+    """Get observations of right paddle on seeded matches between BotController on both paddles.
+
+    Parameters
+    --------------------
+    n_observations: int
+        number of observations
+
+    seed: int
+        seed of matches
+
+    Return
+    --------------------
+    observations: list
+        observations recorded"""
+
+    observations = []
+    for game_seed in spawn_seeds(seed, n_observations):
+        game = Game(seed=game_seed)
+        game.start()
+        controller_1 = BotController(game.paddle_1, PaddlePosition.LEFT, game)
+        controller_2 = BotController(game.paddle_2, PaddlePosition.RIGHT, game)
+
+        while len(observations) < n_observations and not game.is_ended():
+            controller_1.update(1.0/60.0)
+            controller_2.update(1.0/60.0)
+            game.update(1.0/60.0)
+            observations.append(get_full_inverse_observation_normalized(game))
+
+        if len(observations) >= n_observations:
+            break
+
+    return observations
+
+def _time_policy(policy, observations):
+    """Get mean time of an inference and actions chosen by a policy."""
+
+    policy.choose_action(observations[0])
+    start_time = perf_counter()
+    actions = [policy.choose_action(observation) for observation in observations]
+
+    return (perf_counter() - start_time) / len(observations), np.array(actions)
+
+def compare_numpy_inference(path=MODEL_PATH + MODEL_NAME + ".pth", n_observations=20000, seed=0):
+    """Compare NumPy backend against PyTorch backend (only if PyTorch is installed) on observations of played matches.
+
+    Parameters
+    --------------------
+    path: str, optional
+        path of .pth file of model
+
+    n_observations: int, optional
+        number of observations evaluated
+
+    seed: int, optional
+        seed of matches
+
+    Return
+    --------------------
+    report: dict
+        it contains "load_ms", "numpy_call_us" and, if PyTorch is installed, "torch_load_ms",
+        "torch_call_us" and "agreement" (fraction of same actions)"""
+
+    observations = played_observations(n_observations, seed)
+
+    start_time = perf_counter()
+    numpy_policy = NumpyDQNPolicy.load(path)
+    report = {"load_ms": 1000 * (perf_counter() - start_time)}
+    report["numpy_call_us"], numpy_actions = _time_policy(numpy_policy, observations)
+    report["numpy_call_us"] *= 1e6
+
+    if importlib.util.find_spec("torch") is not None:
+        from rl.common.utils import FULL_OBSERVATION_SIZE
+        from rl.deep_q_networks.common.model_registry import ModelRegistry
+        from rl.deep_q_networks.common.policy_inference import PolicyInference
+        from rl.deep_q_networks.dueling_ddqn.sp_per.dueling_ddqn import DuelingDDQN
+
+        start_time = perf_counter()
+        torch_policy = PolicyInference(ModelRegistry().get(DuelingDDQN, FULL_OBSERVATION_SIZE, path))
+        report["torch_load_ms"] = 1000 * (perf_counter() - start_time)
+        report["torch_call_us"], torch_actions = _time_policy(torch_policy, observations)
+        report["torch_call_us"] *= 1e6
+        report["agreement"] = float(np.mean(numpy_actions == torch_actions))
+
+    return report
+
+
+if __name__ == "__main__":
+    report = compare_numpy_inference()
+    print("- numpy: load = {:.1f} ms; inference = {:.1f} us".format(report["load_ms"], report["numpy_call_us"]))
+    if "agreement" in report:
+        print("- torch: load = {:.1f} ms; inference = {:.1f} us (numpy x{:.2f}); same actions = {:.4%}".format(
+                report["torch_load_ms"], report["torch_call_us"], report["torch_call_us"] / report["numpy_call_us"], report["agreement"]))
+
+        if report["agreement"] < 0.999:
+            sys.exit(1)
+    else:
+        print("- torch: not installed, comparison skipped")
\ No newline at end of file
@@ -0,0 +1,124 @@
+import numpy as np
+
+from time import perf_counter
+
+from pong.game import Game, spawn_seeds
+from pong.physics_profile import PhysicsProfile
+from pong.controller.controller import PaddlePosition
+from pong.controller.bot_controller import BotController
+from pong.controller.basic_bot_controller import BasicBotController
+
+
+def play_rallies(physics_profile, n_rallies, seed=0, max_ticks=3000, delta_time=1.0/60.0):
+    """Play seeded rallies between BotController (left) and BasicBotController (right).
+    A rally is ended when a point is done or max_ticks are reached.
+
+    Parameters
+    --------------------
+    physics_profile: PhysicsProfile
+        fidelity profile of Box2D step
+
+    n_rallies: int
+        number of rallies to play
+
+    seed: int, optional
+        root seed of rallies
+
+    max_ticks: int, optional
+        maximum number of ticks of a rally
+
+    delta_time: float, optional
+        delta time
+
+    Returns
+    --------------------
+    winners: ndarray
+        paddle (1 or 2) that won each rally, 0 if none did a point
+
+    trajectories: list
+        ball positions of each rally
+
+    update_time: float
+        time spent on Game.update in seconds"""
+
+    game = Game(physics_profile=physics_profile)
+    controller_1 = BotController(game.paddle_1, PaddlePosition.LEFT, game)
+    controller_2 = BasicBotController(game.paddle_2, PaddlePosition.RIGHT, game.ball)
+
+    winners = np.zeros(n_rallies, dtype=np.int64)
+    trajectories = []
+    update_time = 0.0
+    for i, rally_seed in enumerate(spawn_seeds(seed, n_rallies)):
+        game.reset(seed=rally_seed)
+        game.start()
+
+        trajectory = []
+        for _ in range(max_ticks):
+            controller_1.update(delta_time)
+            controller_2.update(delta_time)
+
+            start_time = perf_counter()
+            game.update(delta_time)
+            update_time += perf_counter() - start_time
+
+            if game.score_paddle_1 + game.score_paddle_2 > 0:
+                winners[i] = 1 if game.score_paddle_1 > 0 else 2
+                break
+
+            ball_position = game.ball.position
+            trajectory.append((ball_position.x, ball_position.y))
+
+        trajectories.append(np.array(trajectory, dtype=np.float32).reshape(-1, 2))
+
+    return winners, trajectories, update_time
+
+def compare_profiles(n_rallies=2000, seed=0, max_ticks=3000):
+    """Compare throughput and divergence of each physics profile against EXACT profile.
+
+    Parameters
+    --------------------
+    n_rallies: int, optional
+        number of seeded rallies played by each profile
+
+    seed: int, optional
+        root seed of rallies
+
+    max_ticks: int, optional
+        maximum number of ticks of a rally
+
+    Return
+    --------------------
+    reports: dict
+        report of each profile. It contains "ticks_per_second" of Game.update, "speedup" over EXACT,
+        "same_outcome" and "same_length" (fractions of rallies with same winner and same number of ticks)
+        and "mean_ball_error" (mean of max distance between balls of each rally)"""
+
+    exact_winners, exact_trajectories, exact_time = play_rallies(PhysicsProfile.EXACT, n_rallies, seed, max_ticks)
+    exact_ticks = sum(len(trajectory) + 1 for trajectory in exact_trajectories)
+
+    reports = {}
+    for profile in PhysicsProfile:
+        if profile == PhysicsProfile.EXACT:
+            winners, trajectories, update_time = exact_winners, exact_trajectories, exact_time
+        else:
+            winners, trajectories, update_time = play_rallies(profile, n_rallies, seed, max_ticks)
+
+        n_ticks = sum(len(trajectory) + 1 for trajectory in trajectories)
+        ball_errors = []
+        for trajectory, exact_trajectory in zip(trajectories, exact_trajectories):
+            n_common = min(len(trajectory), len(exact_trajectory))
+            ball_errors.append(np.max(np.linalg.norm(trajectory[:n_common] - exact_trajectory[:n_common], axis=1), initial=0.0))
+
+        reports[profile] = {"ticks_per_second": n_ticks / update_time,
+                            "speedup": (n_ticks / update_time) / (exact_ticks / exact_time),
+                            "same_outcome": np.mean(winners == exact_winners),
+                            "same_length": np.mean([len(a) == len(b) for a, b in zip(trajectories, exact_trajectories)]),
+                            "mean_ball_error": np.mean(ball_errors)}
+
+    return reports
+
+
+if __name__ == "__main__":
+    for profile, report in compare_profiles().items():
+        print("- {}: {:.0f} ticks/s (x{:.2f}); same outcome = {:.1%}; same length = {:.1%}; mean ball error = {:.3f} px".format(
+                profile.name, report["ticks_per_second"], report["speedup"], report["same_outcome"], report["same_length"], report["mean_ball_error"]))
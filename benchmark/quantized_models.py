@@ -0,0 +1,78 @@
+import sys
+import numpy as np
+
+from time import perf_counter
+
+from rl.common.utils import FULL_OBSERVATION_SIZE
+from rl.common.sp.training_sp_session import MODEL_PATH
+from rl.deep_q_networks.common.inference_backend import Quantization
+from rl.deep_q_networks.common.model_registry import ModelRegistry
+from rl.deep_q_networks.common.quantized_models import model_bytes
+from rl.deep_q_networks.common.policy_inference import PolicyInference
+from rl.deep_q_networks.dueling_ddqn.sp_per.costants import MODEL_NAME
+from rl.deep_q_networks.dueling_ddqn.sp_per.dueling_ddqn import DuelingDDQN
+
+from .numpy_inference import played_observations
+
+
+def _time_inference(model, observations):
+    """Get mean time of an inference of an observation and actions chosen."""
+
+    inference = PolicyInference(model)
+    inference.choose_action(observations[0])
+
+    start_time = perf_counter()
+    actions = [inference.choose_action(observation) for observation in observations]
+
+    return (perf_counter() - start_time) / len(observations), np.array(actions)
+
+def compare_quantized_models(path=MODEL_PATH + MODEL_NAME + ".pth", n_observations=20000, seed=0):
+    """Compare float model against its quantized variants on observations recorded from seeded matches:
+    agreement of actions chosen, per-call latency of inference and memory of weights.
+
+    Parameters
+    --------------------
+    path: str, optional
+        path of .pth file of a Dueling DDQN model
+
+    n_observations: int, optional
+        number of observations evaluated
+
+    seed: int, optional
+        seed of matches
+
+    Return
+    --------------------
+    report: dict
+        it contains a dict for each quantization with "bytes", "call_us" and "agreement" (fraction of same actions of float model)"""
+
+    observations = played_observations(n_observations, seed)
+    registry = ModelRegistry()
+
+    report = {}
+    for quantization in Quantization:
+        model = registry.get(DuelingDDQN, FULL_OBSERVATION_SIZE, path, is_compiled=True, quantization=quantization)
+        call_time, actions = _time_inference(model, observations)
+        if quantization == Quantization.NONE:
+            float_actions = actions
+
+        report[quantization] = {"bytes": model_bytes(model),
+                                "call_us": 1e6 * call_time,
+                                "agreement": float(np.mean(actions == float_actions))}
+
+    return report
+
+
+if __name__ == "__main__":
+    min_agreement = float(sys.argv[1]) if len(sys.argv) > 1 else 0.99
+
+    report = compare_quantized_models()
+    float_report = report[Quantization.NONE]
+    for quantization, quantization_report in report.items():
+        print("- {}: weights = {:.1f} KiB (x{:.2f}); inference = {:.1f} us (x{:.2f}); same actions = {:.4%}".format(
+                quantization.name, quantization_report["bytes"] / 2**10, float_report["bytes"] / quantization_report["bytes"],
+                quantization_report["call_us"], float_report["call_us"] / quantization_report["call_us"], quantization_report["agreement"]))
+
+    if any(quantization_report["agreement"] < min_agreement for quantization_report in report.values()):
+        print("Agreement of actions is below {:.2%}".format(min_agreement))
+        sys.exit(1)
\ No newline at end of file
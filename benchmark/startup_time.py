@@ -0,0 +1,76 @@
+import os
+import sys
+import subprocess
+
+_STARTUP_CODE = """
+import sys
+from time import perf_counter
+start_time = perf_counter()
+import pong_app
+import_time = perf_counter() - start_time
+pong = pong_app.Pong(pong_app.ControllerType.{}, pong_app.ControllerType.{}, inference_backend=pong_app.InferenceBackend.{})
+init_time = perf_counter() - start_time - import_time
+print(import_time, init_time, "torch" in sys.modules)
+"""
+
+def measure_startup(controller_1_type="PLAYER", controller_2_type="BOT", inference_backend="TORCH", n_slowest=10):
+    """Measure cold start of pong_app on a fresh interpreter: import of pong_app and creation of Pong.
+
+    Parameters
+    --------------------
+    controller_1_type: str, optional
+        name of ControllerType of left paddle
+
+    controller_2_type: str, optional
+        name of ControllerType of right paddle
+
+    inference_backend: str, optional
+        name of InferenceBackend of DQN controllers
+
+    n_slowest: int, optional
+        number of slowest modules imported by pong_app to report
+
+    Return
+    --------------------
+    report: dict
+        it contains "import_s" (import of pong_app), "init_s" (creation of Pong), "is_torch_imported"
+        and "slowest_imports" (list of (module, cumulative seconds) of modules imported by pong_app, from -X importtime)"""
+
+    env = dict(os.environ, PYTHONPATH=os.getcwd(), SDL_VIDEODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", _STARTUP_CODE.format(controller_1_type, controller_2_type, inference_backend)],
+                            env=env, capture_output=True, text=True, check=True)
+
+    import_time, init_time, is_torch_imported = result.stdout.split()[-3:]
+
+    #Lines of -X importtime are "import time: self [us] | cumulative | imported package", where a nested import
+    #is indented by two spaces per level. Modules imported by pong_app are those one level deep.
+    pong_app_imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        _, cumulative, module = line.split("|")
+        if not cumulative.strip().isdigit() or len(module) - len(module.lstrip()) != 3:
+            continue
+        pong_app_imports.append((module.strip(), int(cumulative) / 1e6))
+
+    return {"import_s": float(import_time),
+            "init_s": float(init_time),
+            "is_torch_imported": is_torch_imported == "True",
+            "slowest_imports": sorted(pong_app_imports, key=lambda entry: entry[1], reverse=True)[:n_slowest]}
+
+
+if __name__ == "__main__":
+    controller_types = sys.argv[1:3] if len(sys.argv) >= 3 else ["PLAYER", "BOT"]
+    inference_backend = sys.argv[3] if len(sys.argv) >= 4 else "TORCH"
+    report = measure_startup(*controller_types, inference_backend)
+
+    print("- {} vs {} ({} backend): import pong_app = {:.0f} ms; Pong() = {:.0f} ms; torch imported = {}".format(
+            controller_types[0], controller_types[1], inference_backend, 1000 * report["import_s"], 1000 * report["init_s"], report["is_torch_imported"]))
+    for module, cumulative_time in report["slowest_imports"]:
+        print("    {:<40} {:7.1f} ms".format(module, 1000 * cumulative_time))
+
+    #A game without DQN controllers or with NumPy backend must not pay import of torch.
+    is_scripted_game = all(not controller_type.startswith(("DDQN", "DUELING")) for controller_type in controller_types)
+    if (is_scripted_game or inference_backend == "NUMPY") and report["is_torch_imported"]:
+        sys.exit(1)
\ No newline at end of file
@@ -0,0 +1,147 @@
+import sys
+import numpy as np
+
+from time import perf_counter
+from pygame.math import Vector2
+
+from pong.game import Game, spawn_seeds
+from pong.ball import Ball
+from pong.controller.controller import PaddlePosition, MovingType
+from pong.controller.bot_controller import BotController
+from pong.controller.basic_bot_controller import BasicBotController
+from pong.controller.vec_bot_strategies import basic_bot_actions, bot_actions
+
+
+def _played_states(n_states, seed):
+    """Get states of seeded matches between BotController on both paddles."""
+
+    states = []
+    for game_seed in spawn_seeds(seed, n_states):
+        game = Game(seed=game_seed)
+        game.start()
+        controller_1 = BotController(game.paddle_1, PaddlePosition.LEFT, game)
+        controller_2 = BotController(game.paddle_2, PaddlePosition.RIGHT, game)
+
+        while len(states) < n_states and not game.is_ended():
+            controller_1.update(1.0/60.0)
+            controller_2.update(1.0/60.0)
+            game.update(1.0/60.0)
+            states.append(game.state.copy())
+
+        if len(states) >= n_states:
+            break
+
+    return np.array(states)
+
+def _random_states(n_states, seed):
+    """Get random states of a game session, including still balls and balls moving along axes."""
+
+    rng = np.random.default_rng(seed)
+    game = Game()
+    states = np.zeros((n_states, 12))
+    for i in range(n_states):
+        angle = rng.choice([rng.uniform(0, 2 * np.pi), 0.0, np.pi/2, np.pi, 3 * np.pi/2])
+        speed = float(rng.choice([0.0, Ball.SPEED_INIT, Ball.SPEED]))
+
+        game.paddle_1.position = Vector2(game.paddle_1.position.x, rng.uniform(game.field.bottom, game.field.top))
+        game.paddle_2.position = Vector2(game.paddle_2.position.x, rng.uniform(game.field.bottom, game.field.top))
+        game.ball.position = Vector2(rng.uniform(game.field.left, game.field.right), rng.uniform(game.field.bottom, game.field.top))
+        game.ball.velocity = speed * Vector2(np.cos(angle), np.sin(angle))
+        states[i] = game.state
+
+    return states
+
+def _scalar_actions(states, controller_factory, position):
+    """Get actions chosen by a scalar controller for each state.
+
+    Parameters
+    --------------------
+    states: ndarray
+        states of a game session
+
+    controller_factory: callable
+        function that creates a controller from a game session and the position of paddle it controls
+
+    position: PaddlePosition
+        position of paddle of controller
+
+    Returns
+    --------------------
+    actions: ndarray
+        actions (MovingType values) chosen
+
+    elapsed_time: float
+        time spent on updates of controller"""
+
+    game = Game()
+    paddle = game.paddle_1 if position == PaddlePosition.LEFT else game.paddle_2
+    controller = controller_factory(game, position)
+    actions = np.zeros(len(states), dtype=np.int64)
+    elapsed_time = 0.0
+    for i, state in enumerate(states):
+        game.paddle_1.position = Vector2(state[0], state[1])
+        game.paddle_2.position = Vector2(state[4], state[5])
+        game.ball.position = Vector2(state[8], state[9])
+        game.ball.velocity = Vector2(state[10], state[11])
+
+        start_time = perf_counter()
+        controller.update(1.0/60.0)
+        elapsed_time += perf_counter() - start_time
+
+        velocity_y = paddle.velocity.y
+        actions[i] = MovingType.UP.value if velocity_y > 0 else (MovingType.DOWN.value if velocity_y < 0 else MovingType.NONE.value)
+
+    return actions, elapsed_time
+
+def check_equivalence(n_states=20000, seed=0):
+    """Compare vectorized strategies of bots against scalar BasicBotController and BotController
+    on played and random states, for both positions of paddle.
+
+    Parameters
+    --------------------
+    n_states: int, optional
+        number of played states and of random states
+
+    seed: int, optional
+        seed of states
+
+    Return
+    --------------------
+    reports: dict
+        report of each (strategy, position). It contains "n_mismatches" and "speedup" of
+        vectorized strategy over scalar controller"""
+
+    states = np.concatenate([_played_states(n_states, seed), _random_states(n_states, seed)])
+    game = Game()
+    size_paddle = (game.paddle_1.width, game.paddle_1.height)
+
+    reports = {}
+    for position in PaddlePosition:
+        paddle_columns, opponent_columns = ([0, 1], [4, 5]) if position == PaddlePosition.LEFT else ([4, 5], [0, 1])
+
+        strategies = {"basic_bot": (lambda a_game, a_position: BasicBotController(a_game.paddle_1 if a_position == PaddlePosition.LEFT else a_game.paddle_2, a_position, a_game.ball),
+                                    lambda: basic_bot_actions(position, states[:, paddle_columns], game.paddle_1.height, states[:, [8, 9]], states[:, [10, 11]])),
+                      "bot": (lambda a_game, a_position: BotController(a_game.paddle_1 if a_position == PaddlePosition.LEFT else a_game.paddle_2, a_position, a_game),
+                              lambda: bot_actions(position, states[:, paddle_columns], states[:, opponent_columns], size_paddle,
+                                                  states[:, [8, 9]], states[:, [10, 11]], game.ball.radius, game.field.top, game.field.bottom))}
+
+        for name, (controller_factory, vec_strategy) in strategies.items():
+            scalar_actions, scalar_time = _scalar_actions(states, controller_factory, position)
+
+            start_time = perf_counter()
+            vec_actions = vec_strategy()
+            vec_time = perf_counter() - start_time
+
+            reports[(name, position)] = {"n_mismatches": int(np.sum(scalar_actions != vec_actions)),
+                                         "speedup": scalar_time / vec_time}
+
+    return reports
+
+
+if __name__ == "__main__":
+    reports = check_equivalence()
+    for (name, position), report in reports.items():
+        print("- {} ({}): mismatches = {}; x{:.0f} faster".format(name, position.name, report["n_mismatches"], report["speedup"]))
+
+    if any(report["n_mismatches"] > 0 for report in reports.values()):
+        sys.exit(1)
\ No newline at end of file
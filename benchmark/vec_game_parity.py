@@ -0,0 +1,298 @@
+import sys
+import numpy as np
+
+from pygame.math import Vector2
+
+from pong.game import Game, PongGameContactListener, ContactEvent, spawn_seeds
+from pong.vec_game import VecGame
+from pong.controller.controller import PaddlePosition, MovingType, PADDLE_VELOCITIES_Y
+from pong.controller.basic_bot_controller import BasicBotController
+
+
+SCORE_GOAL = 3
+"""Score goal of matches played."""
+
+MAX_TICKS = 6000
+"""Maximum number of ticks of a match."""
+
+N_SCENARIO_TICKS = 150
+"""Number of ticks of a contact scenario."""
+
+DELTA_TIME = 1.0 / 60.0
+"""Delta time of an update step."""
+
+MAX_POSITION_ERROR = 1e-2
+"""Maximum difference (in pixels) between positions of a body on Game and VecGame. Box2D works on float32 meters,
+so a time of impact found by a borderline root can move bodies by some thousandths of pixel."""
+
+ACTION_CHANGE_PROBABILITY = 0.05
+"""Probability that a random player changes its action on a tick. Actions are held, so paddles are often pinned against borders of field."""
+
+
+def _bodies_state(game):
+    """Get positions and velocities of ball, paddle 1 and paddle 2 of a game session (rows are bodies, as on VecGame)."""
+
+    states = np.array([game.ball.state[:4], game.paddle_1.state[:4], game.paddle_2.state[:4]], dtype=np.float64)
+
+    return states[:, :2], states[:, 2:]
+
+def _set_bodies_state(vec_game, i, positions, velocities):
+    """Set positions and velocities of ball, paddle 1 and paddle 2 of game i of a VecGame."""
+
+    bodies = ((vec_game.ball_position, vec_game.ball_velocity), (vec_game.paddle_1_position, vec_game.paddle_1_velocity), (vec_game.paddle_2_position, vec_game.paddle_2_velocity))
+    for (body_position, body_velocity), position, velocity in zip(bodies, positions, velocities):
+        body_position[i] = position
+        body_velocity[i] = velocity
+
+def _moving_type(paddle):
+    """Get moving type of a paddle from its velocity."""
+
+    velocity_y = paddle.state[3]
+
+    return MovingType.NONE if velocity_y == 0 else (MovingType.UP if velocity_y > 0 else MovingType.DOWN)
+
+def _play_match(match_seed, rng=None):
+    """Play a match on Game and record it tick by tick.
+
+    Parameters
+    --------------------
+    match_seed: SeedSequence
+        seed of serves of match
+
+    rng: Generator, optional
+        random generator of held actions of both paddles. If it is None, both paddles are controlled by basic bots
+
+    Return
+    --------------------
+    ticks: list
+        initial state, then (actions, is_touch_begun, positions, velocities, scores, is_ended) of each tick.
+        is_touch_begun is True if ball started touching a paddle on that tick"""
+
+    contact_listener = PongGameContactListener()
+    game = Game(score_goal=SCORE_GOAL, contact_listener=contact_listener, seed=match_seed)
+    controllers = (BasicBotController(game.paddle_1, PaddlePosition.LEFT, game.ball), BasicBotController(game.paddle_2, PaddlePosition.RIGHT, game.ball))
+    touches = []
+    contact_listener.subscribe(ContactEvent.BEGIN_TOUCH, touches.append)
+    game.start()
+
+    ticks = [_bodies_state(game)]
+    held_actions = [MovingType.NONE, MovingType.NONE]
+    while len(ticks) <= MAX_TICKS and not game.is_ended():
+        if rng is None:
+            for controller in controllers:
+                controller.update(DELTA_TIME)
+        else:
+            for i, paddle in enumerate((game.paddle_1, game.paddle_2)):
+                if rng.uniform() < ACTION_CHANGE_PROBABILITY:
+                    held_actions[i] = MovingType(int(rng.integers(len(MovingType))))
+                paddle.set_velocity_y(PADDLE_VELOCITIES_Y[held_actions[i]])
+
+        actions = (_moving_type(game.paddle_1).value, _moving_type(game.paddle_2).value)
+        touches.clear()
+        game.update(DELTA_TIME)
+        ticks.append((actions, len(touches) > 0) + _bodies_state(game) + ((game.score_paddle_1, game.score_paddle_2), game.is_ended()))
+
+    return ticks
+
+def _replay_match(match_seed, ticks):
+    """Replay a match recorded on Game with same actions on VecGame and compare them tick by tick.
+    VecGame serves from same seed, so it must follow Game exactly until first paddle contact.
+    A paddle bounce scales a difference of position along paddle by about 10 on ball direction, so state of Game
+    just before each contact is copied on VecGame and outcome of each contact is checked until next one.
+
+    Parameters
+    --------------------
+    match_seed: SeedSequence
+        seed of serves of match
+
+    ticks: list
+        match recorded by _play_match()
+
+    Returns
+    --------------------
+    n_contacts: int
+        number of contacts between ball and paddles
+
+    first_flight_error: float
+        maximum difference of position until first contact
+
+    contact_error: float
+        maximum difference of position after a contact
+
+    mismatch: str
+        first mismatch between Game and VecGame (None if there is none)"""
+
+    vec_game = VecGame(1, score_goal=SCORE_GOAL, seed=match_seed)
+    vec_game.start()
+
+    n_contacts = 0
+    errors = np.zeros(2)
+    state = ticks[0]
+    for tick, (actions, is_touch_begun, positions, velocities, scores, is_ended) in enumerate(ticks[1:]):
+        if is_touch_begun:
+            _set_bodies_state(vec_game, 0, *state)
+            n_contacts += 1
+
+        vec_game.step(np.array([actions]), DELTA_TIME)
+        state = (positions, velocities)
+
+        vec_scores = (int(vec_game.score_paddle_1[0]), int(vec_game.score_paddle_2[0]))
+        if vec_scores != scores or vec_game.is_ended()[0] != is_ended:
+            return n_contacts, errors[0], errors[1], "tick {}: scores {} on VecGame, {} on Game".format(tick, vec_scores, scores)
+
+        vec_positions = np.stack([vec_game.ball_position[0], vec_game.paddle_1_position[0], vec_game.paddle_2_position[0]])
+        error = np.max(np.abs(vec_positions - positions))
+        errors[min(n_contacts, 1)] = max(errors[min(n_contacts, 1)], error)
+        if error > MAX_POSITION_ERROR:
+            return n_contacts, errors[0], errors[1], "tick {}: position error {:.4f} px after {} contacts".format(tick, error, n_contacts)
+
+    return n_contacts, errors[0], errors[1], None
+
+def _contact_scenarios(n_scenarios, rng):
+    """Get scenarios where ball flies towards an edge of right paddle, which holds an action.
+    Paddle is often pinned against top or bottom border of field.
+
+    Parameters
+    --------------------
+    n_scenarios: int
+        number of scenarios
+
+    rng: Generator
+        random generator of scenarios
+
+    Return
+    --------------------
+    scenarios: list
+        scenarios, as (paddle position y, ball position, ball velocity, action of right paddle)"""
+
+    #A paddle pinned against a border rests at y = ±174.25. Ball is aimed within 4 pixels of the position y
+    #where it would graze top or bottom edge of paddle (30 pixels away from its center) after flying 82.5 pixels.
+    scenarios = []
+    for _ in range(n_scenarios):
+        paddle_y = float(rng.choice([0.0, 174.25, -174.25, rng.uniform(-170.0, 170.0)]))
+        edge_y = paddle_y + rng.choice([1.0, -1.0]) * (30.0 + rng.uniform(-4.0, 4.0))
+        velocity = Vector2(float(rng.choice([300.0, 450.0, 600.0])), float(rng.uniform(-300.0, 300.0)))
+        ball_y = float(np.clip(edge_y - velocity.y * 82.5 / velocity.x, -190.0, 190.0))
+        scenarios.append((paddle_y, Vector2(250.0, ball_y), velocity, MovingType(int(rng.integers(len(MovingType))))))
+
+    return scenarios
+
+def _check_scenarios(scenarios):
+    """Play contact scenarios on Game and all at once on one VecGame, and compare them tick by tick until first point of each one.
+    As on matches, state of Game just before each contact is copied on VecGame.
+
+    Parameter
+    --------------------
+    scenarios: list
+        scenarios got by _contact_scenarios()
+
+    Returns
+    --------------------
+    error: float
+        maximum difference of position
+
+    mismatches: list
+        first mismatch of each scenario that has one"""
+
+    games = []
+    touches = []
+    vec_game = VecGame(len(scenarios))
+    vec_game.start()
+    for i, (paddle_y, ball_position, ball_velocity, _) in enumerate(scenarios):
+        contact_listener = PongGameContactListener()
+        contact_listener.subscribe(ContactEvent.BEGIN_TOUCH, lambda paddle, i=i: touches.append(i))
+        game = Game(contact_listener=contact_listener)
+        game.start()
+        game.paddle_2.position = Vector2(game.paddle_2.position.x, paddle_y)
+        game.ball.position = ball_position
+        game.ball.velocity = ball_velocity
+        _set_bodies_state(vec_game, i, *_bodies_state(game))
+        games.append(game)
+
+    actions = np.array([(MovingType.NONE.value, action.value) for _, _, _, action in scenarios])
+    is_playing = np.ones(len(scenarios), dtype=bool)
+    max_error = 0.0
+    mismatches = []
+    for tick in range(N_SCENARIO_TICKS):
+        states = [_bodies_state(game) for game in games]
+        touches.clear()
+        for game, (_, _, _, action) in zip(games, scenarios):
+            game.paddle_1.set_velocity_y(PADDLE_VELOCITIES_Y[MovingType.NONE])
+            game.paddle_2.set_velocity_y(PADDLE_VELOCITIES_Y[action])
+            game.update(DELTA_TIME)
+
+        for i in set(touches):
+            _set_bodies_state(vec_game, i, *states[i])
+        vec_game.step(actions, DELTA_TIME)
+
+        for i in np.flatnonzero(is_playing):
+            scores = (games[i].score_paddle_1, games[i].score_paddle_2)
+            vec_scores = (int(vec_game.score_paddle_1[i]), int(vec_game.score_paddle_2[i]))
+            positions, _ = _bodies_state(games[i])
+            error = np.max(np.abs(np.stack([vec_game.ball_position[i], vec_game.paddle_1_position[i], vec_game.paddle_2_position[i]]) - positions))
+
+            #Serves are not compared: each game of VecGame draws its own ones.
+            if vec_scores != scores:
+                mismatches.append("scenario {} tick {}: scores {} on VecGame, {} on Game".format(i, tick, vec_scores, scores))
+            elif scores == (0, 0):
+                max_error = max(max_error, error)
+                if error <= MAX_POSITION_ERROR:
+                    continue
+                mismatches.append("scenario {} tick {}: position error {:.4f} px".format(i, tick, error))
+            is_playing[i] = False
+
+    return max_error, mismatches
+
+def check_parity(n_matches=12, n_scenarios=500, seed=0):
+    """Play same matches and contact scenarios on Game (Box2D) and VecGame and compare them event by event.
+
+    Matches are played until score goal by basic bots or by random players that hold their actions,
+    so they go through serves, points, resets and paddles pinned against borders of field.
+    Contact scenarios make the ball graze an edge of a moving or pinned paddle.
+
+    Parameters
+    --------------------
+    n_matches: int, optional
+        number of matches of each kind of player
+
+    n_scenarios: int, optional
+        number of contact scenarios
+
+    seed: int, optional
+        root seed of matches and scenarios
+
+    Return
+    --------------------
+    report: dict
+        it contains "n_contacts" (contacts between ball and paddles of matches), "first_flight_error" (maximum difference
+        of position before first contact of a match), "contact_error" (maximum difference of position after a contact),
+        "scenario_error" (maximum difference of position of scenarios) and "mismatches" (descriptions of mismatches)"""
+
+    rng = np.random.default_rng(seed)
+    report = {"n_contacts": 0, "first_flight_error": 0.0, "contact_error": 0.0, "mismatches": []}
+
+    for is_random in (False, True):
+        for i, match_seed in enumerate(spawn_seeds(seed, n_matches)):
+            n_contacts, first_flight_error, contact_error, mismatch = _replay_match(match_seed, _play_match(match_seed, rng if is_random else None))
+            report["n_contacts"] += n_contacts
+            report["first_flight_error"] = max(report["first_flight_error"], first_flight_error)
+            report["contact_error"] = max(report["contact_error"], contact_error)
+            if mismatch is not None:
+                report["mismatches"].append("{} match {} {}".format("random" if is_random else "bots", i, mismatch))
+
+    report["scenario_error"], mismatches = _check_scenarios(_contact_scenarios(n_scenarios, rng))
+    report["mismatches"] += mismatches
+
+    return report
+
+
+if __name__ == "__main__":
+    report = check_parity()
+    print("- {} paddle contacts: max error before first contact = {:.4f} px; max error after a contact = {:.4f} px; max error of contact scenarios = {:.4f} px".format(
+            report["n_contacts"], report["first_flight_error"], report["contact_error"], report["scenario_error"]))
+    for mismatch in report["mismatches"]:
+        print("- {}".format(mismatch))
+
+    #Matches and scenarios are seeded, so any mismatch means a change of rules of VecGame or Game.
+    if len(report["mismatches"]) > 0:
+        sys.exit(1)
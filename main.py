@@ -1,5 +1,8 @@
 from pong_app import Pong, ControllerType
+from rl.deep_q_networks.common.inference_backend import InferenceBackend
+
+INFERENCE_BACKEND = InferenceBackend.TORCH          #InferenceBackend.NUMPY plays DQN bots without PyTorch.
 
 if __name__ == "__main__":
-    game = Pong(controller_1_type=ControllerType.PLAYER, controller_2_type=ControllerType.DUELING_DDQN_PER_SP_BOT)
+    game = Pong(controller_1_type=ControllerType.PLAYER, controller_2_type=ControllerType.DUELING_DDQN_PER_SP_BOT, inference_backend=INFERENCE_BACKEND)
     game.run()
\ No newline at end of file
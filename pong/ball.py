@@ -1,7 +1,9 @@
+import numpy as np
+
 from pygame.math import Vector2
 from Box2D import b2Vec2, b2PolygonShape
 
-from .constants import PPM
+from .constants import PPM, TAG_BALL
 
 class Ball:
     """A ball of Pong."""
@@ -9,7 +11,7 @@ class Ball:
     SPEED = 600
     SPEED_INIT = 300
 
-    def __init__(self, position, radius, world_physics):
+    def __init__(self, position, radius, world_physics, tag=TAG_BALL, state=None):
         """Create new ball.
         
         Parameters
@@ -21,7 +23,13 @@ class Ball:
             radius of ball
             
         world_physics: b2World
-            world hub physics of Box2D"""        
+            world hub physics of Box2D
+            
+        tag: int, optional
+            fixture tag of ball
+
+        state: ndarray, optional
+            array of 4 floats where state (x, y, vel_x, vel_y) of ball is cached. If it is None, a new one is allocated"""        
 
         self._radius = radius
         self._rigid_body = world_physics.CreateDynamicBody(position=(position.x / PPM, position.y / PPM),
@@ -35,11 +43,15 @@ class Ball:
         self._rigid_body.mass = 10**-4
 
         self._rigid_body.userData = self
-        self._fixture.userData = self
+        self._fixture.userData = tag
+
+        self._state = state if state is not None else np.zeros(4)
+        self._flight_id = 0             #Id of current straight flight of ball.
+        self.refresh_state()
 
     @property
     def position(self):
-        return PPM * Vector2(self._rigid_body.position.x, self._rigid_body.position.y)
+        return Vector2(self._state[0], self._state[1])
     
     @position.setter
     def position(self, new_pos):
@@ -47,10 +59,12 @@ class Ball:
             raise TypeError("expected Vector2 for position")
         
         self._rigid_body.position = b2Vec2(new_pos.x, new_pos.y) / PPM
+        self.refresh_state()
+        self._flight_id += 1
 
     @property
     def velocity(self):
-        return PPM * Vector2(self._rigid_body.linearVelocity.x, self._rigid_body.linearVelocity.y)
+        return Vector2(self._state[2], self._state[3])
     
     @velocity.setter
     def velocity(self, new_vel):
@@ -58,6 +72,32 @@ class Ball:
             raise TypeError("expected Vector2 for velocity")
         
         self._rigid_body.linearVelocity = b2Vec2(new_vel.x, new_vel.y) / PPM
+        self.refresh_state()
+        self._flight_id += 1
+
+    def refresh_state(self):
+        """Cache position and velocity of rigid body. It is called once after each step of world physics."""
+
+        position = self._rigid_body.position
+        velocity = self._rigid_body.linearVelocity
+        self._state[0] = PPM * position.x
+        self._state[1] = PPM * position.y
+        self._state[2] = PPM * velocity.x
+        self._state[3] = PPM * velocity.y
+
+    def begin_flight(self):
+        """Mark that ball may leave its straight flight (e.g. it is teleported or it touches something),
+        so plans computed on previous flight are no longer valid. Setters of position and velocity call it."""
+
+        self._flight_id += 1
+
+    @property
+    def flight_id(self):
+        return self._flight_id
+
+    @property
+    def state(self):
+        return self._state
 
     @property
     def rigid_body(self):
@@ -1,2 +1,54 @@
 PPM = 50    
-"""Pixel per meter. Useful for Box2D."""
\ No newline at end of file
+"""Pixel per meter. Useful for Box2D."""
+
+LINEAR_SLOP = 0.005 * PPM
+"""Box2D linear slop (b2_linearSlop) in pixels."""
+
+POLYGON_RADIUS = 2 * LINEAR_SLOP
+"""Box2D skin radius of polygons (b2_polygonRadius) in pixels."""
+
+VELOCITY_THRESHOLD = 1.0 * PPM
+"""Box2D velocity threshold of restitution (b2_velocityThreshold) in pixels per second. Slower contacts are inelastic."""
+
+MAX_LINEAR_CORRECTION = 0.2 * PPM
+"""Box2D maximum position correction of a contact (b2_maxLinearCorrection) in pixels."""
+
+BAUMGARTE = 0.2
+"""Box2D fraction of overlap of a contact solved by a position iteration (b2_baumgarte)."""
+
+TOI_BAUMGARTE = 0.75
+"""Box2D fraction of overlap of a contact solved by a position iteration at a time of impact (b2_toiBaumgarte)."""
+
+MAX_SUB_STEPS = 8
+"""Box2D maximum number of times of impact of a contact in a step (b2_maxSubSteps)."""
+
+# ==================================================
+# ================= FIXTURE TAGS ===================
+# ==================================================
+# Integer tags stored on userData of fixtures. Each tag is a different bit,
+# so a contact between two fixtures is identified by tag_a | tag_b.
+# Bits from ARENA_TAG_SHIFT onwards store index of arena that hosts fixture.
+
+TAG_BALL = 1
+"""Tag of ball fixture."""
+
+TAG_PADDLE_1 = 2
+"""Tag of left paddle fixture."""
+
+TAG_PADDLE_2 = 4
+"""Tag of right paddle fixture."""
+
+TAG_BORDER = 8
+"""Tag of top and bottom border fixtures of field."""
+
+TAG_GOAL_LEFT = 16
+"""Tag of left border fixture of field."""
+
+TAG_GOAL_RIGHT = 32
+"""Tag of right border fixture of field."""
+
+TAG_KIND_MASK = 63
+"""Mask of bits of a tag that identify kind of fixture."""
+
+ARENA_TAG_SHIFT = 6
+"""Shift of arena index stored on a tag."""
\ No newline at end of file
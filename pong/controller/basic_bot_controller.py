@@ -21,11 +21,14 @@ class BasicBotController(Controller):
         self._ball = ball
 
     def update(self, delta_time):
+        _, paddle_y, _, _ = self._paddle.state.tolist()
+        _, ball_y, ball_vel_x, _ = self._ball.state.tolist()
+
         #Is ball moving towards to me?
-        if (self._ball.velocity.x > 0.0 and self._position == PaddlePosition.RIGHT) or (self._ball.velocity.x < 0.0 and self._position == PaddlePosition.LEFT):
-            if self._ball.position.y < self._paddle.position.y - self._paddle.height/2:
+        if (ball_vel_x > 0.0 and self._position == PaddlePosition.RIGHT) or (ball_vel_x < 0.0 and self._position == PaddlePosition.LEFT):
+            if ball_y < paddle_y - self._paddle.height/2:
                 self._move_paddle(MovingType.DOWN)
-            elif self._ball.position.y > self._paddle.position.y + self._paddle.height/2:
+            elif ball_y > paddle_y + self._paddle.height/2:
                 self._move_paddle(MovingType.UP)
             else:
                 self._move_paddle(MovingType.NONE)
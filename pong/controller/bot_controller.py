@@ -23,78 +23,95 @@ class BotController(Controller):
         self._opponent_paddle = current_game.paddle_1 if position == PaddlePosition.RIGHT else current_game.paddle_2
         self._ball = current_game.ball
         self._field = current_game.field
+        self._plan = None               #Intercept plan (flight id of ball, ball vel_x, ball vel_y, is border hit first, y of ball at my paddle).
 
-    def _follow_ball(self):
-        """Follow the ball."""
+    def _plan_intercept(self, flight_id, ball_x, ball_y, ball_vel_x, ball_vel_y, paddle_x):
+        """Plan how to intercept the ball moving towards me. Plan does not change while ball moves on a straight line.
+        
+        Parameters
+        --------------------
+        flight_id: int
+            id of current straight flight of ball
+
+        ball_x, ball_y: float
+            position of ball
+
+        ball_vel_x, ball_vel_y: float
+            velocity of ball
 
-        if self._ball.position.y < self._paddle.position.y - self._paddle.height/2:
-            self._move_paddle(MovingType.DOWN)
-        elif self._ball.position.y > self._paddle.position.y + self._paddle.height/2:
-            self._move_paddle(MovingType.UP)
+        paddle_x: float
+            position x of my paddle"""
+
+        #Calculate time of impact between ball and a border of field.
+        if ball_vel_y > 0.0:
+            distance_bf = self._field.top - (ball_y + self._ball.radius/2)
+        elif ball_vel_y < 0.0:
+            distance_bf = (ball_y - self._ball.radius/2) - self._field.bottom
         else:
-            self._move_paddle(MovingType.NONE)
+            distance_bf = np.inf
+        t_impact_bf = distance_bf / abs(ball_vel_y) if ball_vel_y != 0 else np.inf
+
+        #Calculate time of impact between ball and paddle towards x-axis.
+        if self._position == PaddlePosition.RIGHT:      #Right paddle is mine.
+            distance_bp = (paddle_x - self._paddle.width/2) - (ball_x + self._ball.radius/2)
+        else:                                           #Left paddle is mine.
+            distance_bp = (ball_x - self._ball.radius/2) - (paddle_x + self._paddle.width/2)
+        t_impact_bp = distance_bp / abs(ball_vel_x) if ball_vel_x != 0 else 0.0
+
+        #Does ball collides border of field before a paddle? Otherwise, where does ball reach my paddle?
+        is_border_first = t_impact_bf != np.inf and t_impact_bf <= t_impact_bp
+        delta_y_impact_bp = abs(ball_vel_y) * t_impact_bp
+        y_ball_dest = ball_y + delta_y_impact_bp if ball_vel_y > 0.0 else ball_y - delta_y_impact_bp
+
+        self._plan = (flight_id, ball_vel_x, ball_vel_y, is_border_first, y_ball_dest)
 
     def update(self, delta_time):
+        paddle_x, paddle_y, _, _ = self._paddle.state.tolist()
+        ball_x, ball_y, ball_vel_x, ball_vel_y = self._ball.state.tolist()
+
         #Is ball moving towards to me?
-        if (self._ball.velocity.x > 0.0 and self._position == PaddlePosition.RIGHT) or (self._ball.velocity.x < 0.0 and self._position == PaddlePosition.LEFT):
-            #Calculate time of impact between ball and a border of field.
-            if self._ball.velocity.y > 0.0:
-                distance_bf = (self._field.center_position.y + self._field.height/2) - (self._ball.position.y + self._ball.radius/2)
-            elif self._ball.velocity.y < 0.0:
-                distance_bf = (self._ball.position.y - self._ball.radius/2) - (self._field.center_position.y - self._field.height/2)
-            else:
-                distance_bf = np.inf
-            t_impact_bf = distance_bf / abs(self._ball.velocity.y) if self._ball.velocity.y != 0 else np.inf
+        if (ball_vel_x > 0.0 and self._position == PaddlePosition.RIGHT) or (ball_vel_x < 0.0 and self._position == PaddlePosition.LEFT):
+            #Straight flight of ball ends on contacts, resets, restores and teleports, so plan is done again only then.
+            flight_id = self._ball.flight_id
+            if self._plan is None or self._plan[0] != flight_id or self._plan[1] != ball_vel_x or self._plan[2] != ball_vel_y:
+                self._plan_intercept(flight_id, ball_x, ball_y, ball_vel_x, ball_vel_y, paddle_x)
+            _, _, _, is_border_first, y_ball_dest = self._plan
 
-            #Calculate time of impact between ball and paddle towards x-axis.
-            if self._position == PaddlePosition.RIGHT:      #Right paddle is mine.
-                distance_bp = (self._paddle.position.x - self._paddle.width/2) - (self._ball.position.x + self._ball.radius/2)
-            else:                                           #Left paddle is mine.
-                distance_bp = (self._ball.position.x - self._ball.radius/2) - (self._paddle.position.x + self._paddle.width/2)
-            t_impact_bp = distance_bp / abs(self._ball.velocity.x) if self._ball.velocity.x != 0 else 0.0
-        
             #Does ball collides border of field before a paddle?
-            if t_impact_bf != np.inf and t_impact_bf <= t_impact_bp:
-                self._follow_ball()
-            #Ball goes directly towards to paddle.
-            else:
-                delta_y_impact_bp = abs(self._ball.velocity.y) * t_impact_bp
-
-                #Move paddle towards up to collide ball.
-                if self._ball.velocity.y > 0.0 and self._paddle.position.y + self._paddle.height/2 < self._ball.position.y + delta_y_impact_bp:
+            if is_border_first:
+                self._follow_ball(ball_y, paddle_y)
+            #Move paddle towards up to collide ball.
+            elif ball_vel_y > 0.0 and paddle_y + self._paddle.height/2 < y_ball_dest:
+                self._move_paddle(MovingType.UP)
+            #Move paddle towards down to collide ball.
+            elif ball_vel_y < 0.0 and paddle_y - self._paddle.height/2 > y_ball_dest:
+                self._move_paddle(MovingType.DOWN)
+            #Try suprpriding opponent if he has position y further than me to get one point.
+            elif abs(paddle_y - self._opponent_paddle.state.item(1)) >= 150.0:
+                #Will my paddle and ball roughly be same y value?
+                if abs(paddle_y - y_ball_dest) <= 2 * self._ball.radius:
+                    self._move_paddle(MovingType.NONE)
+                #Will my paddle be below than ball?
+                elif paddle_y < y_ball_dest:
                     self._move_paddle(MovingType.UP)
-                #Move paddle towards down to collide ball.
-                elif self._ball.velocity.y < 0.0 and self._paddle.position.y - self._paddle.height/2 > self._ball.position.y - delta_y_impact_bp:
+                #Will my paddle be above than ball?
+                elif paddle_y > y_ball_dest:
                     self._move_paddle(MovingType.DOWN)
                 else:
-                    y_ball_dest = self._ball.position.y + delta_y_impact_bp if self._ball.velocity.y > 0.0 else self._ball.position.y - delta_y_impact_bp
-                    
-                    #Try suprpriding opponent if he has position y further than me to get one point.
-                    if abs(self._paddle.position.y - self._opponent_paddle.position.y) >= 150.0:
-                        #Will my paddle and ball roughly be same y value?
-                        if abs(self._paddle.position.y - y_ball_dest) <= 2 * self._ball.radius:
-                            self._move_paddle(MovingType.NONE)
-                        #Will my paddle be below than ball?
-                        elif self._paddle.position.y < y_ball_dest:
-                            self._move_paddle(MovingType.UP)
-                        #Will my paddle be above than ball?
-                        elif self._paddle.position.y > y_ball_dest:
-                            self._move_paddle(MovingType.DOWN)
-                        else:
-                            self._move_paddle(MovingType.NONE)
-                    #Try colliding ball on (either top or bottom) corner of paddle.
-                    elif abs(self._ball.position.x - self._paddle.position.x) <= 3 * self._ball.radius:
-                        #Top corner of paddle is collided if final position y of ball is top.
-                        if self._paddle.position.y < y_ball_dest:
-                            self._move_paddle(MovingType.DOWN)
-                        #Bottom corner of paddle is collided if final position y of ball is bottom.
-                        elif self._paddle.position.y > y_ball_dest:
-                            self._move_paddle(MovingType.UP)
-                        else:
-                            self._move_paddle(MovingType.NONE)
-                    #Follow simply ball.
-                    else:
-                        self._follow_ball()
+                    self._move_paddle(MovingType.NONE)
+            #Try colliding ball on (either top or bottom) corner of paddle.
+            elif abs(ball_x - paddle_x) <= 3 * self._ball.radius:
+                #Top corner of paddle is collided if final position y of ball is top.
+                if paddle_y < y_ball_dest:
+                    self._move_paddle(MovingType.DOWN)
+                #Bottom corner of paddle is collided if final position y of ball is bottom.
+                elif paddle_y > y_ball_dest:
+                    self._move_paddle(MovingType.UP)
+                else:
+                    self._move_paddle(MovingType.NONE)
+            #Follow simply ball.
+            else:
+                self._follow_ball(ball_y, paddle_y)
         #Ball is moving towards to opponent's paddle.
         else:
-            self._follow_ball()
\ No newline at end of file
+            self._follow_ball(ball_y, paddle_y)
\ No newline at end of file
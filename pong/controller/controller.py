@@ -1,8 +1,6 @@
 from abc import ABC, abstractmethod
 from enum import Enum
 
-from pygame.math import Vector2
-
 from ..paddle import Paddle
 
 class MovingType(Enum):
@@ -12,6 +10,11 @@ class MovingType(Enum):
     DOWN = 2            #Paddle is moved towards down.
 
 
+PADDLE_VELOCITIES_Y = {MovingType.NONE: 0.0,                #Paddle velocity y for each moving type.
+                       MovingType.UP: float(Paddle.SPEED),
+                       MovingType.DOWN: -float(Paddle.SPEED)}
+
+
 class PaddlePosition(Enum):
     """Position of paddle that player controls"""
     LEFT = 0        #Player controls left paddle.
@@ -46,12 +49,25 @@ class Controller(ABC):
         
         pass
 
+    def _follow_ball(self, ball_y, paddle_y):
+        """Follow the ball.
+        
+        Parameters
+        --------------------
+        ball_y: float
+            position y of ball
+
+        paddle_y: float
+            position y of my paddle"""
+
+        if ball_y < paddle_y - self._paddle.height/2:
+            self._move_paddle(MovingType.DOWN)
+        elif ball_y > paddle_y + self._paddle.height/2:
+            self._move_paddle(MovingType.UP)
+        else:
+            self._move_paddle(MovingType.NONE)
+
     def _move_paddle(self, moving_type):
         """Move paddle."""
 
-        if moving_type == MovingType.NONE:
-            self._paddle.velocity = Vector2(0.0, 0.0)
-        elif moving_type == MovingType.UP:
-            self._paddle.velocity = Vector2(0.0, Paddle.SPEED)
-        elif moving_type == MovingType.DOWN:
-            self._paddle.velocity = Vector2(0.0, -Paddle.SPEED)
\ No newline at end of file
+        self._paddle.set_velocity_y(PADDLE_VELOCITIES_Y[moving_type])
\ No newline at end of file
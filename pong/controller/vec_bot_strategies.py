@@ -0,0 +1,135 @@
+import numpy as np
+
+from .controller import MovingType, PaddlePosition
+
+def _follow_ball_actions(paddle_y, paddle_height, ball_y):
+    """Get actions to follow the ball (same of BotController._follow_ball)."""
+
+    return np.select([ball_y < paddle_y - paddle_height/2, ball_y > paddle_y + paddle_height/2],
+                     [MovingType.DOWN.value, MovingType.UP.value],
+                     MovingType.NONE.value)
+
+def _is_ball_moving_towards(position, ball_vel_x):
+    """Check which balls move towards paddles placed on a position."""
+
+    return ball_vel_x > 0.0 if position == PaddlePosition.RIGHT else ball_vel_x < 0.0
+
+def basic_bot_actions(position, paddle_position, paddle_height, ball_position, ball_velocity):
+    """Get actions chosen by strategy of BasicBotController for many games at once.
+
+    Parameters
+    --------------------
+    position: PaddlePosition
+        position of paddles that bots control
+
+    paddle_position: ndarray
+        positions of paddles, with shape (n_games, 2)
+
+    paddle_height: float
+        height of paddles
+
+    ball_position: ndarray
+        positions of balls, with shape (n_games, 2)
+
+    ball_velocity: ndarray
+        velocities of balls, with shape (n_games, 2)
+
+    Return
+    --------------------
+    actions: ndarray
+        actions (MovingType values) of paddles"""
+
+    actions = _follow_ball_actions(paddle_position[:, 1], paddle_height, ball_position[:, 1])
+
+    return np.where(_is_ball_moving_towards(position, ball_velocity[:, 0]), actions, MovingType.NONE.value)
+
+def bot_actions(position, paddle_position, opponent_paddle_position, paddle_size, ball_position, ball_velocity, ball_radius, top_field, bottom_field):
+    """Get actions chosen by strategy of BotController for many games at once.
+
+    Parameters
+    --------------------
+    position: PaddlePosition
+        position of paddles that bots control
+
+    paddle_position: ndarray
+        positions of paddles, with shape (n_games, 2)
+
+    opponent_paddle_position: ndarray
+        positions of opponent paddles, with shape (n_games, 2)
+
+    paddle_size: tuple
+        size of paddles. It is represented as (wp, hp) where wp is width of paddle and
+        hp is height of paddle
+
+    ball_position: ndarray
+        positions of balls, with shape (n_games, 2)
+
+    ball_velocity: ndarray
+        velocities of balls, with shape (n_games, 2)
+
+    ball_radius: float
+        radius of balls
+
+    top_field: float
+        position y of top border of field
+
+    bottom_field: float
+        position y of bottom border of field
+
+    Return
+    --------------------
+    actions: ndarray
+        actions (MovingType values) of paddles"""
+
+    paddle_width, paddle_height = paddle_size
+    paddle_x = paddle_position[:, 0]
+    paddle_y = paddle_position[:, 1]
+    ball_x = ball_position[:, 0]
+    ball_y = ball_position[:, 1]
+    ball_vel_x = ball_velocity[:, 0]
+    ball_vel_y = ball_velocity[:, 1]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        #Calculate time of impact between ball and a border of field.
+        distance_bf = np.where(ball_vel_y > 0.0, top_field - (ball_y + ball_radius/2), (ball_y - ball_radius/2) - bottom_field)
+        t_impact_bf = np.where(ball_vel_y != 0, distance_bf / np.abs(ball_vel_y), np.inf)
+
+        #Calculate time of impact between ball and paddle towards x-axis.
+        if position == PaddlePosition.RIGHT:
+            distance_bp = (paddle_x - paddle_width/2) - (ball_x + ball_radius/2)
+        else:
+            distance_bp = (ball_x - ball_radius/2) - (paddle_x + paddle_width/2)
+        t_impact_bp = np.where(ball_vel_x != 0, distance_bp / np.abs(ball_vel_x), 0.0)
+
+    delta_y_impact_bp = np.abs(ball_vel_y) * t_impact_bp
+    y_ball_dest = np.where(ball_vel_y > 0.0, ball_y + delta_y_impact_bp, ball_y - delta_y_impact_bp)
+    follow_ball_actions = _follow_ball_actions(paddle_y, paddle_height, ball_y)
+
+    #Try suprpriding opponent if it has position y further than me to get one point.
+    surprise_actions = np.select([np.abs(paddle_y - y_ball_dest) <= 2 * ball_radius, paddle_y < y_ball_dest, paddle_y > y_ball_dest],
+                                 [MovingType.NONE.value, MovingType.UP.value, MovingType.DOWN.value],
+                                 MovingType.NONE.value)
+
+    #Try colliding ball on (either top or bottom) corner of paddle.
+    corner_actions = np.select([paddle_y < y_ball_dest, paddle_y > y_ball_dest],
+                               [MovingType.DOWN.value, MovingType.UP.value],
+                               MovingType.NONE.value)
+
+    #Same branches of BotController.update, in same order.
+    is_moving_towards = _is_ball_moving_towards(position, ball_vel_x)
+    is_border_first = is_moving_towards & (t_impact_bf != np.inf) & (t_impact_bf <= t_impact_bp)
+    is_intercepting = is_moving_towards & ~is_border_first
+
+    return np.select([~is_moving_towards,
+                      is_border_first,
+                      is_intercepting & (ball_vel_y > 0.0) & (paddle_y + paddle_height/2 < ball_y + delta_y_impact_bp),
+                      is_intercepting & (ball_vel_y < 0.0) & (paddle_y - paddle_height/2 > ball_y - delta_y_impact_bp),
+                      is_intercepting & (np.abs(paddle_y - opponent_paddle_position[:, 1]) >= 150.0),
+                      is_intercepting & (np.abs(ball_x - paddle_x) <= 3 * ball_radius)],
+                     [follow_ball_actions,
+                      follow_ball_actions,
+                      MovingType.UP.value,
+                      MovingType.DOWN.value,
+                      surprise_actions,
+                      corner_actions],
+                     follow_ball_actions)
\ No newline at end of file
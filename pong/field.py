@@ -1,12 +1,12 @@
 from pygame.math import Vector2
 from Box2D import b2Vec2, b2FixtureDef, b2EdgeShape
 
-from .constants import PPM
+from .constants import PPM, TAG_BORDER, TAG_GOAL_LEFT, TAG_GOAL_RIGHT
 
 class Field:
     """A playing field of Pong."""
 
-    def __init__(self, center_position, width, height, world_physics):
+    def __init__(self, center_position, width, height, world_physics, arena_tag=0):
         """Create new playing field.
         
         Parameters
@@ -21,12 +21,21 @@ class Field:
             height of playing field
             
         world_physics: b2World
-            world hub physics of Box2D"""
+            world hub physics of Box2D
+            
+        arena_tag: int, optional
+            arena bits added to fixture tags of borders"""
         
         self._center_position = center_position
         self._width = width
         self._height = height
         self._bodies = []
+
+        #Limits of field, computed once since field never moves.
+        self._left = center_position.x - width/2
+        self._right = center_position.x + width/2
+        self._top = center_position.y + height/2
+        self._bottom = center_position.y - height/2
         
         width_fixture_def = b2FixtureDef()
         width_fixture_def.shape = b2EdgeShape(vertices=[(-0.5 * width / PPM, 0), (0.5 * width / PPM, 0)])
@@ -50,10 +59,10 @@ class Field:
         #Right border of field.
         self._bodies.append( world_physics.CreateStaticBody(fixtures=height_fixture_def, position=b2Vec2(center_position.x + width/2, center_position.y) / PPM) )
 
-        for body in self._bodies:
+        for body, tag in zip(self._bodies, (TAG_BORDER, TAG_BORDER, TAG_GOAL_LEFT, TAG_GOAL_RIGHT)):
             body.userData = self
             for fixture in body.fixtures:
-                fixture.userData = self
+                fixture.userData = tag | arena_tag
 
     @property
     def center_position(self):
@@ -67,6 +76,22 @@ class Field:
     def height(self):
         return self._height
     
+    @property
+    def left(self):
+        return self._left
+
+    @property
+    def right(self):
+        return self._right
+
+    @property
+    def top(self):
+        return self._top
+
+    @property
+    def bottom(self):
+        return self._bottom
+    
     @property
     def left_body(self):
         return self._bodies[2]
@@ -88,9 +113,9 @@ class Field:
         is_outside: bool
             True if ball is outside of field, False otherwise"""
         
-        ball_pos = ball.position
+        ball_x, ball_y, _, _ = ball.state.tolist()
 
-        return  ball_pos.x < self._center_position.x - self._width/2 or \
-                ball_pos.x > self._center_position.x + self._width/2 or \
-                ball_pos.y > self._center_position.y + self._height/2 or \
-                ball_pos.y < self._center_position.y - self._height/2
\ No newline at end of file
+        return  ball_x < self._left or \
+                ball_x > self._right or \
+                ball_y > self._top or \
+                ball_y < self._bottom
\ No newline at end of file
@@ -1,52 +1,202 @@
 import numpy as np
 
 from math import sqrt
+from copy import deepcopy
+from enum import Enum
+from collections import namedtuple
 from Box2D import b2World, b2ContactListener
 from pygame.math import Vector2
 
+from .constants import POLYGON_RADIUS, TAG_BALL, TAG_PADDLE_1, TAG_PADDLE_2, TAG_GOAL_LEFT, TAG_GOAL_RIGHT, TAG_KIND_MASK, ARENA_TAG_SHIFT
+from .physics_profile import PhysicsProfile
 from .field import Field
 from .paddle import Paddle
 from .ball import Ball
+from .controller.controller import Controller, PADDLE_VELOCITIES_Y
+
+
+def spawn_seeds(seed, n_games):
+    """Spawn independent seeds for a family of game sessions.
+    
+    Parameters
+    --------------------
+    seed: int or SeedSequence
+        root seed of the family
+
+    n_games: int
+        number of game sessions
+        
+    Return
+    --------------------
+    seeds: list
+        a SeedSequence for each game session"""
+    
+    root_seed = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+
+    return root_seed.spawn(n_games)
+
+
+class ContactEvent(Enum):
+    """Event raised by a contact between ball and another object of Pong.
+    A subscriber of an event is called with the paddle involved."""
+    SCORE = 0               #Ball touches left or right border of field. Paddle is who scores.
+    BEGIN_TOUCH = 1         #Ball starts touching a paddle.
+    END_TOUCH = 2           #Ball stops touching a paddle.
 
 
 class PongGameContactListener(b2ContactListener):
-    """A base collision system listener of a Pong game."""
+    """A base collision system listener of a Pong game. 
+    Contacts are dispatched by the tags of their fixtures (see pong.constants) to handlers
+    of the game session that hosts them (a world physics can host many arenas)."""
+
+    def __init__(self):
+        """Create new contact listener."""
+
+        super().__init__()
+
+        self._games = []                                            #Game session of each arena.
+        self._subscribers = {event: [] for event in ContactEvent}
+
+        #Handlers of contacts. Key is tag_a | tag_b of fixtures, value is (handler, paddle number).
+        self._begin_handlers = {TAG_BALL | TAG_GOAL_RIGHT: (self._on_score, 1),
+                                TAG_BALL | TAG_GOAL_LEFT: (self._on_score, 2),
+                                TAG_BALL | TAG_PADDLE_1: (self._on_begin_touch, 1),
+                                TAG_BALL | TAG_PADDLE_2: (self._on_begin_touch, 2)}
+        self._end_handlers = {TAG_BALL | TAG_PADDLE_1: (self._on_end_touch, 1),
+                              TAG_BALL | TAG_PADDLE_2: (self._on_end_touch, 2)}
+
+    @property
+    def current_game(self):
+        return self._games[0] if len(self._games) > 0 else None
+
+    def bind_game(self, game, arena_index=0):
+        """Bind a game session to an arena of world physics.
+        
+        Parameters
+        --------------------
+        game: Game
+            a game session
+            
+        arena_index: int, optional
+            index of arena that hosts game session"""
+        
+        if arena_index >= len(self._games):
+            self._games.extend([None] * (arena_index + 1 - len(self._games)))
+
+        self._games[arena_index] = game
+
+    def subscribe(self, event, callback):
+        """Subscribe a callback to an event.
+        
+        Parameters
+        --------------------
+        event: ContactEvent
+            event to subscribe
+            
+        callback: callable
+            function called with the paddle involved in event"""
+        
+        self._subscribers[event].append(callback)
+
+    def unsubscribe(self, event, callback):
+        """Unsubscribe a callback from an event.
+        
+        Parameters
+        --------------------
+        event: ContactEvent
+            event subscribed
+            
+        callback: callable
+            function subscribed to event"""
+        
+        self._subscribers[event].remove(callback)
 
-    current_game = None
+    def _notify(self, event, paddle):
+        """Call subscribers of an event."""
+
+        for callback in self._subscribers[event]:
+            callback(paddle)
+
+    def _on_score(self, game, paddle_number):
+        """Assign one point to a paddle (1 is left paddle, 2 is right paddle)."""
+
+        if paddle_number == 1:
+            game.score_paddle_1 += 1
+        else:
+            game.score_paddle_2 += 1
+
+        #Reset if none touched ball.
+        game.is_reset_initial_state_needed = True
+
+        if self._subscribers[ContactEvent.SCORE]:
+            self._notify(ContactEvent.SCORE, game.paddle_1 if paddle_number == 1 else game.paddle_2)
+
+    def _on_begin_touch(self, game, paddle_number):
+        """Ball starts touching a paddle."""
+
+        if self._subscribers[ContactEvent.BEGIN_TOUCH]:
+            self._notify(ContactEvent.BEGIN_TOUCH, game.paddle_1 if paddle_number == 1 else game.paddle_2)
+
+    def _on_end_touch(self, game, paddle_number):
+        """Ball stops touching a paddle, so it bounces with an angle that depends on where it hit the paddle."""
+
+        ball = game.ball
+        paddle = game.paddle_1 if paddle_number == 1 else game.paddle_2
+
+        #A contact can end inside a step of world physics, so cached states are refreshed first.
+        ball.refresh_state()
+        paddle.refresh_state()
+
+        vel_y_dir = sqrt(2)/2 * min(max((ball.state.item(1) - paddle.state.item(1)) / paddle.height, -1.0), 1.0)
+        vel_x_dir = sqrt(1 - vel_y_dir**2) * (-1 if ball.state.item(2) < 0 else 1)
+
+        ball.velocity = Ball.SPEED * Vector2(vel_x_dir, vel_y_dir)
+
+        if self._subscribers[ContactEvent.END_TOUCH]:
+            self._notify(ContactEvent.END_TOUCH, paddle)
 
     def BeginContact(self, contact):
-        #Is collision between ball and left or right border of field?
-        if (isinstance(contact.fixtureA.userData, Ball) and isinstance(contact.fixtureB.userData, Field)) or (isinstance(contact.fixtureA.userData, Field) and isinstance(contact.fixtureB.userData, Ball)):
-            fixture_field = contact.fixtureA if isinstance(contact.fixtureA.userData, Field) else contact.fixtureB
-            field = fixture_field.userData
-
-            #Left player is assigned one point.
-            if fixture_field.body == field.right_body:
-                self.current_game.score_paddle_1 += 1
-            #Right player is assigned one point.
-            elif fixture_field.body == field.left_body:
-                self.current_game.score_paddle_2 += 1
-
-            #Reset if none touched ball.
-            if fixture_field.body == field.left_body or fixture_field.body == field.right_body:
-                self.current_game.is_reset_initial_state_needed = True
+        tag_a = contact.fixtureA.userData
+        tags = tag_a | contact.fixtureB.userData
+        game = self._games[tag_a >> ARENA_TAG_SHIFT]
+
+        #Any contact of ball (borders too) ends its straight flight.
+        if tags & TAG_BALL:
+            game.ball.begin_flight()
+
+        handler = self._begin_handlers.get(tags & TAG_KIND_MASK)
+        if handler is not None:
+            handler[0](game, handler[1])
 
     def EndContact(self, contact):
-        #Is collision between ball and a paddle?
-        if (isinstance(contact.fixtureA.userData, Ball) and isinstance(contact.fixtureB.userData, Paddle)) or (isinstance(contact.fixtureA.userData, Paddle) and isinstance(contact.fixtureB.userData, Ball)):
-            ball = contact.fixtureA.userData if isinstance(contact.fixtureA.userData, Ball) else contact.fixtureB.userData
-            paddle = contact.fixtureA.userData if isinstance(contact.fixtureA.userData, Paddle) else contact.fixtureB.userData
+        tag_a = contact.fixtureA.userData
+        tags = tag_a | contact.fixtureB.userData
+        game = self._games[tag_a >> ARENA_TAG_SHIFT]
+
+        if tags & TAG_BALL:
+            game.ball.begin_flight()
+
+        handler = self._end_handlers.get(tags & TAG_KIND_MASK)
+        if handler is not None:
+            handler[0](game, handler[1])
 
-            vel_y_dir = sqrt(2)/2 * np.clip((ball.position.y - paddle.position.y) / paddle.height, -1, 1)
-            vel_x_dir = sqrt(1 - vel_y_dir**2) * (-1 if ball.velocity.x < 0 else 1)
 
-            ball.velocity = Ball.SPEED * Vector2(vel_x_dir, vel_y_dir)
+GameSnapshot = namedtuple("GameSnapshot", ["paddle_1_position", "paddle_1_velocity", 
+                                           "paddle_2_position", "paddle_2_velocity", 
+                                           "ball_position", "ball_velocity", 
+                                           "score_paddle_1", "score_paddle_2", 
+                                           "is_reset_initial_state_needed", "rng_state"])
+"""An immutable state record of a game session. Positions and velocities are tuples in Box2D units (meters).
+rng_state is a private copy of state of serve generator, it is copied again on restore."""
+
+StepEvent = namedtuple("StepEvent", ["tick", "event", "paddle"])
+"""A contact event raised during Game.step_many(). Tick is the index of update step where it happened."""
 
 
 class Game:
     """A game session of Pong."""
 
-    def __init__(self, center_position_field=(0,0), size_field=(700, 400), size_paddle=(10, 50), radius_ball=10, score_goal=11, contact_listener=PongGameContactListener()):
+    def __init__(self, center_position_field=(0,0), size_field=(700, 400), size_paddle=(10, 50), radius_ball=10, score_goal=11, contact_listener=None, seed=None, physics_profile=PhysicsProfile.EXACT, world_physics=None, arena_index=0):
         """Create a new game of Pong.
         
         Parameters
@@ -67,26 +217,68 @@ class Game:
             radius of ball
 
         contact_listener: PongGameContactListener, optional
-            a collision system listener
+            a collision system listener. If it is None, a new one is created
+
+        seed: int or SeedSequence, optional
+            seed of random generator used to serve the ball. If it is None, a fresh seed is used
+
+        physics_profile: PhysicsProfile, optional
+            fidelity profile of Box2D step
+
+        world_physics: b2World, optional
+            world hub physics of Box2D shared with other game sessions. If it is None, 
+            this game session creates its own world physics. A shared world physics is stepped by its owner 
+            (see MultiArenaGame) and contact_listener must be the listener of it
+
+        arena_index: int, optional
+            index of arena of world physics that hosts this game session
         """
     
-        contact_listener.current_game = self
-        self._wrldphscs = b2World(gravity=(0, 0), contactListener=contact_listener)
+        if contact_listener is None:
+            contact_listener = PongGameContactListener()
 
-        self.field = Field(Vector2(center_position_field[0], center_position_field[1]), size_field[0], size_field[1], self._wrldphscs)
-        self.paddle_1 = Paddle(Vector2(-0.95 * size_field[0]/2 + center_position_field[0], center_position_field[1]), size_paddle[0], size_paddle[1], self._wrldphscs)
-        self.paddle_2 = Paddle(Vector2(0.95 * size_field[0]/2 + center_position_field[0], center_position_field[1]), size_paddle[0], size_paddle[1], self._wrldphscs)
-        self.ball = Ball(Vector2(0, 0), radius_ball, self._wrldphscs)
+        contact_listener.bind_game(self, arena_index)
+        self._contact_listener = contact_listener
+        self._arena_index = arena_index
+        self._is_world_owner = world_physics is None
+        self._wrldphscs = b2World(gravity=(0, 0), contactListener=contact_listener) if world_physics is None else world_physics
+        arena_tag = arena_index << ARENA_TAG_SHIFT
+
+        self.field = Field(Vector2(center_position_field[0], center_position_field[1]), size_field[0], size_field[1], self._wrldphscs, arena_tag)
+        self._state = np.zeros(12)                              #Cached state of paddles and ball (same layout of a full observation).
+        self.paddle_1 = Paddle(Vector2(-0.95 * size_field[0]/2 + center_position_field[0], center_position_field[1]), size_paddle[0], size_paddle[1], self._wrldphscs, TAG_PADDLE_1 | arena_tag, self._state[0:4])
+        self.paddle_2 = Paddle(Vector2(0.95 * size_field[0]/2 + center_position_field[0], center_position_field[1]), size_paddle[0], size_paddle[1], self._wrldphscs, TAG_PADDLE_2 | arena_tag, self._state[4:8])
+        self.ball = Ball(Vector2(center_position_field[0], center_position_field[1]), radius_ball, self._wrldphscs, TAG_BALL | arena_tag, self._state[8:12])
         self.score_paddle_1 = 0
         self.score_paddle_2 = 0
         self._score_goal = score_goal
         self._score_done = False
         self.is_reset_initial_state_needed = False              #Used only b2ContactListener subclass.
+        self._rng = np.random.default_rng(seed)
+        self.physics_profile = physics_profile
 
     @property
     def score_goal(self):
         return self._score_goal
     
+    @property
+    def state(self):
+        """Cached state of game session. It is an array (x, y, vel_x, vel_y) of paddle 1, paddle 2 and ball,
+        refreshed once after each update step. It must not be modified."""
+        return self._state
+
+    @property
+    def physics_profile(self):
+        return self._physics_profile
+    
+    @physics_profile.setter
+    def physics_profile(self, new_profile):
+        if not isinstance(new_profile, PhysicsProfile):
+            raise TypeError("expected PhysicsProfile for physics_profile")
+        
+        self._physics_profile = new_profile
+        self.ball.rigid_body.bullet = new_profile.is_bullet_ball
+    
     def _reset_initial_state(self):
         """Reset initial state of paddles and ball."""
 
@@ -102,13 +294,88 @@ class Game:
         self.ball.position = Vector2(self.field.center_position.x, self.field.center_position.y)
 
         # ------------------------------
-        rng = np.random.default_rng()
-        y_dir = rng.uniform(0.0, 0.5)
+        y_dir = self._rng.uniform(0.0, 0.5)
         x_dir = sqrt(1 - y_dir**2)
-        vel_dir_ball = Vector2(x_dir if rng.uniform() <= 0.5 else -x_dir, y_dir if rng.uniform() <= 0.5 else -y_dir)
+        vel_dir_ball = Vector2(x_dir if self._rng.uniform() <= 0.5 else -x_dir, y_dir if self._rng.uniform() <= 0.5 else -y_dir)
 
         self.ball.velocity = Ball.SPEED_INIT * vel_dir_ball
 
+    def reset(self, score_goal=None, seed=None):
+        """Reset this game session to play a new match.
+        World physics and bodies of Box2D are reused, start() must be called after it.
+        
+        Parameters
+        --------------------
+        score_goal: int, optional
+            new score goal. If it is None, current score goal is kept
+
+        seed: int or SeedSequence, optional
+            seed of random generator. If it is None, random generator is not reseeded"""
+
+        self._contact_listener.bind_game(self, self._arena_index)
+
+        if score_goal is not None:
+            self._score_goal = score_goal
+
+        if seed is not None:
+            self._rng = np.random.default_rng(seed)
+
+        self.score_paddle_1 = 0
+        self.score_paddle_2 = 0
+        self._score_done = False
+        self.is_reset_initial_state_needed = False
+        self.paddle_1.velocity = Vector2(0.0, 0.0)
+        self.paddle_2.velocity = Vector2(0.0, 0.0)
+
+    def snapshot(self):
+        """Take a snapshot of current state of this game session.
+        
+        Return
+        --------------------
+        snapshot: GameSnapshot
+            state of this game session"""
+        
+        paddle_1_body = self.paddle_1.rigid_body
+        paddle_2_body = self.paddle_2.rigid_body
+        ball_body = self.ball.rigid_body
+
+        return GameSnapshot(paddle_1_body.position.tuple, paddle_1_body.linearVelocity.tuple,
+                            paddle_2_body.position.tuple, paddle_2_body.linearVelocity.tuple,
+                            ball_body.position.tuple, ball_body.linearVelocity.tuple,
+                            self.score_paddle_1, self.score_paddle_2,
+                            self.is_reset_initial_state_needed, deepcopy(self._rng.bit_generator.state))
+    
+    def restore(self, snapshot):
+        """Restore state of this game session from a snapshot. No body of Box2D is created.
+        Contacts of Box2D are not part of a snapshot, they are updated on next update step.
+        
+        Parameter
+        --------------------
+        snapshot: GameSnapshot
+            a snapshot taken from this game session (or from another one with same sizes)"""
+        
+        self._contact_listener.bind_game(self, self._arena_index)
+
+        self.paddle_1.rigid_body.position = snapshot.paddle_1_position
+        self.paddle_1.rigid_body.linearVelocity = snapshot.paddle_1_velocity
+        self.paddle_2.rigid_body.position = snapshot.paddle_2_position
+        self.paddle_2.rigid_body.linearVelocity = snapshot.paddle_2_velocity
+        self.ball.rigid_body.position = snapshot.ball_position
+        self.ball.rigid_body.linearVelocity = snapshot.ball_velocity
+        self.score_paddle_1 = snapshot.score_paddle_1
+        self.score_paddle_2 = snapshot.score_paddle_2
+        self.is_reset_initial_state_needed = snapshot.is_reset_initial_state_needed
+        self._rng.bit_generator.state = deepcopy(snapshot.rng_state)
+        self.refresh_state()
+        self.ball.begin_flight()
+
+    def refresh_state(self):
+        """Cache state of paddles and ball from their rigid bodies."""
+
+        self.paddle_1.refresh_state()
+        self.paddle_2.refresh_state()
+        self.ball.refresh_state()
+
     def start(self):
         """Start game session."""
 
@@ -122,12 +389,161 @@ class Game:
         delta_time: float
             delta time"""
 
-        self._wrldphscs.Step(delta_time, 20, 20)
+        if not self._is_world_owner:
+            raise RuntimeError("game session hosted by a shared world physics is updated by its owner")
+
+        #Adaptive profile does one step of whole delta time while ball cannot reach any contact.
+        n_substeps = self._physics_profile.substeps
+        if self._physics_profile.is_adaptive and self._time_until_ball_event() > delta_time:
+            n_substeps = 1
+
+        for _ in range(n_substeps):
+            self._wrldphscs.Step(delta_time / n_substeps, 
+                                 self._physics_profile.velocity_iterations, 
+                                 self._physics_profile.position_iterations)
+
+        self._on_post_step()
+
+    def _on_post_step(self):
+        """Perform commands after world physics is stepped."""
+
+        self.refresh_state()
 
         if self.is_reset_initial_state_needed or self.field.check_ball_outside(self.ball):
             self._reset_initial_state()
             self.is_reset_initial_state_needed = False
 
+    def step_many(self, n_ticks, action_1, action_2, delta_time=1.0/60.0):
+        """Do many update steps holding actions of paddles, gathering contact events along the way.
+        It stops early if game session ends.
+        
+        Parameters
+        --------------------
+        n_ticks: int
+            number of update steps to do
+
+        action_1: MovingType or Controller
+            action held by paddle 1 on every update step. If it is a controller, it is updated after every update step instead
+            (e.g. a bot opponent that keeps reacting)
+
+        action_2: MovingType or Controller
+            action held by paddle 2 on every update step. If it is a controller, it is updated after every update step instead
+
+        delta_time: float, optional
+            delta time of one update step
+            
+        Return
+        --------------------
+        n_ticks_done: int
+            number of update steps done
+
+        events: list
+            StepEvent of scores and touches happened, in order"""
+        
+        paddle_actions = [(paddle, PADDLE_VELOCITIES_Y[action]) for paddle, action in ((self.paddle_1, action_1), (self.paddle_2, action_2)) if not isinstance(action, Controller)]
+        controllers = [action for action in (action_1, action_2) if isinstance(action, Controller)]
+        events = []
+        n_ticks_done = 0
+
+        def record(event):
+            return lambda paddle: events.append(StepEvent(n_ticks_done, event, paddle))
+
+        callbacks = [(event, record(event)) for event in ContactEvent]
+        for event, callback in callbacks:
+            self._contact_listener.subscribe(event, callback)
+
+        try:
+            while n_ticks_done < n_ticks and not self.is_ended():
+                #Paddles can be stopped by borders of field, so actions are applied again on every step.
+                for paddle, velocity_y in paddle_actions:
+                    paddle.set_velocity_y(velocity_y)
+
+                self.update(delta_time)
+                n_ticks_done += 1
+
+                for controller in controllers:
+                    controller.update(delta_time)
+        finally:
+            for event, callback in callbacks:
+                self._contact_listener.unsubscribe(event, callback)
+
+        return n_ticks_done, events
+
+    def _time_until_ball_event(self):
+        """Calculate time ball moves on a straight line before it can hit top or bottom border of field or
+        it reaches the zone along x-axis where the paddle it moves towards can collide it.
+        
+        Return
+        --------------------
+        t_event: float
+            time before next event of ball. It is 0 (or less) if ball is touching something, a reset is needed
+            or ball is already in zone of a paddle, and np.inf if ball is still"""
+
+        if self.is_reset_initial_state_needed:
+            return 0.0
+
+        #Ball must not touch anything (e.g. a paddle bounce is not ended yet).
+        for contact_edge in self.ball.rigid_body.contacts:
+            if contact_edge.contact.touching:
+                return 0.0
+
+        ball_x, ball_y, ball_vel_x, ball_vel_y = self.ball.state.tolist()
+        contact_margin = 2 * POLYGON_RADIUS
+
+        #Calculate time of impact between ball and a border of field.
+        if ball_vel_y > 0.0:
+            distance_bf = self.field.top - (ball_y + self.ball.radius/2) - contact_margin
+        elif ball_vel_y < 0.0:
+            distance_bf = (ball_y - self.ball.radius/2) - self.field.bottom - contact_margin
+        t_impact_bf = distance_bf / abs(ball_vel_y) if ball_vel_y != 0 else np.inf
+
+        #Calculate time when ball reaches zone of paddle along x-axis.
+        if ball_vel_x > 0.0:
+            distance_bp = (self.paddle_2.state.item(0) - self.paddle_2.width/2) - (ball_x + self.ball.radius/2) - contact_margin
+        elif ball_vel_x < 0.0:
+            distance_bp = (ball_x - self.ball.radius/2) - (self.paddle_1.state.item(0) + self.paddle_1.width/2) - contact_margin
+        t_impact_bp = distance_bp / abs(ball_vel_x) if ball_vel_x != 0 else np.inf
+
+        return min(t_impact_bf, t_impact_bp)
+
+    def advance_until_event(self, max_time, delta_time=1.0/60.0):
+        """Skip update steps while ball is in free flight and both paddles hold still.
+
+        Ball moves on a straight line until it hits top or bottom border of field or it reaches
+        the zone along x-axis where the paddle it moves towards can collide it (goal line is behind it).
+        This game session jumps straight to last tick before next event, which is left to update().
+        Nothing is skipped once this game session is ended.
+
+        Parameters
+        --------------------
+        max_time: float
+            maximum time to skip
+
+        delta_time: float, optional
+            delta time of one update step
+
+        Return
+        --------------------
+        n_ticks: int
+            number of update steps skipped"""
+
+        if not self._is_world_owner:
+            raise RuntimeError("game session hosted by a shared world physics is updated by its owner")
+
+        if self.is_ended() or self.paddle_1.velocity.length_squared() != 0 or self.paddle_2.velocity.length_squared() != 0:
+            return 0
+
+        #Last tick before next event is done by update().
+        t_event = self._time_until_ball_event()
+        n_ticks = int(t_event / delta_time) - 1 if t_event != np.inf else int(max_time / delta_time)
+        n_ticks = min(n_ticks, int(max_time / delta_time))
+        if n_ticks <= 0:
+            return 0
+
+        self.ball.position = self.ball.position + n_ticks * delta_time * self.ball.velocity
+
+        return n_ticks
+
     def is_ended(self):
         """Chech if this game session is ended.
         
@@ -0,0 +1,102 @@
+import numpy as np
+
+class LatencyTimer:
+    """Latency timer of a phase done once per frame (e.g. update of a controller).
+    It keeps last samples for rolling percentiles and a histogram of all samples of session."""
+
+    HISTOGRAM_EDGES = np.logspace(-7, 0, 351)
+    """Edges (in seconds) of session histogram, from 0.1 us to 1 s with 50 bins per decade."""
+
+    def __init__(self, window_size=600):
+        """Create new latency timer.
+
+        Parameter
+        --------------------
+        window_size: int, optional
+            number of last samples used for rolling percentiles"""
+
+        self._window = np.zeros(window_size)
+        self._n_samples = 0
+        self._histogram = np.zeros(len(self.HISTOGRAM_EDGES) + 1, dtype=np.int64)       #First and last bins count samples out of edges.
+        self._total_time = 0.0
+        self._max_time = 0.0
+
+    @property
+    def n_samples(self):
+        return self._n_samples
+
+    def add(self, elapsed_time):
+        """Add a sample.
+
+        Parameter
+        --------------------
+        elapsed_time: float
+            time elapsed in seconds"""
+
+        self._window[self._n_samples % len(self._window)] = elapsed_time
+        self._n_samples += 1
+        self._histogram[np.searchsorted(self.HISTOGRAM_EDGES, elapsed_time, side="right")] += 1
+        self._total_time += elapsed_time
+        self._max_time = max(self._max_time, elapsed_time)
+
+    def rolling_percentiles(self, qs=(50, 95, 99)):
+        """Get percentiles of last samples.
+
+        Parameter
+        --------------------
+        qs: tuple, optional
+            percentiles to compute
+
+        Return
+        --------------------
+        percentiles: ndarray
+            percentiles in seconds (zeros if no sample is added)"""
+
+        if self._n_samples == 0:
+            return np.zeros(len(qs))
+
+        return np.percentile(self._window[:min(self._n_samples, len(self._window))], qs)
+
+    def session_percentiles(self, qs=(50, 95, 99)):
+        """Get percentiles of all samples from session histogram. A percentile is the upper edge of its bin.
+
+        Parameter
+        --------------------
+        qs: tuple, optional
+            percentiles to compute
+
+        Return
+        --------------------
+        percentiles: ndarray
+            percentiles in seconds (zeros if no sample is added)"""
+
+        if self._n_samples == 0:
+            return np.zeros(len(qs))
+
+        cumulative_counts = np.cumsum(self._histogram)
+        bins = np.searchsorted(cumulative_counts, np.asarray(qs) / 100 * self._n_samples, side="left")
+        upper_edges = np.append(self.HISTOGRAM_EDGES, self._max_time)
+
+        return np.minimum(upper_edges[np.minimum(bins, len(upper_edges) - 1)], self._max_time)
+
+    def summary(self, qs=(50, 95, 99)):
+        """Get a summary of session.
+
+        Parameter
+        --------------------
+        qs: tuple, optional
+            percentiles to report
+
+        Return
+        --------------------
+        summary: dict
+            number of samples, mean, max and percentiles (rolling and of session) in milliseconds"""
+
+        summary = {"n_samples": self._n_samples,
+                   "mean_ms": 1000 * self._total_time / self._n_samples if self._n_samples > 0 else 0.0,
+                   "max_ms": 1000 * self._max_time}
+        for q, rolling, session in zip(qs, self.rolling_percentiles(qs), self.session_percentiles(qs)):
+            summary["p{}_ms".format(q)] = 1000 * float(session)
+            summary["rolling_p{}_ms".format(q)] = 1000 * float(rolling)
+
+        return summary
\ No newline at end of file
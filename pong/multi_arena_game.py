@@ -0,0 +1,107 @@
+from math import ceil, sqrt
+from Box2D import b2World
+
+from .game import Game, PongGameContactListener, spawn_seeds
+from .physics_profile import PhysicsProfile
+
+class MultiArenaGame:
+    """Many independent game sessions (arenas) of Pong hosted by one world physics of Box2D.
+    Arenas are placed on a grid far enough apart to never touch, so one step of world physics advances all of them."""
+
+    def __init__(self, n_arenas, size_field=(700, 400), size_paddle=(10, 50), radius_ball=10, score_goal=11, contact_listener=None, seed=None, physics_profile=PhysicsProfile.EXACT):
+        """Create new arenas of Pong.
+
+        Parameters
+        --------------------
+        n_arenas: int
+            number of arenas
+
+        size_field: tuple, optional
+            size of field of each arena. It is represented as (wf, hf) where wf is width of field and
+            hf is height of field
+
+        size_paddle: tuple, optional
+            size of paddle. It is represented as (wp, hp) where wp is width of paddle and
+            hp is height of paddle
+
+        radius_ball: int, optional
+            radius of ball
+
+        score_goal: int, optional
+            score to reach to win a game session
+
+        contact_listener: PongGameContactListener, optional
+            a collision system listener shared by all arenas. If it is None, a new one is created
+
+        seed: int or SeedSequence, optional
+            root seed of arenas. Each arena uses a seed spawned from it
+
+        physics_profile: PhysicsProfile, optional
+            fidelity profile of Box2D step"""
+
+        self._contact_listener = contact_listener if contact_listener is not None else PongGameContactListener()
+        self._wrldphscs = b2World(gravity=(0, 0), contactListener=self._contact_listener)
+        self._physics_profile = physics_profile
+
+        #Arenas are placed on a grid centered on origin.
+        n_columns = ceil(sqrt(n_arenas))
+        n_rows = ceil(n_arenas / n_columns)
+        spacing_x = 2 * size_field[0]
+        spacing_y = 2 * size_field[1]
+
+        self.games = []
+        for arena_index, arena_seed in enumerate(spawn_seeds(seed, n_arenas)):
+            row, column = divmod(arena_index, n_columns)
+            center_position_field = ((column - (n_columns - 1)/2) * spacing_x, (row - (n_rows - 1)/2) * spacing_y)
+
+            self.games.append(Game(center_position_field, size_field, size_paddle, radius_ball, score_goal,
+                                   contact_listener=self._contact_listener,
+                                   seed=arena_seed,
+                                   physics_profile=physics_profile,
+                                   world_physics=self._wrldphscs,
+                                   arena_index=arena_index))
+
+    @property
+    def n_arenas(self):
+        return len(self.games)
+
+    @property
+    def contact_listener(self):
+        return self._contact_listener
+
+    def start(self):
+        """Start game sessions of all arenas."""
+
+        for game in self.games:
+            game.start()
+
+    def update(self, delta_time):
+        """Do update step of all arenas with one step of world physics.
+
+        Parameter
+        --------------------
+        delta_time: float
+            delta time"""
+
+        #Adaptive profile does one step of whole delta time only if no ball of any arena can reach a contact.
+        n_substeps = self._physics_profile.substeps
+        if self._physics_profile.is_adaptive and all(game._time_until_ball_event() > delta_time for game in self.games):
+            n_substeps = 1
+
+        for _ in range(n_substeps):
+            self._wrldphscs.Step(delta_time / n_substeps,
+                                 self._physics_profile.velocity_iterations,
+                                 self._physics_profile.position_iterations)
+
+        for game in self.games:
+            game._on_post_step()
+
+    def is_ended(self):
+        """Check if game sessions of all arenas are ended.
+
+        Return
+        --------------------
+        is_ended: bool
+            True if all game sessions are ended, False otherwise"""
+
+        return all(game.is_ended() for game in self.games)
\ No newline at end of file
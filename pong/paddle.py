@@ -1,3 +1,5 @@
+import numpy as np
+
 from pygame.math import Vector2
 from Box2D import b2Vec2, b2PolygonShape
 
@@ -8,7 +10,7 @@ class Paddle:
 
     SPEED = 200
 
-    def __init__(self, position, width, height, world_physics):
+    def __init__(self, position, width, height, world_physics, tag, state=None):
         """Create a paddle.
         
         Parameters
@@ -23,7 +25,13 @@ class Paddle:
             height of paddle
             
         world_physics: b2World
-            world hub physics of Box2D"""
+            world hub physics of Box2D
+            
+        tag: int
+            fixture tag of paddle (either TAG_PADDLE_1 or TAG_PADDLE_2)
+
+        state: ndarray, optional
+            array of 4 floats where state (x, y, vel_x, vel_y) of paddle is cached. If it is None, a new one is allocated"""
 
         self._width = width
         self._height = height
@@ -36,11 +44,14 @@ class Paddle:
         self._rigid_body.mass = 10
 
         self._rigid_body.userData = self
-        self._fixture.userData = self
+        self._fixture.userData = tag
+
+        self._state = state if state is not None else np.zeros(4)
+        self.refresh_state()
 
     @property
     def position(self):
-        return PPM * Vector2(self._rigid_body.position.x, self._rigid_body.position.y)
+        return Vector2(self._state[0], self._state[1])
     
     @position.setter
     def position(self, new_pos):
@@ -48,10 +59,11 @@ class Paddle:
             raise TypeError("expected Vector2 for position")
         
         self._rigid_body.position = b2Vec2(new_pos.x, new_pos.y) / PPM
+        self.refresh_state()
 
     @property
     def velocity(self):
-        return PPM * Vector2(self._rigid_body.linearVelocity.x, self._rigid_body.linearVelocity.y)
+        return Vector2(self._state[2], self._state[3])
     
     @velocity.setter
     def velocity(self, new_vel):
@@ -59,6 +71,33 @@ class Paddle:
             raise TypeError("expected Vector2 for velocity")
         
         self._rigid_body.linearVelocity = b2Vec2(new_vel.x, new_vel.y) / PPM
+        self.refresh_state()
+
+    def set_velocity_y(self, velocity_y):
+        """Set velocity of paddle along y-axis and stop it along x-axis without building any vector.
+        
+        Parameter
+        --------------------
+        velocity_y: float
+            velocity along y-axis. It must be unchanged by the float32 round trip of Box2D (e.g. 0 or ±Paddle.SPEED)"""
+        
+        self._rigid_body.linearVelocity = (0.0, velocity_y / PPM)
+        self._state[2] = 0.0
+        self._state[3] = velocity_y
+
+    def refresh_state(self):
+        """Cache position and velocity of rigid body. It is called once after each step of world physics."""
+
+        position = self._rigid_body.position
+        velocity = self._rigid_body.linearVelocity
+        self._state[0] = PPM * position.x
+        self._state[1] = PPM * position.y
+        self._state[2] = PPM * velocity.x
+        self._state[3] = PPM * velocity.y
+
+    @property
+    def state(self):
+        return self._state
 
     @property
     def rigid_body(self):
@@ -0,0 +1,31 @@
+from enum import Enum
+
+class PhysicsProfile(Enum):
+    """Fidelity profile of Box2D step used by a game session. 
+    It is represented as (velocity iterations, position iterations, substeps, bullet ball, adaptive substeps).
+    With adaptive substeps, a step is split into substeps only if ball can reach a border of field or a paddle during it,
+    so a coarse delta time can be used while ball is far from them."""
+    EXACT = (20, 20, 1, True, False)        #Original step: most accurate and slowest.
+    FAST = (8, 3, 1, True, False)           #Default iterations of Box2D manual.
+    FASTEST = (2, 1, 1, False, False)       #Fewest iterations and no continuous collision between ball and paddles.
+    ADAPTIVE = (20, 20, 4, True, True)      #Iterations of EXACT, with 4 substeps only near contacts.
+
+    @property
+    def velocity_iterations(self):
+        return self.value[0]
+    
+    @property
+    def position_iterations(self):
+        return self.value[1]
+    
+    @property
+    def substeps(self):
+        return self.value[2]
+    
+    @property
+    def is_bullet_ball(self):
+        return self.value[3]
+    
+    @property
+    def is_adaptive(self):
+        return self.value[4]
\ No newline at end of file
@@ -0,0 +1,733 @@
+import numpy as np
+
+from math import sqrt
+
+from .constants import LINEAR_SLOP, POLYGON_RADIUS, VELOCITY_THRESHOLD, MAX_LINEAR_CORRECTION, BAUMGARTE, TOI_BAUMGARTE, MAX_SUB_STEPS
+from .physics_profile import PhysicsProfile
+from .paddle import Paddle
+from .ball import Ball
+
+TOTAL_RADIUS = 2 * POLYGON_RADIUS
+"""Distance (in pixels) between cores of two shapes whose skins touch. Box2D shapes are touching within it."""
+
+TARGET_SEPARATION = max(LINEAR_SLOP, TOTAL_RADIUS - 3 * LINEAR_SLOP)
+"""Distance (in pixels) between cores of two shapes at their time of impact."""
+
+SEPARATION_TOLERANCE = 0.25 * LINEAR_SLOP
+"""Tolerance (in pixels) of distance between cores of two shapes at their time of impact."""
+
+
+class VecGame:
+    """Many game sessions of Pong simulated at once with NumPy arrays.
+
+    It keeps the same rules of Game (wall reflections, angle-dependent paddle bounce,
+    ball and paddle speeds, score goal and reset after a point) but it does not use Box2D.
+    Contacts are resolved as Box2D resolves them on EXACT profile of Game:
+    a contact whose skins overlap at start of a step is solved on that step (it is inelastic below velocity threshold
+    and shapes are pushed out a little at a time), another one is found by time of impact inside the step and solved there
+    together with contacts touching its bodies (e.g. ball squeezed between a paddle and a border).
+    Contacts between ball and paddle begin and end on same time of Game, so the ball bounces on same position of paddle.
+    Positions and velocities are stored as arrays where row i is game i.
+
+    Known gap: Box2D works on float32 meters, VecGame works on float64 pixels, so positions differ by about 1e-4 pixels.
+    A paddle bounce scales a difference of position along paddle by about 10 on ball direction, so a full rally of VecGame drifts
+    apart from same rally of Game after some bounces even if every contact is resolved in same way. For the same reason a contact
+    whose separation is within 1e-4 pixels of a tolerance of time of impact can be found one step apart (about 1 in 2000 grazing
+    contacts). Paddles are not moved by ball (it is 10^5 times lighter) and contacts of ball are always solved before contacts of paddles."""
+
+    ACTION_VELOCITIES = np.array([0.0, Paddle.SPEED, -Paddle.SPEED])
+    """Paddle velocity y for each MovingType value."""
+
+    VELOCITY_ITERATIONS = PhysicsProfile.EXACT.velocity_iterations
+    """Velocity iterations of a step. They are also velocity iterations of a time of impact of Box2D."""
+
+    POSITION_ITERATIONS = PhysicsProfile.EXACT.position_iterations
+    """Position iterations of a step. They are also position iterations of a time of impact of Box2D."""
+
+    def __init__(self, n_games, center_position_field=(0,0), size_field=(700, 400), size_paddle=(10, 50), radius_ball=10, score_goal=11, seed=None):
+        """Create new games of Pong.
+
+        Parameters
+        --------------------
+        n_games: int
+            number of games to simulate
+
+        center_position_field: tuple, optional
+            center position of field. It is represented as (x_c, y_c) where x_c is x-axis coordinate and
+            y_c is y-axis coordinate of center position of field
+
+        size_field: tuple, optional
+            size of field. It is represented as (wf, hf) where wf is width of field and
+            hf is height of field
+
+        size_paddle: tuple, optional
+            size of paddle. It is represented as (wp, hp) where wp is width of paddle and
+            hp is height of paddle
+
+        radius_ball: int, optional
+            radius of ball
+
+        score_goal: int, optional
+            score to reach to win a game
+
+        seed: int or SeedSequence, optional
+            seed of random generator used to serve the ball"""
+
+        self._n_games = n_games
+        self._center_field = np.array(center_position_field, dtype=np.float64)
+        self._width_field, self._height_field = size_field
+        self._width_paddle, self._height_paddle = size_paddle
+        self._radius_ball = radius_ball
+        self._score_goal = score_goal
+        self._rng = np.random.default_rng(seed)
+
+        #Limits of field.
+        self._top_field = self._center_field[1] + self._height_field/2
+        self._bottom_field = self._center_field[1] - self._height_field/2
+        self._left_field = self._center_field[0] - self._width_field/2
+        self._right_field = self._center_field[0] + self._width_field/2
+
+        #Initial positions of paddles.
+        self._paddle_1_position_init = np.array([-0.95 * self._width_field/2 + self._center_field[0], self._center_field[1]])
+        self._paddle_2_position_init = np.array([0.95 * self._width_field/2 + self._center_field[0], self._center_field[1]])
+
+        #Bodies are ball (index 0), left paddle (index 1) and right paddle (index 2). Half sizes are sizes of cores of their shapes.
+        self._half_sizes = 0.5 * np.array([[radius_ball, radius_ball], size_paddle, size_paddle], dtype=np.float64)
+
+        #Pairs of a body and a border of field that can touch: ball with top, bottom, left and right border, paddles with top and bottom border.
+        #Borders are lines whose normal points inside field. A gap between core of body and border is normal·position - offset.
+        border_normals = np.array([[0.0, -1.0], [0.0, 1.0], [1.0, 0.0], [-1.0, 0.0]])
+        border_points = np.array([[0.0, self._top_field], [0.0, self._bottom_field], [self._left_field, 0.0], [self._right_field, 0.0]])
+        border_idxs = np.array([0, 1, 2, 3, 0, 1, 0, 1])
+        self._border_bodies = np.array([0, 0, 0, 0, 1, 1, 2, 2])
+        self._border_normals = border_normals[border_idxs]
+        self._border_offsets = np.sum(border_normals * border_points, axis=1)[border_idxs] + np.sum(np.abs(self._border_normals) * self._half_sizes[self._border_bodies], axis=1)
+
+        #Pairs of bodies that can touch are pairs of a body and a border, then ball with left paddle and ball with right paddle.
+        #Gap and relative velocity of a pair are along its normal, on coefficients·positions and coefficients·velocities of bodies.
+        self._pair_coefficients = np.concatenate([np.eye(3)[self._border_bodies], [[1.0, -1.0, 0.0], [1.0, 0.0, -1.0]]])
+        self._pair_bodies = self._pair_coefficients != 0
+        self._pair_pushed_bodies = np.concatenate([np.eye(3)[self._border_bodies], [[1.0, 0.0, 0.0], [1.0, 0.0, 0.0]]])     #Ball does not move paddles (it is much lighter).
+        self._pair_restitutions = np.concatenate([np.where(self._border_bodies == 0, 1.0, 0.0), [1.0, 1.0]])                 #Ball is elastic, paddles and borders are not.
+        self._n_pairs = self._pair_restitutions.size
+        self._pair_groups = [np.flatnonzero(self._pair_pushed_bodies[:, 0]), np.flatnonzero(self._pair_pushed_bodies[:, 0] == 0)]     #Pairs pushed out by moving ball, then by moving paddles.
+
+        #State of games. Public positions and velocities are views of state of bodies.
+        self._positions = np.zeros((n_games, 3, 2))
+        self._velocities = np.zeros((n_games, 3, 2))
+        self.ball_position = self._positions[:, 0]
+        self.ball_velocity = self._velocities[:, 0]
+        self.paddle_1_position = self._positions[:, 1]
+        self.paddle_1_velocity = self._velocities[:, 1]
+        self.paddle_2_position = self._positions[:, 2]
+        self.paddle_2_velocity = self._velocities[:, 2]
+        self.ball_position[:] = self._center_field
+        self.paddle_1_position[:] = self._paddle_1_position_init
+        self.paddle_2_position[:] = self._paddle_2_position_init
+        self.score_paddle_1 = np.zeros(n_games, dtype=np.int64)
+        self.score_paddle_2 = np.zeros(n_games, dtype=np.int64)
+        self._is_touching = np.zeros((n_games, 2), dtype=bool)           #True if ball is touching paddle 1 (column 0) or paddle 2 (column 1).
+
+    @property
+    def n_games(self):
+        return self._n_games
+
+    @property
+    def score_goal(self):
+        return self._score_goal
+
+    @property
+    def width_paddle(self):
+        return self._width_paddle
+
+    @property
+    def height_paddle(self):
+        return self._height_paddle
+
+    @property
+    def radius_ball(self):
+        return self._radius_ball
+
+    def _reset_initial_state(self, mask):
+        """Reset initial state of paddles and ball of games selected.
+
+        Parameter
+        --------------------
+        mask: ndarray
+            boolean mask of games to reset"""
+
+        idxs = np.flatnonzero(mask)
+        if idxs.size == 0:
+            return
+
+        #
+        #Reset initial state of paddles.
+        #
+        self.paddle_1_position[idxs] = self._paddle_1_position_init
+        self.paddle_2_position[idxs] = self._paddle_2_position_init
+
+        #
+        #Reset initial state of ball.
+        #
+        #Contacts are kept as contacts of Box2D outlive a reset: a ball that was touching a paddle bounces on next step.
+        self.ball_position[idxs] = self._center_field
+
+        # ------------------------------
+        y_dir = self._rng.uniform(0.0, 0.5, idxs.size)
+        x_dir = np.sqrt(1 - y_dir**2)
+        x_dir = np.where(self._rng.uniform(size=idxs.size) <= 0.5, x_dir, -x_dir)
+        y_dir = np.where(self._rng.uniform(size=idxs.size) <= 0.5, y_dir, -y_dir)
+
+        self.ball_velocity[idxs, 0] = Ball.SPEED_INIT * x_dir
+        self.ball_velocity[idxs, 1] = Ball.SPEED_INIT * y_dir
+
+    def start(self):
+        """Start all game sessions."""
+
+        self._reset_initial_state(np.ones(self._n_games, dtype=bool))
+
+    def reset(self, mask=None):
+        """Start new game sessions, clearing their scores.
+
+        Parameter
+        --------------------
+        mask: ndarray, optional
+            boolean mask of games to restart. If it is None, all games are restarted"""
+
+        if mask is None:
+            mask = np.ones(self._n_games, dtype=bool)
+
+        self.score_paddle_1[mask] = 0
+        self.score_paddle_2[mask] = 0
+        self._reset_initial_state(mask)
+
+    def _border_gaps(self, positions):
+        """Get gaps between cores of bodies and borders of field.
+
+        Parameter
+        --------------------
+        positions: ndarray
+            positions of bodies of some games
+
+        Return
+        --------------------
+        gaps: ndarray
+            gap of each pair of a body and a border (column p is pair p)"""
+
+        return np.einsum("pk,npk->np", self._border_normals, positions[:, self._border_bodies]) - self._border_offsets
+
+    def _paddle_gaps(self, positions):
+        """Get gaps between cores of ball and paddles along each axis.
+
+        Parameter
+        --------------------
+        positions: ndarray
+            positions of bodies of some games
+
+        Returns
+        --------------------
+        deltas: ndarray
+            position of ball relative to each paddle (axis 1 is paddle)
+
+        gaps: ndarray
+            gaps along x-axis and y-axis between ball and each paddle (a negative gap is an overlap along that axis)"""
+
+        deltas = positions[:, :1] - positions[:, 1:]
+        gaps = np.abs(deltas) - (self._half_sizes[0] + self._half_sizes[1:])
+
+        return deltas, gaps
+
+    @staticmethod
+    def _paddle_normals(deltas, gaps):
+        """Get normals of contacts between ball and paddles. A normal is the axis of largest gap, from paddle to ball.
+
+        Parameters
+        --------------------
+        deltas: ndarray
+            position of ball relative to each paddle
+
+        gaps: ndarray
+            gaps along x-axis and y-axis between ball and each paddle
+
+        Return
+        --------------------
+        normals: ndarray
+            normal of each contact"""
+
+        axes = np.argmax(gaps, axis=-1)[..., np.newaxis]
+        normals = np.zeros(deltas.shape)
+        np.put_along_axis(normals, axes, np.where(np.take_along_axis(deltas, axes, axis=-1) < 0, -1.0, 1.0), axis=-1)
+
+        return normals
+
+    def _update_paddle_contacts(self, positions, idxs, columns=(0, 1)):
+        """Update contacts between ball and paddles of games selected as Box2D does: a contact begins when skins of ball and paddle
+        overlap, and when it ends the ball bounces with an angle that depends on where it hit the paddle.
+
+        Parameters
+        --------------------
+        positions: ndarray
+            positions of bodies of games selected at time of update
+
+        idxs: ndarray
+            indices of games selected
+
+        columns: tuple, optional
+            paddles whose contact is updated (0 is left paddle, 1 is right paddle)"""
+
+        deltas, gaps = self._paddle_gaps(positions)
+        is_now_touching = np.max(gaps, axis=-1) <= TOTAL_RADIUS
+
+        for column in columns:
+            is_ended = self._is_touching[idxs, column] & ~is_now_touching[:, column]
+            ended_idxs = idxs[is_ended]
+
+            #Same bounce of PongGameContactListener.EndContact.
+            if ended_idxs.size > 0:
+                vel_y_dir = sqrt(2)/2 * np.clip(deltas[is_ended, column, 1] / self._height_paddle, -1, 1)
+                vel_x_dir = np.sqrt(1 - vel_y_dir**2) * np.where(self.ball_velocity[ended_idxs, 0] < 0, -1, 1)
+
+                self.ball_velocity[ended_idxs, 0] = Ball.SPEED * vel_x_dir
+                self.ball_velocity[ended_idxs, 1] = Ball.SPEED * vel_y_dir
+
+            self._is_touching[idxs, column] = is_now_touching[:, column]
+
+    def _contact_normals(self, positions):
+        """Get normals of contacts of all pairs of bodies that can touch. A normal points from border or paddle to body.
+
+        Parameter
+        --------------------
+        positions: ndarray
+            positions of bodies of some games
+
+        Return
+        --------------------
+        normals: ndarray
+            normal of each pair (axis 1 is pair)"""
+
+        normals = np.empty((positions.shape[0], self._n_pairs, 2))
+        normals[:, :self._border_bodies.size] = self._border_normals
+        normals[:, self._border_bodies.size:] = self._paddle_normals(*self._paddle_gaps(positions))
+
+        return normals
+
+    def _contact_gaps(self, positions, normals):
+        """Get gaps between cores of shapes of all pairs of bodies that can touch along normals of their contacts.
+
+        Parameters
+        --------------------
+        positions: ndarray
+            positions of bodies of some games
+
+        normals: ndarray
+            normal of each pair
+
+        Return
+        --------------------
+        gaps: ndarray
+            gap of each pair (axis 1 is pair)"""
+
+        deltas, _ = self._paddle_gaps(positions)
+        paddle_normals = normals[:, self._border_bodies.size:]
+        paddle_gaps = np.sum(paddle_normals * deltas, axis=-1) - np.sum(np.abs(paddle_normals) * (self._half_sizes[0] + self._half_sizes[1:]), axis=-1)
+
+        return np.concatenate([self._border_gaps(positions), paddle_gaps], axis=1)
+
+    def _solve_velocities(self, velocities, normals, is_contacts):
+        """Solve velocities of contacts as velocity iterations of Box2D do. A contact that approaches faster than
+        velocity threshold bounces, a slower one stops. Contacts of ball are solved before contacts of paddles,
+        again and again until no contact changes (e.g. a paddle stopped by a border stops the ball it carries).
+        The ball never changes velocity of a paddle.
+
+        Parameters
+        --------------------
+        velocities: ndarray
+            velocities of bodies of some games
+
+        normals: ndarray
+            normal of each pair
+
+        is_contacts: ndarray
+            True for each pair whose contact is solved
+
+        Return
+        --------------------
+        velocities: ndarray
+            velocities of bodies after contacts are solved"""
+
+        velocities = velocities.copy()
+        normal_velocities = np.sum(normals * (self._pair_coefficients @ velocities), axis=-1)
+        target_velocities = np.where(normal_velocities < -VELOCITY_THRESHOLD, -self._pair_restitutions * normal_velocities, 0.0)
+        impulses = np.zeros(is_contacts.shape)
+
+        for _ in range(self.VELOCITY_ITERATIONS):
+            is_changed = False
+            for group in self._pair_groups:
+                normal_velocities = np.sum(normals[:, group] * (self._pair_coefficients[group] @ velocities), axis=-1)
+                new_impulses = np.where(is_contacts[:, group], np.maximum(impulses[:, group] + target_velocities[:, group] - normal_velocities, 0.0), 0.0)
+                velocities += self._pair_pushed_bodies[group].T @ ((new_impulses - impulses[:, group])[..., np.newaxis] * normals[:, group])
+                is_changed = is_changed or not np.allclose(new_impulses, impulses[:, group])
+                impulses[:, group] = new_impulses
+
+            if not is_changed:
+                break
+
+        return velocities
+
+    def _push_out(self, positions, normals, islands, weights, baumgarte, min_separation):
+        """Push shapes out of each other as position iterations of Box2D do on the two points of their contacts.
+        Only an overlap beyond linear slop is pushed out and only a fraction of it is pushed out at a time.
+        Contacts of an island are pushed out together until all of them are separated enough.
+
+        Parameters
+        --------------------
+        positions: ndarray
+            positions of bodies of some games
+
+        normals: ndarray
+            normal of each pair
+
+        islands: ndarray
+            island of contact of each pair (-1 if pair is not pushed out)
+
+        weights: ndarray
+            how much each body moves along normal of each pair when its gap grows by 1 (0 for a body that does not move)
+
+        baumgarte: float
+            fraction of overlap pushed out by a position iteration
+
+        min_separation: float
+            position iterations of an island stop once separations of its shapes (gap minus skins) are not below it
+
+        Return
+        --------------------
+        positions: ndarray
+            positions of bodies pushed out"""
+
+        positions = positions.copy()
+        weights = np.broadcast_to(weights, islands.shape + (3,))
+        island_idxs = np.maximum(islands, 0)
+        is_island_pushed = np.ones((islands.shape[0], 3), dtype=bool)
+
+        for _ in range(self.POSITION_ITERATIONS):
+            #Contacts of ball are pushed out before contacts of paddles, a point at a time.
+            is_pushed = (islands >= 0) & np.take_along_axis(is_island_pushed, island_idxs, axis=1)
+            separations = np.full(islands.shape, np.inf)
+            for group in self._pair_groups:
+                for _ in range(2):
+                    gaps = self._contact_gaps(positions, normals)
+                    separations[:, group] = np.minimum(separations[:, group], gaps[:, group] - TOTAL_RADIUS)
+                    corrections = np.clip(baumgarte * (gaps[:, group] - TOTAL_RADIUS + LINEAR_SLOP), -MAX_LINEAR_CORRECTION, 0.0)
+                    pushes = np.where(is_pushed[:, group], -corrections, 0.0)
+                    positions += np.einsum("np,npb,npk->nbk", pushes, weights[:, group], normals[:, group])
+
+            for island in range(3):
+                island_separations = np.min(np.where(islands == island, separations, np.inf), axis=1)
+                is_island_pushed[:, island] &= island_separations < min_separation
+            if not is_island_pushed.any():
+                break
+
+        return positions
+
+    @staticmethod
+    def _root_fractions(separations_start, separations_end):
+        """Get fractions of time intervals when separations that change linearly reach target separation.
+        Like root finder of Box2D, middle of interval is taken if it is within tolerance.
+
+        Parameters
+        --------------------
+        separations_start: ndarray
+            separations at start of intervals
+
+        separations_end: ndarray
+            separations at end of intervals (below target separation)
+
+        Return
+        --------------------
+        fractions: ndarray
+            fractions of time intervals"""
+
+        separations_middle = 0.5 * (separations_start + separations_end)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            roots = (separations_start - TARGET_SEPARATION) / (separations_start - separations_end)
+
+        return np.where(np.abs(separations_middle - TARGET_SEPARATION) < SEPARATION_TOLERANCE, 0.5, roots)
+
+    @staticmethod
+    def _advance(starts, alphas_start, ends, alphas):
+        """Get positions of bodies moving along their sweeps at some times of step.
+
+        Parameters
+        --------------------
+        starts: ndarray
+            positions at start of sweeps
+
+        alphas_start: ndarray
+            times (as fractions of step) of start of sweeps
+
+        ends: ndarray
+            positions at end of sweeps (end of step)
+
+        alphas: ndarray
+            times (as fractions of step)
+
+        Return
+        --------------------
+        positions: ndarray
+            positions at times"""
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fractions = np.where(alphas_start < 1.0, (alphas - alphas_start) / (1.0 - alphas_start), 1.0)
+
+        return starts + fractions[..., np.newaxis] * (ends - starts)
+
+    def _may_impact(self, starts, ends):
+        """Check which games may have an impact on a step: bounding boxes of sweeps of two bodies (or of a body and
+        a border) come closer than distance of a time of impact.
+
+        Parameters
+        --------------------
+        starts: ndarray
+            positions of bodies at start of step
+
+        ends: ndarray
+            positions of bodies at end of step
+
+        Return
+        --------------------
+        may_impact: ndarray
+            boolean array where element i is True if game i may have an impact"""
+
+        border_gaps = np.minimum(self._border_gaps(starts), self._border_gaps(ends))
+        deltas_start, _ = self._paddle_gaps(starts)
+        deltas_end, _ = self._paddle_gaps(ends)
+        min_deltas = np.where(deltas_start * deltas_end > 0, np.minimum(np.abs(deltas_start), np.abs(deltas_end)), 0.0)
+        paddle_gaps = np.max(min_deltas - (self._half_sizes[0] + self._half_sizes[1:]), axis=-1)
+
+        return np.any(np.concatenate([border_gaps, paddle_gaps], axis=1) < TARGET_SEPARATION + SEPARATION_TOLERANCE, axis=1)
+
+    def _border_impact_times(self, starts, alphas_start, ends):
+        """Get times of impact between bodies and borders of field, as b2TimeOfImpact finds them on sweeps of bodies.
+
+        Parameters
+        --------------------
+        starts: ndarray
+            positions of bodies at start of their sweeps
+
+        alphas_start: ndarray
+            times of start of sweeps of bodies
+
+        ends: ndarray
+            positions of bodies at end of step
+
+        Return
+        --------------------
+        alphas: ndarray
+            time of impact of each pair of a body and a border (1 if there is no impact)"""
+
+        gaps_start = self._border_gaps(starts)
+        gaps_end = self._border_gaps(ends)
+
+        betas = np.where(gaps_end <= TARGET_SEPARATION - SEPARATION_TOLERANCE, self._root_fractions(gaps_start, gaps_end), 1.0)
+        betas = np.where(gaps_start < TARGET_SEPARATION + SEPARATION_TOLERANCE, 0.0, betas)
+        betas = np.where(gaps_start <= 0.0, 1.0, betas)
+
+        alphas_start = alphas_start[:, self._border_bodies]
+        return alphas_start + (1.0 - alphas_start) * betas
+
+    def _paddle_impact_times(self, starts, alphas_start, ends):
+        """Get times of impact between ball and paddles, as b2TimeOfImpact finds them on sweeps of bodies: closest features
+        of two boxes (a face or a corner) give a separation axis, time is advanced to target separation along that axis
+        and features are found again until shapes are close enough.
+
+        Parameters
+        --------------------
+        starts: ndarray
+            positions of bodies at start of their sweeps
+
+        alphas_start: ndarray
+            times of start of sweeps of bodies
+
+        ends: ndarray
+            positions of bodies at end of step
+
+        Return
+        --------------------
+        alphas: ndarray
+            time of impact of ball with each paddle (1 if there is no impact)"""
+
+        #Both sweeps of a pair start at latest start.
+        alphas_pair = np.maximum(alphas_start[:, :1], alphas_start[:, 1:])
+        starts_pair = np.stack([self._advance(starts[:, [0, 0]], alphas_start[:, [0, 0]], ends[:, [0, 0]], alphas_pair),
+                                self._advance(starts[:, 1:], alphas_start[:, 1:], ends[:, 1:], alphas_pair)], axis=2)
+        deltas_start = starts_pair[:, :, 0] - starts_pair[:, :, 1]
+        deltas_end = ends[:, :1] - ends[:, 1:]
+        half_sizes = self._half_sizes[0] + self._half_sizes[1:]
+
+        betas = np.zeros(alphas_pair.shape)
+        is_hit = np.zeros(alphas_pair.shape, dtype=bool)
+        is_searched = np.ones(alphas_pair.shape, dtype=bool)
+
+        for _ in range(20):
+            deltas = deltas_start + betas[..., np.newaxis] * (deltas_end - deltas_start)
+            signs = np.where(deltas < 0, -1.0, 1.0)
+            gaps = np.abs(deltas) - half_sizes
+            is_corner = np.all(gaps > 0, axis=-1)
+            distances = np.where(is_corner, np.hypot(gaps[..., 0], gaps[..., 1]), np.max(gaps, axis=-1))
+
+            #Separation axis is from corner to corner or normal of closest face.
+            with np.errstate(divide="ignore", invalid="ignore"):
+                axes = np.where(is_corner[..., np.newaxis], signs * np.maximum(gaps, 0.0) / distances[..., np.newaxis], self._paddle_normals(deltas, gaps))
+            separations_end = np.sum(axes * (deltas_end - signs * half_sizes), axis=-1)
+
+            is_hit |= is_searched & (distances > 0.0) & (distances < TARGET_SEPARATION + SEPARATION_TOLERANCE)
+            is_searched &= (distances >= TARGET_SEPARATION + SEPARATION_TOLERANCE) & (separations_end <= TARGET_SEPARATION - SEPARATION_TOLERANCE)
+            if not is_searched.any():
+                break
+
+            fractions = self._root_fractions(distances, separations_end)
+            betas = np.where(is_searched, betas + fractions * (1.0 - betas), betas)
+
+        return np.where(is_hit, alphas_pair + (1.0 - alphas_pair) * betas, 1.0)
+
+    def _solve_impacts(self, idxs, pairs, alphas, starts, alphas_start, n_points, is_goal_touching, delta_time):
+        """Solve impacts of pairs of bodies at their time, as SolveTOI of Box2D does: bodies of an impact are advanced to its time,
+        where other contacts of them are updated, then they are solved together with contacts touching them.
+
+        Parameters
+        --------------------
+        idxs: ndarray
+            indices of games with an impact
+
+        pairs: ndarray
+            pair of bodies of impact of each game
+
+        alphas: ndarray
+            time of impact of each game
+
+        starts: ndarray
+            positions at start of sweeps of bodies (updated)
+
+        alphas_start: ndarray
+            times of start of sweeps of bodies (updated)
+
+        n_points: ndarray
+            points done by paddle 1 (column 0) or paddle 2 (column 1) (updated)
+
+        is_goal_touching: ndarray
+            True if ball is touching right border (column 0) or left border (column 1) (updated)
+
+        delta_time: float
+            delta time"""
+
+        rows = np.arange(idxs.size)
+        is_impact_bodies = self._pair_bodies[pairs]
+
+        #Bodies of impact are advanced to time of impact, where other contacts of them are updated.
+        positions = self._advance(starts[idxs], alphas_start[idxs], self._positions[idxs], alphas[:, np.newaxis])
+        starts[idxs] = np.where(is_impact_bodies[..., np.newaxis], positions, starts[idxs])
+        alphas_start[idxs] = np.where(is_impact_bodies, alphas[:, np.newaxis], alphas_start[idxs])
+
+        is_ball = is_impact_bodies[:, 0]
+        self._update_paddle_contacts(positions[is_ball], idxs[is_ball])
+        is_now_goal_touching = self._border_gaps(positions[is_ball])[:, [3, 2]] <= TOTAL_RADIUS
+        n_points[idxs[is_ball]] += is_now_goal_touching & ~is_goal_touching[idxs[is_ball]]
+        is_goal_touching[idxs[is_ball]] = is_now_goal_touching
+        for column in (0, 1):
+            is_paddle = is_impact_bodies[:, column + 1] & ~is_ball
+            self._update_paddle_contacts(positions[is_paddle], idxs[is_paddle], (column,))
+
+        #Island is impact and contacts touching its bodies. Only bodies of impact are pushed out, then velocities of island are solved.
+        normals = self._contact_normals(positions)
+        is_touching = np.concatenate([self._border_gaps(positions) <= TOTAL_RADIUS, self._is_touching[idxs]], axis=1)
+        is_island = is_touching & np.any(self._pair_bodies & is_impact_bodies[:, np.newaxis], axis=2)
+        is_island[rows, pairs] = True
+        is_island_bodies = np.any(is_island[..., np.newaxis] & self._pair_bodies, axis=1)
+
+        is_moved = (self._pair_pushed_bodies != 0) & is_impact_bodies[:, np.newaxis]
+        is_moved = np.where(np.any(is_moved, axis=2, keepdims=True), is_moved, self._pair_bodies & is_impact_bodies[:, np.newaxis])
+        positions = self._push_out(positions, normals, np.where(is_island, 0, -1), self._pair_coefficients * is_moved, TOI_BAUMGARTE, -1.5 * LINEAR_SLOP)
+        self._velocities[idxs] = self._solve_velocities(self._velocities[idxs], normals, is_island)
+
+        #Bodies of island move for rest of step.
+        ends = positions + ((1.0 - alphas) * delta_time)[:, np.newaxis, np.newaxis] * self._velocities[idxs]
+        starts[idxs] = np.where(is_island_bodies[..., np.newaxis], positions, starts[idxs])
+        alphas_start[idxs] = np.where(is_island_bodies, alphas[:, np.newaxis], alphas_start[idxs])
+        self._positions[idxs] = np.where(is_island_bodies[..., np.newaxis], ends, self._positions[idxs])
+
+    def step(self, actions, delta_time=1.0/60.0):
+        """Do update step of all games.
+
+        Parameters
+        --------------------
+        actions: ndarray
+            actions (MovingType values) of paddles. It is an array of shape (n_games, 2) where
+            column 0 is for left paddle and column 1 is for right paddle
+
+        delta_time: float, optional
+            delta time"""
+
+        actions = np.asarray(actions)
+        self.paddle_1_velocity[:, 0] = 0.0
+        self.paddle_1_velocity[:, 1] = self.ACTION_VELOCITIES[actions[:, 0]]
+        self.paddle_2_velocity[:, 0] = 0.0
+        self.paddle_2_velocity[:, 1] = self.ACTION_VELOCITIES[actions[:, 1]]
+
+        #Contacts are updated at start of step: contacts between ball and paddles begin or end, ball touching left or right border does a point.
+        all_idxs = np.arange(self._n_games)
+        self._update_paddle_contacts(self._positions, all_idxs)
+        normals = self._contact_normals(self._positions)
+        is_touching = np.concatenate([self._border_gaps(self._positions) <= TOTAL_RADIUS, self._is_touching], axis=1)
+        is_goal_touching = is_touching[:, [3, 2]]
+        n_points = is_goal_touching.astype(np.int64)
+
+        #Contacts touching are solved on this step: their velocities first, then bodies are moved and contacts are pushed out.
+        #A paddle touching the ball is on island of ball, otherwise it is on its own island.
+        idxs = np.flatnonzero(np.any(is_touching, axis=1))
+        self._velocities[idxs] = self._solve_velocities(self._velocities[idxs], normals[idxs], is_touching[idxs])
+        starts = self._positions.copy()
+        self._positions += delta_time * self._velocities
+
+        if idxs.size > 0:
+            body_islands = np.stack([np.zeros(idxs.size, dtype=np.int64), np.where(is_touching[idxs, -2], 0, 1), np.where(is_touching[idxs, -1], 0, 2)], axis=1)
+            islands = np.where(is_touching[idxs], body_islands[:, np.argmax(self._pair_pushed_bodies, axis=1)], -1)
+            self._positions[idxs] = self._push_out(self._positions[idxs], normals[idxs], islands, self._pair_coefficients * self._pair_pushed_bodies, BAUMGARTE, -3 * LINEAR_SLOP)
+
+        #Other contacts are found by their time of impact, earliest first. Each impact moves its bodies for rest of step.
+        alphas_start = np.zeros((self._n_games, 3))
+        n_impacts = np.zeros((self._n_games, self._n_pairs), dtype=np.int64)
+        idxs = np.flatnonzero(self._may_impact(starts, self._positions))
+        max_alpha = 1.0 - 10 * np.finfo(np.float32).eps
+
+        for _ in range(n_impacts.shape[1] * (MAX_SUB_STEPS + 1)):
+            alphas = np.concatenate([self._border_impact_times(starts[idxs], alphas_start[idxs], self._positions[idxs]),
+                                     self._paddle_impact_times(starts[idxs], alphas_start[idxs], self._positions[idxs])], axis=1)
+            alphas[n_impacts[idxs] > MAX_SUB_STEPS] = 1.0
+            pairs = np.argmin(alphas, axis=1)
+            alphas = alphas[np.arange(idxs.size), pairs]
+
+            is_impact = alphas < max_alpha
+            idxs, pairs, alphas = idxs[is_impact], pairs[is_impact], alphas[is_impact]
+            if idxs.size == 0:
+                break
+
+            n_impacts[idxs, pairs] += 1
+            self._solve_impacts(idxs, pairs, alphas, starts, alphas_start, n_points, is_goal_touching, delta_time)
+
+        #A point is done each time ball starts touching left or right border of field.
+        self.score_paddle_1 += n_points[:, 0]
+        self.score_paddle_2 += n_points[:, 1]
+
+        #Reset games where a point is done or ball is outside of field.
+        is_outside = np.any(np.abs(self.ball_position - self._center_field) > 0.5 * np.array([self._width_field, self._height_field]), axis=1)
+        self._reset_initial_state(np.any(n_points > 0, axis=1) | is_outside)
+
+    def is_ended(self):
+        """Check which game sessions are ended.
+
+        Return
+        --------------------
+        is_ended: ndarray
+            boolean array where element i is True if game i is ended, False otherwise"""
+
+        return (self.score_paddle_1 >= self._score_goal) | (self.score_paddle_2 >= self._score_goal)
@@ -1,23 +1,22 @@
+import json
 import pygame
+import importlib
+from time import perf_counter
+from collections import namedtuple
 from pygame.math import Vector2
 from pygame.locals import *
 
 from enum import Enum
 
 from pong.game import Game
+from pong.latency_timer import LatencyTimer
 from pong.controller.controller import PaddlePosition
 from pong.controller.player_controller import PlayerController
 from pong.controller.basic_bot_controller import BasicBotController
 from pong.controller.bot_controller import BotController
 
 from rl.common.sa.opponent_type import OpponentType
-from rl.deep_q_networks.dueling_ddqn.sa.dddqn_sa_controller import DuelingDDQNSAController
-from rl.deep_q_networks.dueling_ddqn.sa_per.dddqn_sa_per_controller import DuelingDDQN_PER_SAController
-
-from rl.deep_q_networks.dueling_ddqn.sp.dddqn_sp_controller import DuelingDDQNSPController
-from rl.deep_q_networks.dueling_ddqn.sp_per.dddqn_per_sp_controller import DuelingDDQN_PER_SPController
-
-from rl.deep_q_networks.ddqn.sp.ddqn_sp_controller import DDQNSPController
+from rl.deep_q_networks.common.inference_backend import InferenceBackend, Quantization
 
 class ControllerType(Enum):
     """Controller type to use for paddle."""
@@ -32,10 +31,45 @@ class ControllerType(Enum):
     DDQN_SP_BOT = 8                 #Bot controller that uses DDQN trained with self-play technique.
 
 
+LazyController = namedtuple("LazyController", ["module_name", "class_name", "is_single_agent"])
+"""A DQN controller imported only when it is used. A single agent controller plays right paddle against a bot."""
+
+DQN_CONTROLLER_REGISTRY = {ControllerType.DUELING_DDQN_SA_BOT: LazyController("rl.deep_q_networks.dueling_ddqn.sa.dddqn_sa_controller", "DuelingDDQNSAController", True),
+                           ControllerType.DUELING_DDQN_SP_BOT: LazyController("rl.deep_q_networks.dueling_ddqn.sp.dddqn_sp_controller", "DuelingDDQNSPController", False),
+                           ControllerType.DUELING_DDQN_PER_SA_BOT: LazyController("rl.deep_q_networks.dueling_ddqn.sa_per.dddqn_sa_per_controller", "DuelingDDQN_PER_SAController", True),
+                           ControllerType.DUELING_DDQN_PER_SP_BOT: LazyController("rl.deep_q_networks.dueling_ddqn.sp_per.dddqn_per_sp_controller", "DuelingDDQN_PER_SPController", False),
+                           ControllerType.DDQN_SA_BOT: LazyController("rl.deep_q_networks.ddqn.sa.ddqn_sa_controller", "DDQNSAController", True),
+                           ControllerType.DDQN_SP_BOT: LazyController("rl.deep_q_networks.ddqn.sp.ddqn_sp_controller", "DDQNSPController", False)}
+"""DQN controller of each controller type. Modules of DQN controllers import torch, so they are imported lazily to keep startup fast."""
+
+CONTROLLER_IMPORT_TIMES = {}
+"""Time (in seconds) spent to import module of each DQN controller type imported."""
+
+def import_dqn_controller(controller_type):
+    """Import class of a DQN controller, recording time spent on CONTROLLER_IMPORT_TIMES.
+    
+    Parameter
+    --------------------
+    controller_type: ControllerType
+        a DQN controller type
+        
+    Return
+    --------------------
+    controller_class: type
+        class of DQN controller"""
+    
+    entry = DQN_CONTROLLER_REGISTRY[controller_type]
+    start_time = perf_counter()
+    module = importlib.import_module(entry.module_name)
+    CONTROLLER_IMPORT_TIMES.setdefault(controller_type, perf_counter() - start_time)
+
+    return getattr(module, entry.class_name)
+
+
 class Pong:
     """A Pong application."""
 
-    def __init__(self, controller_1_type=ControllerType.PLAYER, controller_2_type=ControllerType.BOT):
+    def __init__(self, controller_1_type=ControllerType.PLAYER, controller_2_type=ControllerType.BOT, is_latency_hud_shown=False, latency_dump_path=None, ai_deadline=None, inference_backend=InferenceBackend.TORCH, quantization=Quantization.NONE, hot_reload_interval=None, hot_reload_path=None):
         """Create Pong application.
         
         Parameters
@@ -44,7 +78,30 @@ class Pong:
             controller type for left paddle
             
         contrller_2_type: ControllerType, optional
-            controller type for right paddle"""
+            controller type for right paddle
+            
+        is_latency_hud_shown: bool, optional
+            True to show latencies of each phase of a frame on screen (F3 toggles it while running)
+            
+        latency_dump_path: str, optional
+            path of file where a summary of latencies is written on exit. If it is None, nothing is written
+            
+        ai_deadline: float, optional
+            if it is not None, DQN controllers run inference on a worker thread and they follow the ball
+            when an action is not finished within this deadline (in seconds)
+            
+        inference_backend: InferenceBackend, optional
+            backend that evaluates models of DQN controllers. NUMPY backend does not import PyTorch
+            
+        quantization: Quantization, optional
+            quantization of weights of models of DQN controllers (torch backend only)
+            
+        hot_reload_interval: float, optional
+            if it is not None, DQN controllers check their model file every this interval (in seconds) and they swap in
+            its new weights between frames when it changes
+            
+        hot_reload_path: str, optional
+            model file watched by DQN controllers instead of their own (e.g. model saved by a training session running)"""
 
         self._is_running = False
         self._clock = pygame.time.Clock()
@@ -58,12 +115,38 @@ class Pong:
         #Font variables.
         self._font = None
         self._color_text = (255, 255, 255)
+        self._hud_font = None
+
+        #Latency variables.
+        self._latency_timers = {"controller_1": LatencyTimer(),         #Latency timer of each phase of a frame.
+                                "controller_2": LatencyTimer(),
+                                "game_update": LatencyTimer(),
+                                "render": LatencyTimer()}
+        self._is_latency_hud_shown = is_latency_hud_shown
+        self._latency_dump_path = latency_dump_path
 
         #Pong variables.
+        self._inference_backend = inference_backend
+        self._quantization = quantization
         self._current_game = Game()
         self._controller_1 = self._controller_factory(controller_1_type, PaddlePosition.LEFT, self._current_game)
         self._controller_2 = self._controller_factory(controller_2_type, PaddlePosition.RIGHT, self._current_game)
 
+        #DQN controllers run inference on a worker thread so that frame loop does not wait for it.
+        if ai_deadline is not None:
+            for controller in self._dqn_controllers():
+                controller.enable_async_inference(ai_deadline)
+
+        #DQN controllers follow new weights of their model file without restarting application.
+        if hot_reload_interval is not None:
+            for controller in self._dqn_controllers():
+                controller.enable_hot_reload(hot_reload_path, hot_reload_interval)
+
+    def _dqn_controllers(self):
+        """Get controllers that use Deep Q-Networks."""
+
+        return [controller for controller in (self._controller_1, self._controller_2) if hasattr(controller, "enable_async_inference")]
+
     def _controller_factory(self, controller_type, paddle_position, current_game):
         """Create a new controller specificed.
         
@@ -104,23 +187,15 @@ class Pong:
         #Bot Controller
         elif controller_type == ControllerType.BOT:
             return BotController(paddle_to_control, paddle_position, current_game)
-        #DDQN Bot Controller.
-        elif controller_type == ControllerType.DDQN_SP_BOT:
-            return DDQNSPController(paddle_position, current_game)
-        #Dueling DDQN Bot Controller.
-        elif controller_type == ControllerType.DUELING_DDQN_SP_BOT:
-            return DuelingDDQNSPController(paddle_position, current_game)
-        #Dueling DDQN Bot controller against BASIC_BOT or BOT
-        elif controller_type == ControllerType.DUELING_DDQN_SA_BOT:
-            check_controller_sa()
-            return DuelingDDQNSAController(current_game, get_opp_controller_sa())
-        #Dueling DDQN Bot controller (trained with PER) against BASIC_BOT or BOT
-        elif controller_type == ControllerType.DUELING_DDQN_PER_SA_BOT:
-            check_controller_sa()
-            return DuelingDDQN_PER_SAController(current_game, get_opp_controller_sa())
-        #Dueling DDQN Bot controller (trained PER and self-play method).
-        elif controller_type == ControllerType.DUELING_DDQN_PER_SP_BOT:
-            return DuelingDDQN_PER_SPController(paddle_position, current_game)
+        #DQN Bot Controller (either against BASIC_BOT or BOT or trained with self-play technique).
+        elif controller_type in DQN_CONTROLLER_REGISTRY:
+            if DQN_CONTROLLER_REGISTRY[controller_type].is_single_agent:
+                check_controller_sa()
+                return import_dqn_controller(controller_type)(current_game, get_opp_controller_sa(), backend=self._inference_backend, quantization=self._quantization)
+            else:
+                return import_dqn_controller(controller_type)(paddle_position, current_game, backend=self._inference_backend, quantization=self._quantization)
+        else:
+            raise ValueError("Controller type {} not supported.".format(controller_type))
 
 
     def _init(self):
@@ -130,9 +205,28 @@ class Pong:
         self._is_running = True
         self._window = pygame.display.set_mode((self._width_window, self._height_window), pygame.HWSURFACE | pygame.DOUBLEBUF)
         self._font = pygame.font.Font(None, 50)
+        self._hud_font = pygame.font.Font(None, 20)
 
     def _shutdown(self):
+        for controller in self._dqn_controllers():
+            controller.disable_async_inference()
+            controller.disable_hot_reload()
+
+        if self._latency_dump_path is not None:
+            self._dump_latencies()
+
         pygame.quit()
+
+    def _dump_latencies(self):
+        """Write a summary of latencies of each phase of a frame on file."""
+
+        latencies = {"frame_budget_ms": 1000 / self._fps_limit,
+                     "controller_import_ms": {controller_type.name: 1000 * import_time for controller_type, import_time in CONTROLLER_IMPORT_TIMES.items()}}
+        for name, timer in self._latency_timers.items():
+            latencies[name] = timer.summary()
+
+        with open(self._latency_dump_path, "w") as latency_file:
+            json.dump(latencies, latency_file, indent=4)
     
     def _translate_position(self, position):
         """Translate position of an object for pygame's surface coordinate.
@@ -170,6 +264,10 @@ class Pong:
         self._draw_rect(self._current_game.paddle_2.position, self._current_game.paddle_2.width, self._current_game.paddle_2.height)
         self._draw_rect(self._current_game.ball.position, self._current_game.ball.radius, self._current_game.ball.radius)
 
+        #Draw latencies.
+        if self._is_latency_hud_shown:
+            self._draw_latency_hud()
+
         #Put them on screen.
         pygame.display.flip()
 
@@ -194,6 +292,18 @@ class Pong:
         #Draw text
         self._window.blit(score_paddle_text, score_paddle_rect)
 
+    def _draw_latency_hud(self):
+        """Draw rolling percentiles of latency of each phase of a frame on screen."""
+
+        lines = ["frame budget = {:.2f} ms".format(1000 / self._fps_limit)]
+        for name, timer in self._latency_timers.items():
+            p50, p95, p99 = 1000 * timer.rolling_percentiles((50, 95, 99))
+            lines.append("{}: p50 = {:.2f} ms; p95 = {:.2f} ms; p99 = {:.2f} ms".format(name, p50, p95, p99))
+
+        for i, line in enumerate(lines):
+            line_text = self._hud_font.render(line, True, self._color_text)
+            self._window.blit(line_text, (10, self._height_window - 20 * (len(lines) - i)))
+
     def _draw_rect(self, position, width, height):
         """Draw a rectangle on screen.
         
@@ -235,17 +345,29 @@ class Pong:
 
         while self._is_running:
             #Update Pong and controllers states.
+            start_time = perf_counter()
             self._controller_1.update(1.0 / self._fps_limit)
+            controller_1_time = perf_counter()
             self._controller_2.update(1.0 / self._fps_limit)
+            controller_2_time = perf_counter()
             self._current_game.update(1.0 / self._fps_limit)
+            game_update_time = perf_counter()
 
             #Render.
             self._render()
+            render_time = perf_counter()
+
+            self._latency_timers["controller_1"].add(controller_1_time - start_time)
+            self._latency_timers["controller_2"].add(controller_2_time - controller_1_time)
+            self._latency_timers["game_update"].add(game_update_time - controller_2_time)
+            self._latency_timers["render"].add(render_time - game_update_time)
 
             #Check if Pong game is ended
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     self._is_running = False
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    self._is_latency_hud_shown = not self._is_latency_hud_shown
 
             if self._is_running:
                self._is_running = not self._current_game.is_ended()
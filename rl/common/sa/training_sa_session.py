@@ -16,13 +16,16 @@ MODEL_PATH = "./rl/models/self_play/"
 class TrainingSASession(TrainingSession):
     """A session for traning of a single agent on Pong."""
 
-    def __init__(self, opponent_type):
+    def __init__(self, opponent_type, action_repeat=1):
         """Create new training session.
         
         opponent_type: OpponentType
-            a opponent type against to train."""
+            a opponent type against to train.
+
+        action_repeat: int, optional
+            number of frames an action chosen by training bot is held (a transition is stored once every these frames)"""
         
-        super().__init__()
+        super().__init__(action_repeat)
 
         self.opponent_type = opponent_type
         self.history_rewards = []                   #History of previous match rewards.
@@ -27,6 +27,7 @@ class TrainingSPApp(TrainingApp):
         self._test_performance_games = test_performace_games
         self._p1_infos = ""                     #Training infos of left controller.
         self._p2_infos = ""                     #Infos of right controller.
+        self._test_games = []                   #Games reused on test phases.
 
     def _create_contact_listener(self):
         self._contact_listener = TrainSPPongContactListener()
@@ -55,9 +56,13 @@ class TrainingSPApp(TrainingApp):
         print("- Test Phase")
         
         n_test_games = 2
+        if len(self._test_games) == 0:
+            self._test_games = [Game() for _ in range(n_test_games)]
+
         for test_game in range(1, n_test_games+1):
-            #A new game session is created.
-            game = Game()
+            #A game session of pool is reset.
+            game = self._test_games[test_game-1]
+            game.reset()
 
             #Create controllers.
             test_bot_controller = self._create_test_bot_controller(game)
@@ -1,5 +1,4 @@
-from pong.ball import Ball
-from pong.paddle import Paddle
+from pong.game import ContactEvent
 
 from ..train_pong_cl import TrainPongContactListener
 
@@ -8,13 +7,16 @@ class TrainSPPongContactListener(TrainPongContactListener):
 
     controller_2 = None          #Controller (OpponentSPController) of right paddle.
 
-    def BeginContact(self, contact):
-        super().BeginContact(contact)
+    def __init__(self):
+        """Create new contact listener."""
 
-        #Does paddle start contact with ball?
-        if (isinstance(contact.fixtureA.userData, Paddle) and isinstance(contact.fixtureB.userData, Ball)) or (isinstance(contact.fixtureA.userData, Ball) and isinstance(contact.fixtureB.userData, Paddle)):
-            paddle = contact.fixtureA.userData if isinstance(contact.fixtureA.userData, Paddle) else contact.fixtureB.userData
+        super().__init__()
 
-            #Is controller_2's paddle?
-            if self.controller_2 is not None and self.current_game.paddle_2 == paddle:
-                self.controller_2.n_touch += 1
\ No newline at end of file
+        self.subscribe(ContactEvent.BEGIN_TOUCH, self._on_controller_2_begin_touch)
+
+    def _on_controller_2_begin_touch(self, paddle):
+        """Paddle starts contact with ball."""
+
+        #Is controller_2's paddle?
+        if self.controller_2 is not None and self.current_game.paddle_2 == paddle:
+            self.controller_2.n_touch += 1
\ No newline at end of file
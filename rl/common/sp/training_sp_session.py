@@ -30,7 +30,7 @@ class Policy:
 class TrainingSPSession(TrainingSession):
     """A session of training of an agent that uses self-play technique to learn playing on Pong."""
 
-    def __init__(self, n_policies, copy_policy_games, change_opp_policy_games, play_last_policy_prob):
+    def __init__(self, n_policies, copy_policy_games, change_opp_policy_games, play_last_policy_prob, action_repeat=1):
         """Create new training session.
         
         Parameters
@@ -45,9 +45,12 @@ class TrainingSPSession(TrainingSession):
             how many games a opponent policy is changed
             
         play_last_policy_prob: float
-            probability to play against last policy copied"""
+            probability to play against last policy copied
+
+        action_repeat: int, optional
+            number of frames an action chosen by training bot is held (a transition is stored once every these frames)"""
         
-        super().__init__()
+        super().__init__(action_repeat)
 
         self.n_policies = n_policies
         self.copy_policy_games = copy_policy_games
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from pong.game import Game
+from pong.controller.controller import MovingType
 
 from .train_pong_cl import TrainPongContactListener
 from .train_bot_controller import TrainingBotController
@@ -59,9 +60,12 @@ class TrainingApp(ABC):
         """Train bot."""
 
         while not self._training_session.is_ended():
-            #Create new game.
-            self._create_contact_listener()
-            self._current_game = Game(contact_listener=self._contact_listener)
+            #Create game only once, then it is reset for next games.
+            if self._current_game is None:
+                self._create_contact_listener()
+                self._current_game = Game(contact_listener=self._contact_listener)
+            else:
+                self._current_game.reset()
             self._current_game.start()
 
             #Create new controllers.
@@ -73,6 +77,15 @@ class TrainingApp(ABC):
 
             #Game is started.
             while not self._current_game.is_ended():
+                #Hold action of controller 1 for many frames, while controller 2 keeps updating every frame.
+                if isinstance(self._controller_1, TrainingBotController) and self._controller_1.action_repeat > 1:
+                    n_ticks_done, _ = self._current_game.step_many(self._controller_1.action_repeat, 
+                                                                   MovingType(self._controller_1.current_action), 
+                                                                   self._controller_2, 
+                                                                   self._time_step)
+                    self._controller_1.update(n_ticks_done * self._time_step)
+                    continue
+
                 #Update current game state.
                 self._current_game.update(self._time_step)
                 
@@ -87,8 +100,6 @@ class TrainingApp(ABC):
             print(self._get_infos())
 
             #Next game.
-            self._contact_listener = None
-            self._current_game = None
             self._controller_1 = None
             self._controller_2 = None
             self._training_session.episode += 1
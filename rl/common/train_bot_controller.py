@@ -6,7 +6,7 @@ from .utils import get_full_observation_normalized
 class TrainingBotController(Controller):
     """A base class for training a bot with Reinforcement Learning on Pong."""
 
-    def __init__(self, a_paddle, position, current_game, training_session, get_obs_fun=get_full_observation_normalized):
+    def __init__(self, a_paddle, position, current_game, training_session, get_obs_fun=get_full_observation_normalized, action_repeat=None):
         """Create new bot controller to be tranined.
         
         Parameters
@@ -24,18 +24,24 @@ class TrainingBotController(Controller):
             training session
             
         get_obs_fun: callable, optional
-            funtion to get a observation from a game session"""
+            funtion to get a observation from a game session
+            
+        action_repeat: int, optional
+            number of frames an action chosen is held, so model is queried and a transition is stored
+            once every action_repeat frames. If it is None, action repeat of training session is used"""
         
         super().__init__(a_paddle, position)
         self._opponent_paddle = current_game.paddle_2 if position == PaddlePosition.LEFT else current_game.paddle_1
         self._current_game = current_game
         self._training_session = training_session
         self._get_obs_fun = get_obs_fun
+        self._action_repeat = action_repeat if action_repeat is not None else training_session.action_repeat
 
         self._my_last_score = 0                 #My score of one update ago.
         self._last_opponent_score = 0           #Opponent score of one update ago.
         self.total_reward = 0                   #Total reward cumulated on this episode.
         self.n_touch = 0                        #Number of touch between my paddle and ball.
+        self._last_n_touch = 0                  #Number of touch of one update ago.
         self.is_colliding_ball = False          #True if colliding with ball, False otherwise.
 
         #Current infos state.
@@ -52,6 +58,14 @@ class TrainingBotController(Controller):
     @property
     def paddle(self):
         return self._paddle
+
+    @property
+    def action_repeat(self):
+        return self._action_repeat
+
+    @property
+    def current_action(self):
+        return self._current_action
     
     @abstractmethod
     def _chose_action(self):
@@ -79,8 +93,8 @@ class TrainingBotController(Controller):
         #Has opponent did a point?
         elif current_opponent_score > self._last_opponent_score:
             self._current_reward = -1.0
-        #Has this bot collided ball?
-        elif self.is_colliding_ball:
+        #Has this bot collided ball? With action repeat, a touch begun and ended during frames an action is held counts too.
+        elif self.is_colliding_ball or (self._action_repeat > 1 and self.n_touch > self._last_n_touch):
             self._current_reward = 0.1
         #Nothing happens.
         else:
@@ -99,6 +113,7 @@ class TrainingBotController(Controller):
         self._my_last_score       = self._current_game.score_paddle_1 if self._position == PaddlePosition.LEFT else self._current_game.score_paddle_2
         self._last_opponent_score = self._current_game.score_paddle_2 if self._position == PaddlePosition.LEFT else self._current_game.score_paddle_1
         self.total_reward        += self._current_reward
+        self._last_n_touch        = self.n_touch
         self._current_obs         = self._current_next_obs
         
         #Post train step.
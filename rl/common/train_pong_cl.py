@@ -1,31 +1,29 @@
-from pong.game import PongGameContactListener
-from pong.paddle import Paddle
-from pong.ball import Ball
+from pong.game import PongGameContactListener, ContactEvent
 
 class TrainPongContactListener(PongGameContactListener):
     """A base collision system listener used for training of agents with Reinforcement Learning on Pong."""
 
     controller_1 = None          #Controller (TrainingBotController) of left paddle.
 
-    def BeginContact(self, contact):
-        super().BeginContact(contact)
+    def __init__(self):
+        """Create new contact listener."""
 
-        #Does paddle start contact with ball?
-        if (isinstance(contact.fixtureA.userData, Paddle) and isinstance(contact.fixtureB.userData, Ball)) or (isinstance(contact.fixtureA.userData, Ball) and isinstance(contact.fixtureB.userData, Paddle)):
-            paddle = contact.fixtureA.userData if isinstance(contact.fixtureA.userData, Paddle) else contact.fixtureB.userData
+        super().__init__()
 
-            #Is controller_1's paddle?
-            if self.controller_1 is not None and self.controller_1.paddle == paddle:
-                self.controller_1.is_colliding_ball = True
-                self.controller_1.n_touch += 1
+        self.subscribe(ContactEvent.BEGIN_TOUCH, self._on_controller_1_begin_touch)
+        self.subscribe(ContactEvent.END_TOUCH, self._on_controller_1_end_touch)
 
-    def EndContact(self, contact):
-        super().EndContact(contact)
+    def _on_controller_1_begin_touch(self, paddle):
+        """Paddle starts contact with ball."""
 
-        #Does paddle end contact with ball?
-        if (isinstance(contact.fixtureA.userData, Paddle) and isinstance(contact.fixtureB.userData, Ball)) or (isinstance(contact.fixtureA.userData, Ball) and isinstance(contact.fixtureB.userData, Paddle)):
-            paddle = contact.fixtureA.userData if isinstance(contact.fixtureA.userData, Paddle) else contact.fixtureB.userData
+        #Is controller_1's paddle?
+        if self.controller_1 is not None and self.controller_1.paddle == paddle:
+            self.controller_1.is_colliding_ball = True
+            self.controller_1.n_touch += 1
 
-            #Is controller_1's paddle?
-            if self.controller_1 is not None and self.controller_1.paddle == paddle:
-                self.controller_1.is_colliding_ball = False
\ No newline at end of file
+    def _on_controller_1_end_touch(self, paddle):
+        """Paddle ends contact with ball."""
+
+        #Is controller_1's paddle?
+        if self.controller_1 is not None and self.controller_1.paddle == paddle:
+            self.controller_1.is_colliding_ball = False
\ No newline at end of file
@@ -3,10 +3,16 @@ from abc import ABC, abstractmethod
 class TrainingSession(ABC):
     """A session for training of agents on Pong."""
 
-    def __init__(self):
-        """Create new training session."""
+    def __init__(self, action_repeat=1):
+        """Create new training session.
+        
+        Parameter
+        --------------------
+        action_repeat: int, optional
+            number of frames an action chosen by a training bot is held (a transition is stored once every these frames)"""
 
         self.episode = 1            #Current episode.
+        self.action_repeat = action_repeat
 
     @abstractmethod
     def is_ended(self):
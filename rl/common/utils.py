@@ -1,5 +1,7 @@
 import numpy as np
 
+from math import sqrt
+
 from pygame.math import Vector2
 
 def normalize_position(a_position, field):
@@ -40,25 +42,34 @@ def get_full_observation(a_game):
     obs: ndarray
         full observation"""
     
-    paddle_1_pos = a_game.paddle_1.position
-    paddle_1_vel = a_game.paddle_1.velocity
-    paddle_2_pos = a_game.paddle_2.position
-    paddle_2_vel = a_game.paddle_2.velocity
-    ball_pos = a_game.ball.position
-    ball_vel = a_game.ball.velocity
-    
-    return np.array([paddle_1_pos.x,
-                     paddle_1_pos.y,
-                     paddle_1_vel.x,
-                     paddle_1_vel.y,
-                     paddle_2_pos.x, 
-                     paddle_2_pos.y,
-                     paddle_2_vel.x,
-                     paddle_2_vel.y,
-                     ball_pos.x,
-                     ball_pos.y,
-                     ball_vel.x,
-                     ball_vel.y])
+    return a_game.state.copy()
+
+def _normalize_velocity(vel_x, vel_y):
+    """Normalize a velocity of an object (zero if the object is still)."""
+
+    length_squared = vel_x * vel_x + vel_y * vel_y
+    if length_squared == 0:
+        return 0.0, 0.0
+
+    length = sqrt(length_squared)
+    return vel_x / length, vel_y / length
+
+def _full_observation_normalized_values(a_game):
+    """Get values of a full observation normalized from cached state of a Pong's game."""
+
+    p1_x, p1_y, p1_vel_x, p1_vel_y, p2_x, p2_y, p2_vel_x, p2_vel_y, ball_x, ball_y, ball_vel_x, ball_vel_y = a_game.state.tolist()
+    field = a_game.field
+    center = field.center_position
+    half_width = field.width/2
+    half_height = field.height/2
+
+    p1_vel_x, p1_vel_y = _normalize_velocity(p1_vel_x, p1_vel_y)
+    p2_vel_x, p2_vel_y = _normalize_velocity(p2_vel_x, p2_vel_y)
+    ball_vel_x, ball_vel_y = _normalize_velocity(ball_vel_x, ball_vel_y)
+
+    return [(p1_x - center.x) / half_width, (p1_y - center.y) / half_height, p1_vel_x, p1_vel_y,
+            (p2_x - center.x) / half_width, (p2_y - center.y) / half_height, p2_vel_x, p2_vel_y,
+            (ball_x - center.x) / half_width, (ball_y - center.y) / half_height, ball_vel_x, ball_vel_y]
 
 def get_full_observation_normalized(a_game):
         """Get a full observation normalized of a Pong's game.
@@ -73,25 +84,7 @@ def get_full_observation_normalized(a_game):
         obs: ndarray
             full observation normalized"""
         
-        paddle_1_pos = normalize_position(a_game.paddle_1.position, a_game.field)
-        paddle_1_vel = a_game.paddle_1.velocity.normalize() if a_game.paddle_1.velocity.length_squared() != 0 else Vector2()
-        paddle_2_pos = normalize_position(a_game.paddle_2.position, a_game.field)
-        paddle_2_vel = a_game.paddle_2.velocity.normalize() if a_game.paddle_2.velocity.length_squared() != 0 else Vector2()
-        ball_pos = normalize_position(a_game.ball.position, a_game.field)
-        ball_vel = a_game.ball.velocity.normalize() if a_game.ball.velocity.length_squared() != 0 else Vector2()
-        
-        return np.array([paddle_1_pos.x,
-                         paddle_1_pos.y,
-                         paddle_1_vel.x,
-                         paddle_1_vel.y,
-                         paddle_2_pos.x, 
-                         paddle_2_pos.y,
-                         paddle_2_vel.x,
-                         paddle_2_vel.y,
-                         ball_pos.x,
-                         ball_pos.y,
-                         ball_vel.x,
-                         ball_vel.y])
+        return np.array(_full_observation_normalized_values(a_game))
 
 def get_full_inverse_observation_normalized(a_game):
         """Get a full inverse observation normalized of a Pong's game.
@@ -106,6 +99,6 @@ def get_full_inverse_observation_normalized(a_game):
         obs: ndarray
             full inverse observation normalized"""
         
-        obs = get_full_observation_normalized(a_game)
+        obs = _full_observation_normalized_values(a_game)
 
         return np.array([-obs[4], obs[5], obs[6], obs[7], -obs[0], obs[1], obs[2], obs[3], -obs[8], obs[9], -obs[10], obs[11]])
\ No newline at end of file
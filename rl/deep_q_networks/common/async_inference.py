@@ -0,0 +1,95 @@
+import threading
+
+from time import perf_counter
+
+class AsyncInference:
+    """Inference of a policy on a worker thread. The frame loop submits the latest observation and reads
+    the most recent action finished without waiting for it, so a slow inference does not stall the frame loop."""
+
+    def __init__(self, choose_action, deadline=0.05):
+        """Create new async inference and start its worker thread.
+
+        Parameters
+        --------------------
+        choose_action: callable
+            function that chooses an action (int) from an observation
+
+        deadline: float, optional
+            maximum age (in seconds) of observation of an action finished to be still performed"""
+
+        self._choose_action = choose_action
+        self._deadline = deadline
+        self._condition = threading.Condition()
+        self._pending = None                #Latest observation submitted and not taken yet by worker, as (observation, submit time).
+        self._result = None                 #Most recent action finished, as (action, submit time of its observation).
+        self._error = None
+        self._n_missed_deadlines = 0
+        self._is_running = True
+        self._thread = threading.Thread(target=self._work, name="async-inference", daemon=True)
+        self._thread.start()
+
+    @property
+    def deadline(self):
+        return self._deadline
+
+    @property
+    def n_missed_deadlines(self):
+        return self._n_missed_deadlines
+
+    def submit(self, observation):
+        """Submit an observation. If worker is busy, it replaces the observation not taken yet by worker.
+
+        Parameter
+        --------------------
+        observation: ndarray
+            an observation"""
+
+        with self._condition:
+            self._pending = (observation, perf_counter())
+            self._condition.notify()
+
+    def latest_action(self):
+        """Get the most recent action finished.
+
+        Return
+        --------------------
+        action: int
+            most recent action finished or None if there is not any or its observation is older than deadline"""
+
+        if self._error is not None:
+            raise RuntimeError("inference of worker thread failed") from self._error
+
+        result = self._result
+        if result is None or perf_counter() - result[1] > self._deadline:
+            self._n_missed_deadlines += 1
+            return None
+
+        return result[0]
+
+    def close(self):
+        """Stop worker thread."""
+
+        with self._condition:
+            self._is_running = False
+            self._condition.notify()
+        self._thread.join()
+
+    def _work(self):
+        """Loop of worker thread."""
+
+        while True:
+            with self._condition:
+                while self._pending is None and self._is_running:
+                    self._condition.wait()
+
+                if not self._is_running:
+                    return
+
+                observation, submit_time = self._pending
+                self._pending = None
+
+            try:
+                self._result = (self._choose_action(observation), submit_time)
+            except Exception as error:
+                self._error = error
+                return
\ No newline at end of file
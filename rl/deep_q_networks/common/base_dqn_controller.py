@@ -0,0 +1,192 @@
+from abc import abstractmethod
+from pong.controller.controller import Controller, MovingType
+
+from rl.deep_q_networks.common.async_inference import AsyncInference
+from rl.deep_q_networks.common.hot_reload import ModelFileWatcher
+from rl.deep_q_networks.common.inference_backend import InferenceBackend, Quantization
+from rl.deep_q_networks.common.numpy_policy import NumpyDQNPolicy
+
+class BaseDQNBotController(Controller):
+    """A base class of an any version of Deep Q-Networks that is used by bot controller to play on Pong.
+    It chooses actions on a backend and it supports async inference and hot reload of model."""
+
+    def __init__(self, a_paddle, position, current_game, get_obs_fun, obs_size, backend=InferenceBackend.TORCH, quantization=Quantization.NONE):
+        """Create new controller.
+        
+        Parameter
+        --------------------
+        a_paddle: Paddle
+            a paddle to use with this controller
+
+        position: PaddlePosition
+            position of paddle that controller controls 
+
+        current_game: Game
+            current session game
+            
+        get_obs_fun: callable
+            funtion to get a observation from a game session
+            
+        obs_size: int
+            observation size
+            
+        backend: InferenceBackend, optional
+            backend that evaluates model
+            
+        quantization: Quantization, optional
+            quantization of weights of model (torch backend only)"""
+
+        super().__init__(a_paddle, position)
+
+        self._current_game = current_game
+        self._get_obs_fun = get_obs_fun
+        self._obs_size = obs_size
+        self._backend = backend
+        self._quantization = quantization
+        if backend == InferenceBackend.NUMPY and quantization != Quantization.NONE:
+            raise ValueError("quantization {} is supported by torch backend only".format(quantization.name))
+
+        self._model, self._inference = self._create_inference(self._model_path())
+        self._async_inference = None
+        self._model_watcher = None
+
+    @abstractmethod
+    def _model_path(self):
+        """Get path of model.
+        
+        Return
+        ------------------
+        path: str
+            path of .pth file of model"""
+        
+        pass
+
+    @abstractmethod
+    def _build_model(self, path):
+        """Build model.
+        
+        Parameter
+        ------------------
+        path: str
+            path of .pth file of model
+        
+        Return
+        ------------------
+        model: tc.nn.Module
+            model trained (used by torch backend)"""
+        
+        pass
+
+    def _create_inference(self, path):
+        """Load model of a file and create its inference on backend of controller.
+        
+        Parameter
+        --------------------
+        path: str
+            path of .pth file of model
+            
+        Returns
+        --------------------
+        model: tc.nn.Module
+            model loaded (None on numpy backend)
+            
+        inference: PolicyInference or NumpyDQNPolicy
+            inference of model"""
+
+        if self._backend == InferenceBackend.NUMPY:
+            return None, NumpyDQNPolicy.load(path)
+
+        #PyTorch is imported only by torch backend.
+        from rl.deep_q_networks.common.policy_inference import PolicyInference
+
+        model = self._build_model(path)
+        return model, PolicyInference(model)
+            
+    def enable_async_inference(self, deadline=0.05):
+        """Run inference on a worker thread. The controller performs the most recent action finished
+        and it follows the ball when no action is finished within deadline.
+        
+        Parameter
+        --------------------
+        deadline: float, optional
+            maximum age (in seconds) of observation of an action to be still performed"""
+
+        self.disable_async_inference()
+        self._async_inference = AsyncInference(self._choose_action, deadline)
+
+    def disable_async_inference(self):
+        """Stop worker thread of inference and go back to inference inside frame loop."""
+
+        if self._async_inference is not None:
+            self._async_inference.close()
+            self._async_inference = None
+
+    def enable_hot_reload(self, path=None, poll_interval=1.0):
+        """Watch a model file and swap in its new weights between frames whenever it changes (e.g. while a training saves it).
+        New weights are loaded on a background thread, so frames never wait for them.
+        
+        Parameters
+        --------------------
+        path: str, optional
+            path of .pth file watched (e.g. model saved by save_current_training_session()). If it is None, model file of controller is watched
+            
+        poll_interval: float, optional
+            time (in seconds) between two checks of file"""
+
+        self.disable_hot_reload()
+
+        watched_path = self._model_path() if path is None else path
+        self._model_watcher = ModelFileWatcher(watched_path, lambda: self._create_inference(watched_path), poll_interval, is_loaded=path is None)
+
+    def disable_hot_reload(self):
+        """Stop watching model file. Weights currently used are kept."""
+
+        if self._model_watcher is not None:
+            self._model_watcher.close()
+            self._model_watcher = None
+
+    @property
+    def model_watcher(self):
+        """Watcher of model file, None if hot reload is disabled."""
+
+        return self._model_watcher
+
+    def _choose_action(self, observation):
+        """Choose an action from an observation.
+        
+        Parameter
+        --------------------
+        observation: ndarray
+            an observation
+            
+        Return
+        --------------------
+        action: int
+            action choosen"""
+
+        return self._inference.choose_action(observation)
+            
+    def update(self, delta_time):
+        #Weights reloaded on background thread are swapped in between frames.
+        if self._model_watcher is not None:
+            reloaded = self._model_watcher.take_reloaded()
+            if reloaded is not None:
+                self._model, self._inference = reloaded
+
+        current_observation = self._get_obs_fun(self._current_game)
+
+        if self._async_inference is not None:
+            #Perform most recent action finished by worker thread or follow the ball if it missed deadline.
+            self._async_inference.submit(current_observation)
+            action = self._async_inference.latest_action()
+            if action is None:
+                self._follow_ball(self._current_game.ball.state.item(1), self._paddle.state.item(1))
+            else:
+                self._move_paddle(MovingType(action))
+            return
+        
+        #Choose action to perform.
+        action = self._choose_action(current_observation)
+
+        #Perform action choosen.
+        self._move_paddle(MovingType(action))
\ No newline at end of file
@@ -1,13 +1,12 @@
-import numpy as np
-import torch as tc
+from pong.controller.controller import PaddlePosition
 
-from abc import abstractmethod
-from pong.controller.controller import Controller, PaddlePosition, MovingType
+from rl.deep_q_networks.common.base_dqn_controller import BaseDQNBotController
+from rl.deep_q_networks.common.inference_backend import InferenceBackend, Quantization
 
-class BaseDQNSPBotController(Controller):
+class BaseDQNSPBotController(BaseDQNBotController):
     """A base class of an any version of Deep Q-Networks (agent trained with self-play technique) that is used by bot controller to play on Pong."""
 
-    def __init__(self, position, current_game, get_obs_fun, obs_size):
+    def __init__(self, position, current_game, get_obs_fun, obs_size, backend=InferenceBackend.TORCH, quantization=Quantization.NONE):
         """Create new controller.
         
         Parameter
@@ -22,34 +21,18 @@ class BaseDQNSPBotController(Controller):
             funtion to get a observation from a game session
             
         obs_size: int
-            observation size"""
-
-        super().__init__(current_game.paddle_1 if position == PaddlePosition.LEFT else current_game.paddle_2, 
-                         position)
-
-        self._current_game = current_game
-        self._get_obs_fun = get_obs_fun
-        self._obs_size = obs_size
-        self._model = self._build_model()
-
-    @abstractmethod
-    def _build_model(self):
-        """Build model.
-        
-        Return
-        ------------------
-        model: tc.nn.Module
-            model trained"""
-        
-        pass
+            observation size
             
-    def update(self, delta_time):
-        current_observation = self._get_obs_fun(self._current_game)
-        
-        #Choose action to perform.
-        x = tc.Tensor( np.array([current_observation]) ).to(self._model.device)
-        q = self._model.forward(x)
-        action = tc.argmax(q).item()
+        backend: InferenceBackend, optional
+            backend that evaluates model
+            
+        quantization: Quantization, optional
+            quantization of weights of model (torch backend only)"""
 
-        #Perform action choosen.
-        self._move_paddle(MovingType(action))
\ No newline at end of file
+        super().__init__(current_game.paddle_1 if position == PaddlePosition.LEFT else current_game.paddle_2, 
+                         position,
+                         current_game,
+                         get_obs_fun,
+                         obs_size,
+                         backend,
+                         quantization)
\ No newline at end of file
@@ -0,0 +1,206 @@
+import os
+import glob
+import hashlib
+import torch as tc
+
+from rl.deep_q_networks.common.inference_backend import Quantization
+from rl.deep_q_networks.common.quantized_models import quantize_model
+from rl.deep_q_networks.ddqn.sp.ddqn import DDQN
+from rl.deep_q_networks.dueling_ddqn.sp_per.dueling_ddqn import DuelingDDQN
+from rl.deep_q_networks.distillation.student_dqn import StudentDQN
+from rl.deep_q_networks.distillation.costants import MODEL_NAME as STUDENT_MODEL_NAME
+
+COMPILED_MODELS_PATH = "./rl/models/compiled/"
+"""Directory of compiled (TorchScript) artifacts of models. It is a cache, so it can be removed at any time."""
+
+_created_artifacts = {}
+"""Last artifact compiled by this process for each (path of .pth file, name of network class, quantization)."""
+
+def weights_hash(path):
+    """Get hash of a model file.
+
+    Parameter
+    --------------------
+    path: str
+        path of .pth file of model
+
+    Return
+    --------------------
+    weights_hash: str
+        SHA-256 of file"""
+
+    with open(path, "rb") as model_file:
+        return hashlib.sha256(model_file.read()).hexdigest()
+
+def compiled_model_path(network_class, path, weights_hash, quantization=Quantization.NONE, cache_path=COMPILED_MODELS_PATH):
+    """Get path of compiled (TorchScript) artifact of a model. It is stored on cache directory of artifacts and it is keyed
+    by class of network, by hash of its weights and by its quantization.
+
+    Parameters
+    --------------------
+    network_class: type
+        class of network (e.g. DuelingDDQN)
+
+    path: str
+        path of .pth file of model
+
+    weights_hash: str
+        hash of .pth file
+
+    quantization: Quantization, optional
+        quantization of weights
+
+    cache_path: str, optional
+        directory of artifacts
+
+    Return
+    --------------------
+    compiled_path: str
+        path of compiled artifact"""
+
+    name = "{}.{}.{}".format(os.path.splitext(os.path.basename(path))[0], network_class.__name__, weights_hash[:16])
+    if quantization != Quantization.NONE:
+        name += "." + quantization.name.lower()
+
+    return os.path.join(cache_path, name + ".pt")
+
+def load_model(network_class, obs_size, path, quantization=Quantization.NONE):
+    """Load an eager model from its .pth file. Weights are mapped on device of model, so a model saved on cuda is also loaded by a cpu only machine.
+
+    Parameters
+    --------------------
+    network_class: type
+        class of network (e.g. DuelingDDQN)
+
+    obs_size: int
+        observation size
+
+    path: str
+        path of .pth file of model
+
+    quantization: Quantization, optional
+        quantization of weights (a quantized model runs on cpu)
+
+    Return
+    --------------------
+    model: tc.nn.Module
+        model set for inference only"""
+
+    model = network_class(obs_size, use_cuda=quantization == Quantization.NONE)
+    model.load_state_dict(tc.load(path, map_location=model.device))
+    model.eval()
+    model.requires_grad_(False)
+
+    return quantize_model(model, quantization)
+
+def load_compiled_model(network_class, obs_size, path, weights_hash, quantization=Quantization.NONE, cache_path=COMPILED_MODELS_PATH):
+    """Load compiled artifact of a model if it is fresh, otherwise compile model again and store its artifact
+    (removing artifact of old weights of same model compiled by this process).
+
+    Parameters
+    --------------------
+    network_class: type
+        class of network (e.g. DuelingDDQN)
+
+    obs_size: int
+        observation size
+
+    path: str
+        path of .pth file of model
+
+    weights_hash: str
+        hash of .pth file
+
+    quantization: Quantization, optional
+        quantization of weights (a quantized model runs on cpu)
+
+    cache_path: str, optional
+        directory of artifacts
+
+    Returns
+    --------------------
+    model: tc.jit.ScriptModule
+        compiled model set for inference only
+
+    is_compiled_now: bool
+        True if artifact was stale or missing and model was compiled, False if artifact was loaded"""
+
+    compiled_path = compiled_model_path(network_class, path, weights_hash, quantization, cache_path)
+    device = tc.device("cuda:0" if tc.cuda.is_available() and quantization == Quantization.NONE else "cpu")
+
+    if os.path.exists(compiled_path):
+        try:
+            model = tc.jit.load(compiled_path, map_location=device)
+            model.eval()
+            return model, False
+        except (OSError, RuntimeError):
+            #Artifact removed or corrupted meanwhile by another process, it is compiled again.
+            pass
+
+    model = load_model(network_class, obs_size, path, quantization)
+    model = tc.jit.trace(model, tc.zeros((1, obs_size), device=device))
+
+    try:
+        #Artifact is written on a temporary file first, so other processes never load a partial one.
+        os.makedirs(cache_path, exist_ok=True)
+        temporary_path = "{}.{}.tmp".format(compiled_path, os.getpid())
+        tc.jit.save(model, temporary_path)
+        os.replace(temporary_path, compiled_path)
+    except OSError:
+        #Model is still usable when cache directory is read-only, it is compiled again next time.
+        return model, True
+
+    #Only artifacts compiled by this process are removed, artifacts of other processes may still be in use.
+    #Artifacts of other quantizations of same weights are still fresh.
+    key = (os.path.abspath(path), network_class.__name__, quantization)
+    stale_path = _created_artifacts.get(key)
+    if stale_path is not None and stale_path != compiled_path and os.path.exists(stale_path):
+        os.remove(stale_path)
+    _created_artifacts[key] = compiled_path
+
+    return model, True
+
+def export_compiled_models(models_path="./rl/models/", quantization=Quantization.NONE):
+    """Compile every model stored on a directory whose artifact is missing or stale.
+
+    Parameters
+    --------------------
+    models_path: str, optional
+        directory of models (searched recursively)
+
+    quantization: Quantization, optional
+        quantization of weights of artifacts
+
+    Return
+    --------------------
+    compiled_paths: list
+        paths of artifacts compiled now"""
+
+    compiled_paths = []
+    for path in sorted(glob.glob(os.path.join(models_path, "**", "*.pth"), recursive=True)):
+        #Network of a model is recognized from its weights (a student has same layers of DDQN, so it is recognized from its name).
+        state_dict = tc.load(path, map_location="cpu")
+        if "_value.weight" in state_dict:
+            network_class = DuelingDDQN
+        elif os.path.basename(path).startswith(STUDENT_MODEL_NAME):
+            network_class = StudentDQN
+        else:
+            network_class = DDQN
+        obs_size = state_dict["_fc1.weight"].shape[1]
+
+        file_hash = weights_hash(path)
+        _, is_compiled_now = load_compiled_model(network_class, obs_size, path, file_hash, quantization)
+        if is_compiled_now:
+            compiled_paths.append(compiled_model_path(network_class, path, file_hash, quantization))
+
+    return compiled_paths
+
+
+if __name__ == "__main__":
+    import sys
+
+    quantization = Quantization[sys.argv[1]] if len(sys.argv) > 1 else Quantization.NONE
+    compiled_paths = export_compiled_models(quantization=quantization)
+    for compiled_path in compiled_paths:
+        print("- compiled {}".format(compiled_path))
+    print("{} models compiled, other ones are up to date".format(len(compiled_paths)))
\ No newline at end of file
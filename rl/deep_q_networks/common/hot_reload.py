@@ -0,0 +1,98 @@
+import os
+import threading
+
+class ModelFileWatcher:
+    """Watch a model file on a background thread. When file changes, new model is loaded on same thread
+    and it is handed to controller, which swaps it in between frames. A frame never waits for a load."""
+
+    def __init__(self, path, load_fun, poll_interval=1.0, is_loaded=True):
+        """Create new watcher and start its thread.
+
+        Parameters
+        --------------------
+        path: str
+            path of .pth file watched
+
+        load_fun: callable
+            function without parameters that loads model of file (it is called on background thread)
+
+        poll_interval: float, optional
+            time (in seconds) between two checks of file
+
+        is_loaded: bool, optional
+            True if current content of file is already loaded, False to load it on first check"""
+
+        self._path = path
+        self._load_fun = load_fun
+        self._poll_interval = poll_interval
+        self._signature = self._file_signature() if is_loaded else None        #(mtime, size) of file content last loaded.
+        self._reloaded = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self.n_reloads = 0
+        self.n_failed_loads = 0
+        self.last_error = None
+
+        self._thread = threading.Thread(target=self._watch_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def path(self):
+        return self._path
+
+    def _file_signature(self):
+        """Get (mtime, size) of file, None if it does not exist."""
+
+        try:
+            stat = os.stat(self._path)
+        except FileNotFoundError:
+            return None
+
+        return stat.st_mtime_ns, stat.st_size
+
+    def _watch_forever(self):
+        """Check file until watcher is closed and load it when it changes."""
+
+        while not self._stop_event.wait(self._poll_interval):
+            signature = self._file_signature()
+            if signature is None or signature == self._signature:
+                continue
+
+            #A file still being written (e.g. by tc.save()) changes again within an interval, so it is loaded only once it is stable.
+            if self._stop_event.wait(self._poll_interval) or self._file_signature() != signature:
+                continue
+
+            #A file that cannot be loaded is retried only when it changes again, current model is kept meanwhile.
+            self._signature = signature
+            try:
+                reloaded = self._load_fun()
+            except Exception as error:
+                self.n_failed_loads += 1
+                self.last_error = error
+                continue
+
+            with self._lock:
+                self._reloaded = reloaded
+
+    def take_reloaded(self):
+        """Get model loaded since last call. It is meant to be called between frames.
+
+        Return
+        --------------------
+        reloaded: object
+            value returned by load function, None if file is not changed"""
+
+        if self._reloaded is None:
+            return None
+
+        with self._lock:
+            reloaded, self._reloaded = self._reloaded, None
+        self.n_reloads += 1
+
+        return reloaded
+
+    def close(self):
+        """Stop watching file."""
+
+        self._stop_event.set()
+        self._thread.join()
\ No newline at end of file
@@ -0,0 +1,12 @@
+from enum import Enum
+
+class InferenceBackend(Enum):
+    """Backend used by DQN controllers to evaluate their model."""
+    TORCH = 0           #Model is evaluated by PyTorch.
+    NUMPY = 1           #Model is evaluated by NumPy, without importing PyTorch.
+
+class Quantization(Enum):
+    """Quantization of weights of a model evaluated by torch backend."""
+    NONE = 0            #Weights are float32.
+    FLOAT16 = 1         #Weights of linear layers are float16.
+    INT8 = 2            #Weights of linear layers are int8, activations are quantized dynamically.
\ No newline at end of file
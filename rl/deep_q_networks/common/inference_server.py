@@ -0,0 +1,370 @@
+import os
+import threading
+import numpy as np
+
+from time import perf_counter
+from multiprocessing import Pipe
+from multiprocessing.connection import Listener, Client, wait
+
+from rl.deep_q_networks.common.inference_backend import Quantization
+from rl.deep_q_networks.common.numpy_policy import NumpyDQNPolicy
+
+def load_dqn_model(network_class, obs_size, path, quantization=Quantization.NONE):
+    """Load a trained Deep Q-Networks model through model registry of serving process.
+
+    Parameters
+    --------------------
+    network_class: type
+        class of network (e.g. DuelingDDQN)
+
+    obs_size: int
+        observation size
+
+    path: str
+        path of .pth file of model
+
+    quantization: Quantization, optional
+        quantization of weights of model
+
+    Return
+    --------------------
+    model: tc.nn.Module
+        model loaded"""
+
+    #PyTorch is imported only by torch models.
+    from rl.deep_q_networks.common.model_registry import MODEL_REGISTRY
+
+    return MODEL_REGISTRY.get(network_class, obs_size, path, is_compiled=True, quantization=quantization)
+
+def run_inference_server(model_factories, address, batch_window=0.002):
+    """Run an inference server on a Unix socket until its process is terminated. It is meant as target of a process.
+
+    Parameters
+    --------------------
+    model_factories: dict
+        function that builds a model for each model name. Functions must be picklable (e.g. functools.partial of load_dqn_model)
+
+    address: str
+        path of Unix socket
+
+    batch_window: float, optional
+        maximum time (in seconds) to wait for requests of other clients after first request of a batch"""
+
+    InferenceServer(model_factories, address, batch_window).serve_forever()
+
+
+class InferenceClient:
+    """A client of an inference server. A client has at most one request in progress."""
+
+    def __init__(self, connection):
+        """Create new client.
+
+        Parameter
+        --------------------
+        connection: Connection
+            connection to inference server"""
+
+        self._connection = connection
+
+    @classmethod
+    def connect(cls, address):
+        """Connect to an inference server listening on a Unix socket.
+
+        Parameter
+        --------------------
+        address: str
+            path of Unix socket
+
+        Return
+        --------------------
+        client: InferenceClient
+            client connected"""
+
+        return cls(Client(address, family="AF_UNIX"))
+
+    def submit(self, model_name, observation):
+        """Send an observation to choose an action without waiting for it.
+
+        Parameters
+        --------------------
+        model_name: str
+            name of model to use
+
+        observation: ndarray
+            an observation"""
+
+        self._connection.send((model_name, observation))
+
+    def receive(self):
+        """Wait for action of observation submitted.
+
+        Return
+        --------------------
+        action: int
+            action choosen"""
+
+        action = self._connection.recv()
+        if isinstance(action, Exception):
+            raise action
+
+        return action
+
+    def poll(self, timeout=0.0):
+        """Check if action of observation submitted is received.
+
+        Parameter
+        --------------------
+        timeout: float, optional
+            maximum time (in seconds) to wait for action
+
+        Return
+        --------------------
+        is_received: bool
+            True if action is received, False otherwise"""
+
+        return self._connection.poll(timeout)
+
+    def choose_action(self, model_name, observation):
+        """Choose an action from an observation.
+
+        Parameters
+        --------------------
+        model_name: str
+            name of model to use
+
+        observation: ndarray
+            an observation
+
+        Return
+        --------------------
+        action: int
+            action choosen"""
+
+        self.submit(model_name, observation)
+        return self.receive()
+
+    def close(self):
+        self._connection.close()
+
+
+class InferenceServer:
+    """A local server that chooses actions for many games. Requests of all clients received within a small
+    time window are batched and one forward pass per model is run, instead of a batch-of-one forward pass per game."""
+
+    def __init__(self, model_factories, address=None, batch_window=0.002):
+        """Create new inference server.
+
+        Parameters
+        --------------------
+        model_factories: dict
+            function that builds a model (tc.nn.Module or NumpyDQNPolicy) for each model name. Models are built by serving thread
+
+        address: str, optional
+            path of Unix socket where clients of other processes connect. If it is None, only clients
+            of this process can connect (see connect())
+
+        batch_window: float, optional
+            maximum time (in seconds) to wait for requests of other clients after first request of a batch"""
+
+        self._model_factories = model_factories
+        self._address = address
+        self._batch_window = batch_window
+        self._connections = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._listener = None
+        self._n_batches = 0
+        self._n_requests = 0
+
+    @property
+    def mean_batch_size(self):
+        """Mean number of requests answered by a batch."""
+
+        return self._n_requests / self._n_batches if self._n_batches > 0 else 0.0
+
+    @property
+    def n_clients(self):
+        """Number of clients connected."""
+
+        with self._lock:
+            return len(self._connections)
+
+    def connect(self):
+        """Connect a client of this process to server.
+
+        Return
+        --------------------
+        client: InferenceClient
+            client connected"""
+
+        client_connection, server_connection = Pipe()
+        with self._lock:
+            self._connections.append(server_connection)
+
+        return InferenceClient(client_connection)
+
+    def start(self):
+        """Serve on a daemon thread of this process."""
+
+        self._thread = threading.Thread(target=self.serve_forever, name="inference-server", daemon=True)
+        self._thread.start()
+
+    def close(self):
+        """Stop serving."""
+
+        self._stop_event.set()
+        if self._listener is not None:
+            self._listener.close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def serve_forever(self):
+        """Answer requests of clients until server is closed."""
+
+        models = {name: factory() for name, factory in self._model_factories.items()}
+
+        if self._address is not None:
+            if os.path.exists(self._address):
+                os.remove(self._address)
+            self._listener = Listener(self._address, family="AF_UNIX")
+            threading.Thread(target=self._accept_forever, name="inference-server-accept", daemon=True).start()
+
+        while not self._stop_event.is_set():
+            with self._lock:
+                connections = list(self._connections)
+
+            requests = self._collect_requests(connections)
+            if len(requests) > 0:
+                self._answer(models, requests)
+
+    def _accept_forever(self):
+        """Accept clients connecting to Unix socket."""
+
+        while not self._stop_event.is_set():
+            try:
+                connection = self._listener.accept()
+            except OSError:
+                return
+
+            with self._lock:
+                self._connections.append(connection)
+
+    def _collect_requests(self, connections):
+        """Collect a batch of requests. A batch is closed when its time window is elapsed or every client sent a request.
+
+        Parameter
+        --------------------
+        connections: list
+            connections of clients
+
+        Return
+        --------------------
+        requests: list
+            requests received, as (connection, model name, observation)"""
+
+        requests = []
+        pending = list(connections)
+        end_time = None
+        ready = wait(pending, timeout=0.05)
+
+        while len(ready) > 0:
+            for connection in ready:
+                pending.remove(connection)
+                try:
+                    request = connection.recv()
+                except (EOFError, OSError):
+                    #Client disconnected.
+                    self._drop_connection(connection)
+                    continue
+
+                try:
+                    model_name, observation = request
+                except (TypeError, ValueError):
+                    self._send(connection, ValueError("expected (model name, observation) request"))
+                    continue
+
+                requests.append((connection, model_name, observation))
+
+            if end_time is None:
+                end_time = perf_counter() + self._batch_window
+            remaining_time = end_time - perf_counter()
+            if len(pending) == 0 or remaining_time <= 0.0:
+                break
+
+            ready = wait(pending, timeout=remaining_time)
+
+        return requests
+
+    def _answer(self, models, requests):
+        """Choose actions of a batch of requests with one forward pass per model and send them to their clients.
+
+        Parameters
+        --------------------
+        models: dict
+            model of each model name
+
+        requests: list
+            requests received, as (connection, model name, observation)"""
+
+        requests_by_model = {}
+        for connection, model_name, observation in requests:
+            requests_by_model.setdefault(model_name, []).append((connection, observation))
+
+        for model_name, model_requests in requests_by_model.items():
+            if model_name not in models:
+                for connection, _ in model_requests:
+                    self._send(connection, KeyError("unknown model {}".format(model_name)))
+                continue
+
+            model = models[model_name]
+            try:
+                actions = self._choose_actions(model, [observation for _, observation in model_requests])
+            except Exception:
+                #A bad observation (e.g. wrong shape) fails whole batch, so requests are answered one by one
+                #and only clients of bad observations receive error.
+                actions = []
+                for _, observation in model_requests:
+                    try:
+                        actions.append(self._choose_actions(model, [observation])[0])
+                    except Exception as error:
+                        actions.append(RuntimeError("inference failed: {}".format(error)))
+
+            for (connection, _), action in zip(model_requests, actions):
+                self._send(connection, action)
+
+        self._n_batches += 1
+        self._n_requests += len(requests)
+
+    def _choose_actions(self, model, observations):
+        """Choose actions of observations with one forward pass of a model."""
+
+        #A NumPy policy evaluates one observation at a time.
+        if isinstance(model, NumpyDQNPolicy):
+            return [model.choose_action(observation) for observation in observations]
+
+        #PyTorch is imported only by torch models.
+        import torch as tc
+        from rl.deep_q_networks.common.policy_inference import model_device
+
+        #Q-values of a Dueling DDQN are shifted by mean advantage of whole batch, which does not change argmax of a row.
+        with tc.no_grad():
+            x = tc.Tensor( np.array(observations, dtype=np.float32) ).to(model_device(model))
+            return tc.argmax(model.forward(x), dim=1).tolist()
+
+    def _send(self, connection, message):
+        """Send an action (or an error) to a client. A client that is disconnected is dropped."""
+
+        try:
+            connection.send(message)
+        except (EOFError, OSError):
+            self._drop_connection(connection)
+
+    def _drop_connection(self, connection):
+        """Drop connection of a client disconnected."""
+
+        with self._lock:
+            if connection in self._connections:
+                self._connections.remove(connection)
+        connection.close()
\ No newline at end of file
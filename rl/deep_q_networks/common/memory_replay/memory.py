@@ -68,6 +68,16 @@ class Memory(ABC):
     def max_size(self):
         return self._max_size
 
+    def observations(self):
+        """Get observations stored on memory replay.
+        
+        Return
+        --------------------
+        obss: ndarray
+            observations stored (a view, not a copy)"""
+
+        return self._obss[:self._current_size]
+
     def _sample_batch_idxs(self, idxs_batch):
         """Sample batch from a indices specified.
         
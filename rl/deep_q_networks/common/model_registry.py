@@ -0,0 +1,129 @@
+import os
+import threading
+
+from collections import OrderedDict
+from rl.deep_q_networks.common.inference_backend import Quantization
+from rl.deep_q_networks.common.quantized_models import model_bytes
+from rl.deep_q_networks.common.compiled_models import weights_hash, load_model, load_compiled_model
+
+class ModelRegistry:
+    """A process-wide registry of trained models. Each model file is loaded once and its instance, set for inference
+    only, is shared by all controllers that use it. Least recently used models are evicted when memory used exceeds a cap."""
+
+    def __init__(self, max_bytes=256 * 2**20):
+        """Create new model registry.
+
+        Parameter
+        --------------------
+        max_bytes: int, optional
+            maximum memory (in bytes) of weights of models held. The most recent model is held even if it exceeds it"""
+
+        self._max_bytes = max_bytes
+        self._models = OrderedDict()        #Model of each (network class, observation size, path, file hash, is compiled, quantization), from least to most recently used.
+        self._model_bytes = {}
+        self._file_hashes = {}              #Hash of each path, as (mtime, size, hash), so a file is hashed again only if it changes.
+        self._lock = threading.Lock()
+        self._n_loads = 0
+
+    @property
+    def n_models(self):
+        return len(self._models)
+
+    @property
+    def n_loads(self):
+        """Number of model files loaded from disk."""
+
+        return self._n_loads
+
+    @property
+    def used_bytes(self):
+        """Memory (in bytes) of weights of models held."""
+
+        return sum(self._model_bytes.values())
+
+    def get(self, network_class, obs_size, path, is_compiled=False, quantization=Quantization.NONE):
+        """Get shared model of a file, loading it only if it is not held or the file is changed.
+        Model returned must not be trained or modified.
+
+        Parameters
+        --------------------
+        network_class: type
+            class of network (e.g. DuelingDDQN)
+
+        obs_size: int
+            observation size
+
+        path: str
+            path of .pth file of model
+
+        is_compiled: bool, optional
+            True to get compiled (TorchScript) model, loaded from its artifact on cache of compiled models if it is fresh
+
+        quantization: Quantization, optional
+            quantization of weights (a quantized model runs on cpu)
+
+        Return
+        --------------------
+        model: tc.nn.Module
+            model set for inference only"""
+
+        with self._lock:
+            file_hash = self._file_hash(path)
+            key = (network_class, obs_size, os.path.abspath(path), file_hash, is_compiled, quantization)
+            if key in self._models:
+                self._models.move_to_end(key)
+                return self._models[key]
+
+            #A file changed (e.g. a checkpoint watched by hot reload) makes models of its old content stale.
+            self._evict_stale(key[2], file_hash)
+
+            if is_compiled:
+                model, _ = load_compiled_model(network_class, obs_size, path, file_hash, quantization)
+            else:
+                model = load_model(network_class, obs_size, path, quantization)
+            self._n_loads += 1
+
+            self._models[key] = model
+            self._model_bytes[key] = model_bytes(model)
+            self._evict()
+
+            return model
+
+    def clear(self):
+        """Remove all models."""
+
+        with self._lock:
+            self._models.clear()
+            self._model_bytes.clear()
+            self._file_hashes.clear()
+
+    def _file_hash(self, path):
+        """Get hash of content of a file."""
+
+        stat = os.stat(path)
+        cached = self._file_hashes.get(path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
+        file_hash = weights_hash(path)
+        self._file_hashes[path] = (stat.st_mtime_ns, stat.st_size, file_hash)
+
+        return file_hash
+
+    def _evict_stale(self, path, file_hash):
+        """Evict models of a file loaded from a content different from current one."""
+
+        for key in [key for key in self._models if key[2] == path and key[3] != file_hash]:
+            del self._models[key]
+            del self._model_bytes[key]
+
+    def _evict(self):
+        """Evict least recently used models while memory used exceeds cap."""
+
+        while len(self._models) > 1 and self.used_bytes > self._max_bytes:
+            key, _ = self._models.popitem(last=False)
+            del self._model_bytes[key]
+
+
+MODEL_REGISTRY = ModelRegistry()
+"""Model registry shared by controllers of this process."""
\ No newline at end of file
@@ -0,0 +1,222 @@
+import os
+import pickle
+import zipfile
+import numpy as np
+
+from collections import OrderedDict
+
+
+# ==================================================
+# ================ GLOBAL VARIABLES ================
+# ==================================================
+
+_STORAGE_DTYPES = {"FloatStorage": np.float32,
+                   "DoubleStorage": np.float64,
+                   "HalfStorage": np.float16,
+                   "LongStorage": np.int64,
+                   "IntStorage": np.int32,
+                   "ShortStorage": np.int16,
+                   "CharStorage": np.int8,
+                   "ByteStorage": np.uint8,
+                   "BoolStorage": np.bool_}
+"""NumPy dtype of each storage type of PyTorch."""
+
+_STATE_DICTS = {}
+"""State dict of each (path, mtime, size) loaded."""
+
+
+# ==================================================
+# ============= LOADING OF .PTH FILES ==============
+# ==================================================
+
+def _rebuild_tensor(storage, storage_offset, size, stride, requires_grad=False, backward_hooks=None, metadata=None):
+    """Rebuild a tensor of a .pth file as ndarray."""
+
+    strides = [step * storage.itemsize for step in stride]
+    return np.lib.stride_tricks.as_strided(storage[storage_offset:], shape=size, strides=strides).copy()
+
+class _StateDictUnpickler(pickle.Unpickler):
+    """Unpickler of state dict of a .pth file (zip format of PyTorch) that rebuilds tensors as ndarrays."""
+
+    def __init__(self, file, archive, prefix, byteorder):
+        super().__init__(file)
+        self._archive = archive
+        self._prefix = prefix
+        self._byteorder = "<" if byteorder == "little" else ">"
+
+    def find_class(self, module, name):
+        if (module, name) == ("collections", "OrderedDict"):
+            return OrderedDict
+        elif (module, name) == ("torch._utils", "_rebuild_tensor_v2"):
+            return _rebuild_tensor
+        elif module == "torch" and name in _STORAGE_DTYPES:
+            return name
+
+        raise pickle.UnpicklingError("{}.{} is not supported by state dict of a .pth file".format(module, name))
+
+    def persistent_load(self, persistent_id):
+        _, storage_type, key, _, _ = persistent_id
+        data = self._archive.read(self._prefix + "data/" + key)
+
+        return np.frombuffer(data, dtype=np.dtype(_STORAGE_DTYPES[storage_type]).newbyteorder(self._byteorder))
+
+def load_state_dict(path):
+    """Load state dict of a model saved by PyTorch as ndarrays, without importing PyTorch. A file is read again only if it changes
+    (only last content of each file is held).
+
+    Parameter
+    --------------------
+    path: str
+        path of .pth file of model
+
+    Return
+    --------------------
+    state_dict: dict
+        ndarray of each parameter (read only, shared by all callers)"""
+
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    if key not in _STATE_DICTS:
+        with zipfile.ZipFile(path) as archive:
+            data_path = next(name for name in archive.namelist() if name.endswith("/data.pkl"))
+            prefix = data_path[:-len("data.pkl")]
+            byteorder = archive.read(prefix + "byteorder").decode() if prefix + "byteorder" in archive.namelist() else "little"
+
+            with archive.open(data_path) as data_file:
+                state_dict = _StateDictUnpickler(data_file, archive, prefix, byteorder).load()
+
+        for parameter in state_dict.values():
+            parameter.flags.writeable = False
+
+        #State dicts of older contents of same file (e.g. replaced by hot reload) are dropped, policies hold their own copy of weights.
+        for old_key in [old_key for old_key in _STATE_DICTS if old_key[0] == key[0]]:
+            del _STATE_DICTS[old_key]
+        _STATE_DICTS[key] = dict(state_dict)
+
+    return _STATE_DICTS[key]
+
+
+# ==================================================
+# ================= NUMPY POLICY ===================
+# ==================================================
+
+class NumpyDQNPolicy:
+    """Inference of a DDQN or Dueling DDQN model by NumPy on one observation at a time, with preallocated buffers."""
+
+    def __init__(self, state_dict):
+        """Create new NumPy policy.
+
+        Parameter
+        --------------------
+        state_dict: dict
+            ndarray of each parameter of a DDQN or Dueling DDQN model (see load_state_dict())"""
+
+        self._w1 = np.ascontiguousarray(state_dict["_fc1.weight"].T, dtype=np.float32)
+        self._b1 = state_dict["_fc1.bias"].astype(np.float32)
+        self._w2 = np.ascontiguousarray(state_dict["_fc2.weight"].T, dtype=np.float32)
+        self._b2 = state_dict["_fc2.bias"].astype(np.float32)
+
+        #Value and advantage heads of a Dueling DDQN are evaluated by one product, value is first output.
+        self._is_dueling = "_value.weight" in state_dict
+        if self._is_dueling:
+            head_weight = np.concatenate([state_dict["_value.weight"], state_dict["_advantage.weight"]])
+            head_bias = np.concatenate([state_dict["_value.bias"], state_dict["_advantage.bias"]])
+        else:
+            head_weight = state_dict["_out.weight"]
+            head_bias = state_dict["_out.bias"]
+        self._w_head = np.ascontiguousarray(head_weight.T, dtype=np.float32)
+        self._b_head = head_bias.astype(np.float32)
+
+        #Buffers.
+        self._x = np.zeros(self._w1.shape[0], dtype=np.float32)
+        self._h1 = np.zeros(self._w1.shape[1], dtype=np.float32)
+        self._h2 = np.zeros(self._w2.shape[1], dtype=np.float32)
+        self._head = np.zeros(self._w_head.shape[1], dtype=np.float32)
+        self._q = np.zeros(self._w_head.shape[1] - 1 if self._is_dueling else self._w_head.shape[1], dtype=np.float32)
+
+    @classmethod
+    def load(cls, path):
+        """Load a NumPy policy from a .pth file of a model.
+
+        Parameter
+        --------------------
+        path: str
+            path of .pth file of model
+
+        Return
+        --------------------
+        policy: NumpyDQNPolicy
+            policy loaded"""
+
+        return cls(load_state_dict(path))
+
+    def q_values(self, observation):
+        """Evaluate q-values of an observation.
+
+        Parameter
+        --------------------
+        observation: ndarray
+            an observation
+
+        Return
+        --------------------
+        q: ndarray
+            q-values of each action (a buffer overwritten by next evaluation)"""
+
+        self._x[:] = observation
+
+        np.matmul(self._x, self._w1, out=self._h1)
+        self._h1 += self._b1
+        np.maximum(self._h1, 0.0, out=self._h1)
+
+        np.matmul(self._h1, self._w2, out=self._h2)
+        self._h2 += self._b2
+        np.maximum(self._h2, 0.0, out=self._h2)
+
+        np.matmul(self._h2, self._w_head, out=self._head)
+        self._head += self._b_head
+
+        if self._is_dueling:
+            #Same aggregation of DuelingDDQN.forward: value + advantage - mean of advantage (mean of few values is cheaper on floats).
+            head = self._head.tolist()
+            np.add(self._head[1:], head[0] - sum(head[1:]) / len(self._q), out=self._q)
+        else:
+            self._q[:] = self._head
+
+        return self._q
+
+    def choose_action(self, observation):
+        """Choose best action of an observation.
+
+        Parameter
+        --------------------
+        observation: ndarray
+            an observation
+
+        Return
+        --------------------
+        action: int
+            action with highest q-value"""
+
+        return int(self.q_values(observation).argmax())
+
+    def choose_action_and_q(self, observation):
+        """Choose best action of an observation and get its q-value.
+
+        Parameter
+        --------------------
+        observation: ndarray
+            an observation
+
+        Returns
+        --------------------
+        action: int
+            action with highest q-value
+
+        q: float
+            q-value of action"""
+
+        q = self.q_values(observation)
+        action = int(q.argmax())
+
+        return action, float(q[action])
\ No newline at end of file
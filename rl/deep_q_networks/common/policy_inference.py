@@ -0,0 +1,93 @@
+import torch as tc
+
+def model_device(model):
+    """Get device of a model. A compiled (TorchScript) model has not device attribute of networks, so device of its parameters is used.
+    A quantized model has not float parameters and it runs on cpu.
+
+    Parameter
+    --------------------
+    model: tc.nn.Module
+        a model
+
+    Return
+    --------------------
+    device: tc.device
+        device of model"""
+
+    if hasattr(model, "device"):
+        return model.device
+
+    parameter = next(model.parameters(), None)
+    return parameter.device if parameter is not None else tc.device("cpu")
+
+class PolicyInference:
+    """Fast inference of a Deep Q-Networks model on one observation at a time. It runs without autograd tracking
+    and fills a preallocated input tensor in place, instead of building a new tensor for every observation."""
+
+    def __init__(self, model):
+        """Create new policy inference.
+
+        Parameter
+        --------------------
+        model: tc.nn.Module
+            a Deep Q-Networks model (or any variant)"""
+
+        self._model = model
+        self._x = None                      #Input tensor with shape (1, observation size), allocated on first observation.
+        self._x_numpy = None                #NumPy view of input tensor if it is on cpu.
+
+    @property
+    def model(self):
+        return self._model
+
+    def choose_action(self, observation):
+        """Choose best action of an observation.
+
+        Parameter
+        --------------------
+        observation: ndarray
+            an observation
+
+        Return
+        --------------------
+        action: int
+            action with highest q-value"""
+
+        with tc.inference_mode():
+            return int(tc.argmax(self._q_values(observation)))
+
+    def choose_action_and_q(self, observation):
+        """Choose best action of an observation and get its q-value.
+
+        Parameter
+        --------------------
+        observation: ndarray
+            an observation
+
+        Returns
+        --------------------
+        action: int
+            action with highest q-value
+
+        q: float
+            q-value of action"""
+
+        with tc.inference_mode():
+            q = self._q_values(observation)
+            action = int(tc.argmax(q))
+
+            return action, float(q[0, action])
+
+    def _q_values(self, observation):
+        """Evaluate q-values of an observation. It must be called in inference mode."""
+
+        if self._x is None:
+            self._x = tc.zeros((1, len(observation)), device=model_device(self._model))
+            self._x_numpy = self._x.numpy() if self._x.device.type == "cpu" else None
+
+        if self._x_numpy is not None:
+            self._x_numpy[0] = observation
+        else:
+            self._x[0].copy_(tc.from_numpy(observation))
+
+        return self._model.forward(self._x)
\ No newline at end of file
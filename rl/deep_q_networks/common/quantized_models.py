@@ -0,0 +1,60 @@
+import io
+import copy
+import torch as tc
+
+from torch.nn import Linear
+from rl.deep_q_networks.common.inference_backend import Quantization
+
+_QUANTIZED_DTYPES = {Quantization.FLOAT16: tc.float16,
+                     Quantization.INT8: tc.qint8}
+"""Dtype of weights of linear layers of each quantization."""
+
+def quantize_model(model, quantization):
+    """Get a dynamically quantized copy of a model, where linear layers use int8 or float16 weights.
+    A quantized model runs on cpu only.
+
+    Parameters
+    --------------------
+    model: tc.nn.Module
+        a Deep Q-Networks model (or any variant), not modified
+
+    quantization: Quantization
+        quantization of weights
+
+    Return
+    --------------------
+    quantized_model: tc.nn.Module
+        copy of model quantized and set for inference only (model itself if quantization is NONE)"""
+
+    if quantization == Quantization.NONE:
+        return model
+
+    quantized_model = copy.deepcopy(model).to("cpu")
+    if hasattr(quantized_model, "device"):
+        quantized_model.device = tc.device("cpu")
+    quantized_model.eval()
+    quantized_model.requires_grad_(False)
+
+    return tc.ao.quantization.quantize_dynamic(quantized_model, {Linear}, dtype=_QUANTIZED_DTYPES[quantization], inplace=True)
+
+def model_bytes(model):
+    """Get memory (in bytes) of weights of a model. Quantized layers hold packed weights instead of parameters,
+    so size of model serialized is used.
+
+    Parameter
+    --------------------
+    model: tc.nn.Module
+        a model (eager or compiled)
+
+    Return
+    --------------------
+    n_bytes: int
+        size of weights of model"""
+
+    buffer = io.BytesIO()
+    if isinstance(model, tc.jit.ScriptModule):
+        tc.jit.save(model, buffer)
+    else:
+        tc.save(model.state_dict(), buffer)
+
+    return buffer.getbuffer().nbytes
\ No newline at end of file
@@ -1,4 +1,5 @@
 from rl.common.sp.train_sp_app import TrainingSPApp
+from rl.deep_q_networks.common.inference_backend import Quantization
 
 from .dqn_opponent_sp_controller import DQNOpponentSPController
 from .test_dqn_sp_controller import TestDQNSPController
@@ -6,8 +7,26 @@ from .test_dqn_sp_controller import TestDQNSPController
 class BaseTrainDQNSPApp(TrainingSPApp):
     """Base application to train a bot that uses any variant of Deep Q-Networks and self-play technique."""
 
+    def __init__(self, training_session, test_performace_games, opponent_quantization=Quantization.NONE):
+        """Create new application for training.
+        
+        Parameter
+        --------------------
+        training_session: TrainingSPSession
+            a training session
+            
+        test_performance_games: int
+            how many games performance of training agent is tested
+            
+        opponent_quantization: Quantization, optional
+            quantization of weights of opponent's policies (policy of training agent is never quantized)"""
+
+        super().__init__(training_session, test_performace_games)
+
+        self._opponent_quantization = opponent_quantization
+
     def _create_controller_2(self):
-        self._controller_2 = DQNOpponentSPController(self._training_session, self._current_game, self._contact_listener)
+        self._controller_2 = DQNOpponentSPController(self._training_session, self._current_game, self._contact_listener, self._opponent_quantization)
 
     def _create_test_bot_controller(self, a_game):
         return TestDQNSPController(self._training_session, a_game)
\ No newline at end of file
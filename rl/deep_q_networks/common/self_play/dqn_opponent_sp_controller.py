@@ -1,18 +1,47 @@
-import numpy as np
-import torch as tc
+import weakref
 
 from rl.common.sp.opponent_sp_controller import OpponentSPController
+from rl.deep_q_networks.common.policy_inference import PolicyInference
+from rl.deep_q_networks.common.inference_backend import Quantization
+from rl.deep_q_networks.common.quantized_models import quantize_model
 from rl.common.utils import get_full_inverse_observation_normalized
 
+_QUANTIZED_MODELS = weakref.WeakKeyDictionary()
+"""Quantized copy of each (frozen) model of opponent's policies, as {quantization: quantized model}."""
+
 class DQNOpponentSPController(OpponentSPController):
     """A Deep Q-Networks (or any variant) controller used as opponent for training agent on Pong."""
 
+    def __init__(self, training_session, current_game, cl, quantization=Quantization.NONE):
+        """Create new controller.
+        
+        Parameters
+        --------------------
+        training_session: TrainingSPSession
+            training session
+            
+        current game: Game
+            current game of Pong
+            
+        cl: TrainSPPongContactListener
+            a contact listener for self-play technique
+            
+        quantization: Quantization, optional
+            quantization of weights of opponent's policy. A policy copied is not trained anymore,
+            so it is quantized once and reused by next games"""
+
+        super().__init__(training_session, current_game, cl)
+
+        model = self._policy.model
+        if quantization != Quantization.NONE:
+            quantized_models = _QUANTIZED_MODELS.setdefault(model, {})
+            if quantization not in quantized_models:
+                quantized_models[quantization] = quantize_model(model, quantization)
+            model = quantized_models[quantization]
+        self._inference = PolicyInference(model)
+
     def _chose_action(self):
         current_observation = get_full_inverse_observation_normalized(self._current_game)
         
-        #Chose action to perform.
-        x = tc.Tensor( np.array([current_observation]) ).to(self._policy.model.device)
-        q = self._policy.model.forward(x)
-        action = tc.argmax(q).item()
-
-        return action
\ No newline at end of file
+        #Choose action to perform.
+        return self._inference.choose_action(current_observation)
\ No newline at end of file
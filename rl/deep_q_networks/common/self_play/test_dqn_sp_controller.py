@@ -1,18 +1,26 @@
-import numpy as np
-import torch as tc
-
 from rl.common.sp.test_bot_controller import TestingBotController
+from rl.deep_q_networks.common.policy_inference import PolicyInference
 from rl.common.utils import get_full_observation_normalized
 
 class TestDQNSPController(TestingBotController):
     """A bot controller that uses Deep-Q Networks (or any variant) to test performance model."""
     
+    def __init__(self, training_session, a_game):
+        """Create new controller.
+        
+        Parameters
+        --------------------
+        training_session: TrainingSPSession
+            a training session
+            
+        a_game: Game
+            a game session"""
+
+        super().__init__(training_session, a_game)
+        self._inference = PolicyInference(self._policy.model)
+
     def _choose_action(self):
         current_observation = get_full_observation_normalized(self._current_game)
         
-        #Chose action to perform.
-        x = tc.Tensor( np.array([current_observation]) ).to(self._policy.model.device)
-        q = self._policy.model.forward(x)
-        action = tc.argmax(q).item()
-
-        return action
\ No newline at end of file
+        #Choose action to perform.
+        return self._inference.choose_action(current_observation)
\ No newline at end of file
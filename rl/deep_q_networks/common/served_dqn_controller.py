@@ -0,0 +1,36 @@
+from pong.controller.controller import Controller, PaddlePosition, MovingType
+
+class ServedDQNBotController(Controller):
+    """A bot controller whose actions are chosen by a model of an inference server, which batches requests of many games."""
+
+    def __init__(self, position, current_game, get_obs_fun, client, model_name):
+        """Create new controller.
+
+        Parameters
+        --------------------
+        position: PaddlePosition
+            position of paddle that controller controls
+
+        current_game: Game
+            current session game
+
+        get_obs_fun: callable
+            funtion to get a observation from a game session
+
+        client: InferenceClient
+            client of inference server. It must not be shared with other controllers
+
+        model_name: str
+            name of model of inference server to use"""
+
+        super().__init__(current_game.paddle_1 if position == PaddlePosition.LEFT else current_game.paddle_2,
+                         position)
+
+        self._current_game = current_game
+        self._get_obs_fun = get_obs_fun
+        self._client = client
+        self._model_name = model_name
+
+    def update(self, delta_time):
+        action = self._client.choose_action(self._model_name, self._get_obs_fun(self._current_game))
+        self._move_paddle(MovingType(action))
\ No newline at end of file
@@ -1,17 +1,18 @@
-import torch as tc
-
 from rl.deep_q_networks.common.base_dqn_sa_controller import BaseDQNSABotController
 from rl.common.sa.training_sa_session import MODEL_PATH
 
 from .costants import MODEL_NAME
-from .ddqn import DDQN
 
 class DDQNSAController(BaseDQNSABotController):
     """A bot that uses Deep Q-Networks (DDQN) to play against a (basic or high skill) bot on Pong."""
 
-    def _build_model(self):
-        model = DDQN(self._obs_size)
-        model.load_state_dict(tc.load(MODEL_PATH + MODEL_NAME + "_vs_" + self._opponent_type.name + ".pth"))
+    def _model_path(self):
+        return MODEL_PATH + MODEL_NAME + "_vs_" + self._opponent_type.name + ".pth"
+
+    def _build_model(self, path):
+        #PyTorch is imported only by torch backend.
+        from rl.deep_q_networks.common.model_registry import MODEL_REGISTRY
+        from .ddqn import DDQN
 
-        return model
+        return MODEL_REGISTRY.get(DDQN, self._obs_size, path, is_compiled=True, quantization=self._quantization)
         
\ No newline at end of file
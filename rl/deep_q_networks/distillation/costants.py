@@ -0,0 +1,8 @@
+MODEL_NAME = "pong_distilled_dqn_sp"
+"""File name of student model to save on disk"""
+
+TEACHER_MODEL_NAME = "pong_dueling_ddqn_sp_per"
+"""File name of teacher model distilled by default"""
+
+HIDDEN_SIZES = (16, 32, 64, 128)
+"""Hidden layer sizes of students trained, from smallest to largest"""
\ No newline at end of file
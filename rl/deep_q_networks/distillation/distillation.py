@@ -0,0 +1,253 @@
+import os
+import pickle
+import numpy as np
+import torch as tc
+
+from torch.optim import Adam
+from torch.nn.functional import softmax, log_softmax, kl_div, mse_loss
+
+from rl.common.utils import FULL_OBSERVATION_SIZE
+from rl.common.sa.opponent_type import OpponentType
+from rl.common.sp.training_sp_session import MODEL_PATH
+from rl.deep_q_networks.common.numpy_policy import NumpyDQNPolicy, load_state_dict
+from rl.deep_q_networks.common.policy_inference import PolicyInference
+from rl.deep_q_networks.ddqn.sp.ddqn import DDQN
+from rl.deep_q_networks.dueling_ddqn.sp_per.dueling_ddqn import DuelingDDQN
+
+from .costants import MODEL_NAME, TEACHER_MODEL_NAME, HIDDEN_SIZES
+from .student_dqn import StudentDQN
+from .evaluation import collect_observations, win_rate, inference_latency
+
+
+# ==================================================
+# =============== TRAINING OF STUDENT ==============
+# ==================================================
+
+def teacher_q_values(teacher, observations):
+    """Evaluate q-values of teacher on observations.
+
+    Parameters
+    --------------------
+    teacher: NumpyDQNPolicy
+        a teacher
+
+    observations: ndarray
+        observations with shape (number of observations, observation size)
+
+    Return
+    --------------------
+    q: ndarray
+        q-values of teacher with shape (number of observations, number of actions)"""
+
+    q = np.zeros((len(observations), len(teacher.q_values(observations[0]))), dtype=np.float32)
+    for i, observation in enumerate(observations):
+        q[i] = teacher.q_values(observation)
+
+    return q
+
+def train_student(observations, target_q, hidden_size, n_epochs=60, batch_size=256, lr=10**-3, temperature=0.003, q_weight=1.0, seed=0):
+    """Train a student to imitate a teacher. Its loss is KL divergence between action distributions of teacher and student
+    (softmax of q-values sharpened by temperature), so student learns action choices even where q-values of actions
+    are very close (gap between two best q-values of teacher is usually below 0.01), plus mean squared error of q-values,
+    so student learns also q-values of teacher.
+
+    Parameters
+    --------------------
+    observations: ndarray
+        observations with shape (number of observations, observation size)
+
+    target_q: ndarray
+        q-values of teacher on observations
+
+    hidden_size: int
+        size of hidden layers of student
+
+    n_epochs: int, optional
+        number of epochs
+
+    batch_size: int, optional
+        batch size
+
+    lr: float, optional
+        learning rate
+
+    temperature: float, optional
+        temperature of softmax of q-values
+
+    q_weight: float, optional
+        weight of mean squared error of q-values
+
+    seed: int, optional
+        seed of initialization and shuffling
+
+    Return
+    --------------------
+    student: StudentDQN
+        student trained and set for inference only"""
+
+    tc.manual_seed(seed)
+    rng = np.random.default_rng(seed)
+
+    student = StudentDQN(observations.shape[1], hidden_size=hidden_size)
+    optimizer = Adam(student.parameters(), lr=lr)
+    obss = tc.from_numpy(observations).to(student.device)
+    target_q = tc.from_numpy(target_q).to(student.device)
+    target_probs = softmax(target_q / temperature, dim=1)
+
+    student.train()
+    for _ in range(n_epochs):
+        idxs = tc.from_numpy(rng.permutation(len(obss))).to(student.device)
+        for start in range(0, len(idxs), batch_size):
+            idxs_batch = idxs[start:start+batch_size]
+            q = student.forward(obss[idxs_batch])
+
+            loss = kl_div(log_softmax(q / temperature, dim=1), target_probs[idxs_batch], reduction="batchmean") + q_weight * mse_loss(q, target_q[idxs_batch])
+
+            optimizer.zero_grad()
+            loss.backward()
+            optimizer.step()
+
+    student.eval()
+    student.requires_grad_(False)
+
+    return student
+
+def _numpy_policy(model):
+    """Get NumPy policy of a model."""
+
+    return NumpyDQNPolicy({name: parameter.cpu().numpy() for name, parameter in model.state_dict().items()})
+
+def _torch_cpu_inference(network_class, state_dict):
+    """Get inference by PyTorch on cpu of a model (interactive machines have not gpu)."""
+
+    model = network_class(FULL_OBSERVATION_SIZE, use_cuda=False)
+    model.load_state_dict({name: tc.from_numpy(parameter.copy()) for name, parameter in state_dict.items()})
+    model.eval()
+    model.requires_grad_(False)
+
+    return PolicyInference(model)
+
+
+# ==================================================
+# ============== DISTILLATION PIPELINE =============
+# ==================================================
+
+def _evaluate(name, policy, torch_inference, n_parameters, validation_obss, validation_actions, n_matches, seed):
+    """Evaluate a policy: agreement with actions of teacher, win rates and latency of inference."""
+
+    actions = np.array([policy.choose_action(observation) for observation in validation_obss])
+
+    return {"name": name,
+            "n_parameters": n_parameters,
+            "agreement": float(np.mean(actions == validation_actions)),
+            "win_rate_basic_bot": win_rate(policy, OpponentType.BASIC_BOT, n_matches, seed),
+            "win_rate_bot": win_rate(policy, OpponentType.BOT, n_matches, seed),
+            "numpy_call_us": 1e6 * inference_latency(policy, validation_obss[:5000]),
+            "torch_call_us": 1e6 * inference_latency(torch_inference, validation_obss[:5000])}
+
+def distill(teacher_path=MODEL_PATH + TEACHER_MODEL_NAME + ".pth", hidden_sizes=HIDDEN_SIZES, n_observations=100000, replay_observations=None, n_dagger_iterations=2, n_matches=40, tolerance=0.05, seed=0, **train_kwargs):
+    """Distill a teacher into students of several sizes and store smallest student that keeps strength of teacher.
+    A student trained only on states visited by teacher drifts to states never seen after its first mistakes, so
+    observations of matches played by student are labelled by teacher and student is trained again on all of them (DAgger).
+
+    Parameters
+    --------------------
+    teacher_path: str, optional
+        path of .pth file of teacher (DDQN or Dueling DDQN trained with self-play technique)
+
+    hidden_sizes: tuple, optional
+        hidden sizes of students, from smallest to largest
+
+    n_observations: int, optional
+        number of observations collected from matches of teacher against bots
+
+    replay_observations: ndarray, optional
+        other observations to train on (e.g. observations of a memory replay)
+
+    n_dagger_iterations: int, optional
+        number of times observations of matches of a student are added (each time n_observations/2 observations)
+
+    n_matches: int, optional
+        number of matches of win rates against each bot
+
+    tolerance: float, optional
+        maximum loss of win rate (against each bot) of a student stored compared to teacher
+
+    seed: int, optional
+        seed of matches and training
+
+    train_kwargs: dict
+        other parameters of train_student()
+
+    Returns
+    --------------------
+    reports: list
+        report of teacher and of each student. A report contains "name", "n_parameters", "agreement" (fraction of same actions of teacher
+        on validation observations), "win_rate_basic_bot", "win_rate_bot", "numpy_call_us" and "torch_call_us"
+
+    stored_name: str
+        name of student stored on MODEL_PATH as MODEL_NAME, None if no student keeps strength of teacher"""
+
+    #Observations are collected from matches (and memory replay) and labelled by teacher.
+    teacher_state_dict = load_state_dict(teacher_path)
+    teacher = NumpyDQNPolicy(teacher_state_dict)
+    observations = collect_observations(teacher, n_observations, seed)
+    if replay_observations is not None:
+        observations = np.concatenate([observations, replay_observations.astype(np.float32)])
+    target_q = teacher_q_values(teacher, observations)
+
+    #Validation observations come from other matches.
+    validation_obss = collect_observations(teacher, n_observations // 10, seed + 1)
+    validation_actions = teacher_q_values(teacher, validation_obss).argmax(axis=1)
+
+    teacher_class = DuelingDDQN if "_value.weight" in teacher_state_dict else DDQN
+    teacher_report = _evaluate("teacher", teacher, _torch_cpu_inference(teacher_class, teacher_state_dict),
+                               sum(parameter.size for parameter in teacher_state_dict.values()), validation_obss, validation_actions, n_matches, seed)
+    reports = [teacher_report]
+
+    stored_name = None
+    for hidden_size in hidden_sizes:
+        student_obss, student_q = observations, target_q
+        for iteration in range(n_dagger_iterations + 1):
+            student = train_student(student_obss, student_q, hidden_size, seed=seed, **train_kwargs)
+            student_policy = _numpy_policy(student)
+
+            #Observations of states visited by student are labelled by teacher.
+            if iteration < n_dagger_iterations:
+                new_obss = collect_observations(student_policy, n_observations // 2, seed + 2 + iteration, epsilon=0.1)
+                student_obss = np.concatenate([student_obss, new_obss])
+                student_q = np.concatenate([student_q, teacher_q_values(teacher, new_obss)])
+
+        student_state_dict = {name: parameter.cpu().numpy() for name, parameter in student.state_dict().items()}
+        report = _evaluate("student_h{}".format(hidden_size), student_policy, _torch_cpu_inference(StudentDQN, student_state_dict),
+                           sum(parameter.numel() for parameter in student.parameters()), validation_obss, validation_actions, n_matches, seed)
+        reports.append(report)
+
+        #Smallest student that keeps strength of teacher is stored.
+        if stored_name is None and all(report[key] >= teacher_report[key] - tolerance for key in ("win_rate_basic_bot", "win_rate_bot")):
+            os.makedirs(MODEL_PATH, exist_ok=True)
+            tc.save(student.state_dict(), MODEL_PATH + MODEL_NAME + ".pth")
+            stored_name = report["name"]
+
+    return reports, stored_name
+
+
+if __name__ == "__main__":
+    import sys
+
+    #Optional argument is a memory replay stored by a training session (e.g. memory_replay.pkl).
+    replay_observations = None
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], "rb") as memory_replay_file:
+            replay_observations = pickle.load(memory_replay_file).observations()
+
+    reports, stored_name = distill(replay_observations=replay_observations)
+    print("{:<12} {:>10} {:>10} {:>12} {:>8} {:>10} {:>10}".format("model", "parameters", "agreement", "vs basic bot", "vs bot", "numpy us", "torch us"))
+    for report in reports:
+        print("{:<12} {:>10} {:>10.2%} {:>12.0%} {:>8.0%} {:>10.1f} {:>10.1f}".format(report["name"], report["n_parameters"], report["agreement"],
+                report["win_rate_basic_bot"], report["win_rate_bot"], report["numpy_call_us"], report["torch_call_us"]))
+
+    if stored_name is None:
+        print("No student keeps strength of teacher, nothing is stored")
+    else:
+        print("{} is stored as {}".format(stored_name, MODEL_PATH + MODEL_NAME + ".pth"))
\ No newline at end of file
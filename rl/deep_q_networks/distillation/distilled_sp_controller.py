@@ -0,0 +1,50 @@
+import os
+
+from pong.controller.controller import PaddlePosition
+from rl.common.utils import get_full_observation_normalized, get_full_inverse_observation_normalized, FULL_OBSERVATION_SIZE
+from rl.common.sp.training_sp_session import MODEL_PATH
+from rl.deep_q_networks.common.base_dqn_sp_controller import BaseDQNSPBotController
+from rl.deep_q_networks.common.inference_backend import InferenceBackend, Quantization
+
+from .costants import MODEL_NAME
+
+class DistilledDQNSPController(BaseDQNSPBotController):
+    """A bot that uses a small network distilled from a Deep Q-Networks teacher to play on Pong (teacher trained with self-play technique).
+    No distilled model is shipped yet, so it is not a controller type of pong_app: its model is trained by distillation.py."""
+
+    def __init__(self, position, current_game, backend=InferenceBackend.TORCH, quantization=Quantization.NONE):
+        """Create new controller.
+
+        Parameters
+        --------------------
+        position: PaddlePosition
+            position of paddle that controller controls
+
+        current_game: Game
+            current session game
+
+        backend: InferenceBackend, optional
+            backend that evaluates model
+
+        quantization: Quantization, optional
+            quantization of weights of model (torch backend only)"""
+
+        if not os.path.exists(self._model_path()):
+            raise FileNotFoundError("distilled model {} is missing, train it with python -m rl.deep_q_networks.distillation.distillation".format(self._model_path()))
+
+        super().__init__(position,
+                         current_game,
+                         get_full_observation_normalized if position == PaddlePosition.LEFT else get_full_inverse_observation_normalized,
+                         FULL_OBSERVATION_SIZE,
+                         backend,
+                         quantization)
+
+    def _model_path(self):
+        return MODEL_PATH + MODEL_NAME + ".pth"
+
+    def _build_model(self, path):
+        #PyTorch is imported only by torch backend.
+        from rl.deep_q_networks.common.model_registry import MODEL_REGISTRY
+        from .student_dqn import StudentDQN
+
+        return MODEL_REGISTRY.get(StudentDQN, self._obs_size, path, is_compiled=True, quantization=self._quantization)
\ No newline at end of file
@@ -0,0 +1,189 @@
+import numpy as np
+
+from time import perf_counter
+
+from pong.game import Game, spawn_seeds
+from pong.controller.controller import Controller, PaddlePosition, MovingType
+from pong.controller.basic_bot_controller import BasicBotController
+from pong.controller.bot_controller import BotController
+
+from rl.common.sa.opponent_type import OpponentType
+from rl.common.utils import get_full_observation_normalized, get_full_inverse_observation_normalized
+
+
+# ==================================================
+# ================ GLOBAL VARIABLES ================
+# ==================================================
+
+SCORE_GOAL = 5
+"""Score to reach to win a match of evaluation."""
+
+MAX_TICKS = 36000
+"""Maximum number of ticks of a match. A match not ended within it is not won."""
+
+DELTA_TIME = 1.0 / 60.0
+"""Delta time of a tick."""
+
+
+# ==================================================
+# ================ MATCH FUNCTIONS =================
+# ==================================================
+
+class _PolicyController(Controller):
+    """Controller of right paddle that performs actions chosen by a policy (or random actions with probability epsilon)."""
+
+    def __init__(self, policy, current_game, epsilon, rng, observations):
+        super().__init__(current_game.paddle_2, PaddlePosition.RIGHT)
+
+        self._policy = policy
+        self._current_game = current_game
+        self._epsilon = epsilon
+        self._rng = rng
+        self._observations = observations
+
+    def update(self, delta_time):
+        observation = get_full_inverse_observation_normalized(self._current_game)
+        if self._observations is not None:
+            self._observations.append(get_full_observation_normalized(self._current_game))
+            self._observations.append(observation)
+
+        #Choose action to perform.
+        if self._epsilon > 0.0 and self._rng.uniform() < self._epsilon:
+            action = int(self._rng.integers(3))
+        else:
+            action = self._policy.choose_action(observation)
+
+        #Perform action choosen.
+        self._move_paddle(MovingType(action))
+
+def _create_opponent(opponent_type, game):
+    """Create a bot controller of left paddle."""
+
+    if opponent_type == OpponentType.BASIC_BOT:
+        return BasicBotController(game.paddle_1, PaddlePosition.LEFT, game.ball)
+
+    return BotController(game.paddle_1, PaddlePosition.LEFT, game)
+
+def play_match(policy, opponent_type, seed, epsilon=0.0, observations=None):
+    """Play a seeded match of a policy (right paddle) against a bot (left paddle).
+
+    Parameters
+    --------------------
+    policy: NumpyDQNPolicy or PolicyInference
+        a policy that chooses actions of right paddle from full inverse observations
+
+    opponent_type: OpponentType
+        bot that plays left paddle
+
+    seed: int or SeedSequence
+        seed of match
+
+    epsilon: float, optional
+        probability to perform a random action instead of action of policy
+
+    observations: list, optional
+        if it is not None, observations of both paddles are appended on it (left paddle as full observation
+        normalized, right paddle as full inverse observation normalized)
+
+    Return
+    --------------------
+    is_won: bool
+        True if policy won match, False otherwise"""
+
+    #Serves and random actions are drawn from independent streams.
+    game_seed, controller_seed = spawn_seeds(seed, 2)
+    game = Game(score_goal=SCORE_GOAL, seed=game_seed)
+    controller = _PolicyController(policy, game, epsilon, np.random.default_rng(controller_seed), observations)
+    opponent = _create_opponent(opponent_type, game)
+
+    game.start()
+    for _ in range(MAX_TICKS):
+        if game.is_ended():
+            break
+
+        controller.update(DELTA_TIME)
+        opponent.update(DELTA_TIME)
+        game.update(DELTA_TIME)
+
+    return game.score_paddle_2 >= SCORE_GOAL
+
+def win_rate(policy, opponent_type, n_matches=20, seed=0):
+    """Get win rate of a policy (right paddle) against a bot on seeded matches.
+
+    Parameters
+    --------------------
+    policy: NumpyDQNPolicy or PolicyInference
+        a policy that chooses actions of right paddle from full inverse observations
+
+    opponent_type: OpponentType
+        bot that plays left paddle
+
+    n_matches: int, optional
+        number of matches
+
+    seed: int, optional
+        seed of matches
+
+    Return
+    --------------------
+    win_rate: float
+        fraction of matches won"""
+
+    return float(np.mean([play_match(policy, opponent_type, match_seed) for match_seed in spawn_seeds(seed, n_matches)]))
+
+def collect_observations(policy, n_observations, seed=0, epsilon=0.2):
+    """Collect observations from matches of a policy against BasicBotController and BotController (alternated).
+    Random actions of policy widen states visited beyond its greedy trajectories.
+
+    Parameters
+    --------------------
+    policy: NumpyDQNPolicy or PolicyInference
+        a policy (usually teacher)
+
+    n_observations: int
+        minimum number of observations
+
+    seed: int, optional
+        seed of matches
+
+    epsilon: float, optional
+        probability of a random action of policy
+
+    Return
+    --------------------
+    obss: ndarray
+        observations collected with shape (number of observations, observation size)"""
+
+    observations = []
+    root_seed = np.random.SeedSequence(seed)
+    n_matches = 0
+    while len(observations) < n_observations:
+        opponent_type = OpponentType.BASIC_BOT if n_matches % 2 == 0 else OpponentType.BOT
+        play_match(policy, opponent_type, root_seed.spawn(1)[0], epsilon, observations)
+        n_matches += 1
+
+    return np.array(observations, dtype=np.float32)
+
+def inference_latency(policy, observations):
+    """Get mean latency of a policy on one observation at a time.
+
+    Parameters
+    --------------------
+    policy: NumpyDQNPolicy or PolicyInference
+        a policy
+
+    observations: ndarray
+        observations evaluated
+
+    Return
+    --------------------
+    latency: float
+        mean time (in seconds) of an inference"""
+
+    policy.choose_action(observations[0])
+
+    start_time = perf_counter()
+    for observation in observations:
+        policy.choose_action(observation)
+
+    return (perf_counter() - start_time) / len(observations)
\ No newline at end of file
@@ -0,0 +1,66 @@
+import torch as tc
+from torch.nn import Module, Linear
+from torch.nn.functional import relu
+
+class StudentDQN(Module):
+    """A small Deep Q-Networks distilled from a larger teacher (DDQN or Dueling DDQN). It has same layers of DDQN,
+    so it is evaluated by every backend of DDQN, but hidden layers are much smaller."""
+
+    def __init__(self, obs_size, use_cuda=True, hidden_size=32):
+        """Create new student.
+
+        Parameters
+        --------------------
+        obs_size: int
+            observation size
+
+        use_cuda: bool, optional
+            True if cuda is used, False otherwise
+
+        hidden_size: int, optional
+            size of hidden layers. It follows weights loaded by load_state_dict()"""
+
+        super(StudentDQN, self).__init__()
+
+        self._obs_size = obs_size
+        self.device = tc.device("cuda:0" if tc.cuda.is_available() and use_cuda else "cpu")
+        self._build(hidden_size)
+
+    def _build(self, hidden_size):
+        """Build layers with a hidden size."""
+
+        #Neural networks's architecture.
+        self.hidden_size = hidden_size
+        self._fc1 = Linear(self._obs_size, hidden_size)
+        self._fc2 = Linear(hidden_size, hidden_size)
+        self._out = Linear(hidden_size, 3)
+
+        # --------------------
+        self.to(self.device)
+
+    def load_state_dict(self, state_dict, strict=True):
+        #A student is loaded by model registry without knowing its hidden size, so layers are rebuilt when weights have another size.
+        hidden_size = state_dict["_fc1.weight"].shape[0]
+        if hidden_size != self.hidden_size:
+            self._build(hidden_size)
+
+        return super().load_state_dict(state_dict, strict)
+
+    def forward(self, x):
+        """Evalue x.
+
+        Parameter
+        --------------------
+        x: Tensor
+            a tensor
+
+        Return
+        --------------------
+        y: Tensor
+            x evalueted by student"""
+
+        v = relu(self._fc1(x))
+        v = relu(self._fc2(v))
+        y = self._out(v)
+
+        return y
\ No newline at end of file
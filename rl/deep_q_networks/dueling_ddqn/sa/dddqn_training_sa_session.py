@@ -17,7 +17,7 @@ from .dueling_ddqn import DuelingDDQN
 class DDDQNTrainingSASession(TrainingSASession):
     """A session for traning of a single agent thats uses Dueling DDQN."""
     
-    def __init__(self, n_episodes, opponent_type, mem_size, batch_size, update_rate_target, lr=10**-4, gamma=0.99, eps_init=1.0, eps_min=0.01, eps_decay=9.9*10**-6):
+    def __init__(self, n_episodes, opponent_type, mem_size, batch_size, update_rate_target, lr=10**-4, gamma=0.99, eps_init=1.0, eps_min=0.01, eps_decay=9.9*10**-6, action_repeat=1):
         """Create new Dueling DDQN training session.
         
         Parameters
@@ -49,9 +49,12 @@ class DDDQNTrainingSASession(TrainingSASession):
         eps_min: float, optional
             minimun epsilon value allowed
             
-        eps_decay: float, optional"""
+        eps_decay: float, optional
+
+        action_repeat: int, optional
+            number of frames an action chosen by training bot is held (a transition is stored once every these frames)"""
         
-        super().__init__(opponent_type)
+        super().__init__(opponent_type, action_repeat)
         self.n_episodes = n_episodes
         self.memory = UniformMemory(mem_size, FULL_OBSERVATION_SIZE)
         self.batch_size = batch_size
@@ -101,7 +104,8 @@ class DDDQNTrainingSASession(TrainingSASession):
                          "update_rate_target": self.update_rate_target,
                          "epsilon": self.epsilon,
                          "epsilon_min": self.epsilon_min,
-                         "epsilon_decay": self.epsilon_decay}
+                         "epsilon_decay": self.epsilon_decay,
+                         "action_repeat": self.action_repeat}
         
         training_session_file = open(TRAINING_SESSION_PATH + "training_session_infos.pkl", "wb")
         pickle.dump(current_infos, training_session_file)
@@ -136,6 +140,7 @@ class DDDQNTrainingSASession(TrainingSASession):
         self.epsilon            = last_infos["epsilon"]
         self.epsilon_min        = last_infos["epsilon_min"]
         self.epsilon_decay      = last_infos["epsilon_decay"]
+        self.action_repeat      = last_infos.get("action_repeat", 1)          #Missing on sessions saved before action repeat existed.
 
         self.optimizer = Adam(self.model.parameters(), lr=learning_rate)
 
@@ -16,7 +16,7 @@ from .dueling_ddqn import DuelingDDQN
 class DDDQNTraining_PER_SASession(TrainingSASession):
     """A session for traning of a single agent thats uses Dueling DDQN and prioritized memory replay."""
     
-    def __init__(self, n_episodes, opponent_type, mem_size, batch_size, update_rate_target, lr=10**-4, gamma=0.99, eps_init=1.0, eps_min=0.01, eps_decay=9.9*10**-6):
+    def __init__(self, n_episodes, opponent_type, mem_size, batch_size, update_rate_target, lr=10**-4, gamma=0.99, eps_init=1.0, eps_min=0.01, eps_decay=9.9*10**-6, action_repeat=1):
         """Create new Dueling DDQN training session.
         
         Parameters
@@ -48,9 +48,12 @@ class DDDQNTraining_PER_SASession(TrainingSASession):
         eps_min: float, optional
             minimun epsilon value allowed
             
-        eps_decay: float, optional"""
+        eps_decay: float, optional
+
+        action_repeat: int, optional
+            number of frames an action chosen by training bot is held (a transition is stored once every these frames)"""
         
-        super().__init__(opponent_type)
+        super().__init__(opponent_type, action_repeat)
         self.n_episodes = n_episodes
         self.memory = ProportionalPrioritizedMemory(mem_size, FULL_OBSERVATION_SIZE)
         self.batch_size = batch_size
@@ -99,7 +102,8 @@ class DDDQNTraining_PER_SASession(TrainingSASession):
                          "update_rate_target": self.update_rate_target,
                          "epsilon": self.epsilon,
                          "epsilon_min": self.epsilon_min,
-                         "epsilon_decay": self.epsilon_decay}
+                         "epsilon_decay": self.epsilon_decay,
+                         "action_repeat": self.action_repeat}
         
         training_session_file = open(TRAINING_SESSION_PATH + "training_session_infos.pkl", "wb")
         pickle.dump(current_infos, training_session_file)
@@ -134,6 +138,7 @@ class DDDQNTraining_PER_SASession(TrainingSASession):
         self.epsilon            = last_infos["epsilon"]
         self.epsilon_min        = last_infos["epsilon_min"]
         self.epsilon_decay      = last_infos["epsilon_decay"]
+        self.action_repeat      = last_infos.get("action_repeat", 1)          #Missing on sessions saved before action repeat existed.
 
         self.optimizer = Adam(self.model.parameters(), lr=learning_rate)
 
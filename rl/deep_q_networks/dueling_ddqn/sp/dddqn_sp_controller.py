@@ -1,17 +1,15 @@
-import torch as tc
-
 from pong.controller.controller import PaddlePosition
 from rl.common.utils import get_full_observation_normalized, get_full_inverse_observation_normalized, FULL_OBSERVATION_SIZE
 from rl.common.sp.training_sp_session import MODEL_PATH
 from rl.deep_q_networks.common.base_dqn_sp_controller import BaseDQNSPBotController
+from rl.deep_q_networks.common.inference_backend import InferenceBackend, Quantization
 
 from .costants import MODEL_NAME
-from .dueling_ddqn import DuelingDDQN
 
 class DuelingDDQNSPController(BaseDQNSPBotController):
     """A bot that uses Dueling Deep Q-Networks (Dueling DDQN) to play on Pong (trained with self-play technique)."""
 
-    def __init__(self, position, current_game):
+    def __init__(self, position, current_game, backend=InferenceBackend.TORCH, quantization=Quantization.NONE):
         """Create new controller.
 
         Parameters
@@ -20,15 +18,27 @@ class DuelingDDQNSPController(BaseDQNSPBotController):
             position of paddle that controller controls
 
         current_game: Game
-            current session game"""
+            current session game
+            
+        backend: InferenceBackend, optional
+            backend that evaluates model
+            
+        quantization: Quantization, optional
+            quantization of weights of model (torch backend only)"""
         
         super().__init__(position, 
                          current_game, 
                          get_full_observation_normalized if position == PaddlePosition.LEFT else get_full_inverse_observation_normalized, 
-                         FULL_OBSERVATION_SIZE)
+                         FULL_OBSERVATION_SIZE,
+                         backend,
+                         quantization)
+
+    def _model_path(self):
+        return MODEL_PATH + MODEL_NAME + ".pth"
 
-    def _build_model(self):
-        model = DuelingDDQN(self._obs_size)
-        model.load_state_dict(tc.load(MODEL_PATH + MODEL_NAME + ".pth"))
+    def _build_model(self, path):
+        #PyTorch is imported only by torch backend.
+        from rl.deep_q_networks.common.model_registry import MODEL_REGISTRY
+        from .dueling_ddqn import DuelingDDQN
 
-        return model
\ No newline at end of file
+        return MODEL_REGISTRY.get(DuelingDDQN, self._obs_size, path, is_compiled=True, quantization=self._quantization)
\ No newline at end of file
@@ -3,6 +3,7 @@ import torch as tc
 
 from pong.controller.controller import PaddlePosition
 from rl.common.train_bot_controller import TrainingBotController
+from rl.deep_q_networks.common.policy_inference import PolicyInference
 
 class DuelingDDQNTraininingSPBotController(TrainingBotController):
     """A bot controller that uses Dueling Double Deep Q-Networks (Dueling DDQN) to be trained on Pong and self-play technique."""
@@ -19,20 +20,18 @@ class DuelingDDQNTraininingSPBotController(TrainingBotController):
             training session"""
 
         self._rng = np.random.default_rng()
+        self._inference = PolicyInference(training_session.model)
            
         super().__init__(current_game.paddle_1, PaddlePosition.LEFT, current_game, training_session)
         self._training_session.states_done = 0
 
     def _chose_action(self):
-        x = tc.Tensor( np.array([self._current_obs]) ).to(self._training_session.model.device)
-        q = self._training_session.model.forward(x)
-
         if self._rng.uniform() <= self._training_session.epsilon:
-            #A random action is choosen.
+            #A random action is choosen (model is not evaluated).
             action = self._rng.integers(0, 3)
         else:
             #Best action is choosen.
-            action = tc.argmax(q).item()
+            action = self._inference.choose_action(self._current_obs)
 
         self._current_action = action
 
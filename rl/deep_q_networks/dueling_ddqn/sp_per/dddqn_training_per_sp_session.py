@@ -38,7 +38,7 @@ class DuelingDDQNPolicy(Policy):
 class DuelingDDQNTraining_PER_SPSession(TrainingSPSession):
     """A session for traning of an agent thats uses Dueling DDQN with self-play method and prioritized memory replay."""
     
-    def __init__(self, n_episodes, mem_size, batch_size, update_rate_target, lr=10**-4, gamma=0.99, eps_init=1.0, eps_min=0.01, eps_decay=9.9*10**-6, n_policies=8, copy_policy_games=20, change_opp_policy_games=10, play_last_policy_prob=0.5):
+    def __init__(self, n_episodes, mem_size, batch_size, update_rate_target, lr=10**-4, gamma=0.99, eps_init=1.0, eps_min=0.01, eps_decay=9.9*10**-6, n_policies=8, copy_policy_games=20, change_opp_policy_games=10, play_last_policy_prob=0.5, action_repeat=1):
         """Create new Dueling DDQN training session with self-play method.
         
         Parameters
@@ -80,9 +80,12 @@ class DuelingDDQNTraining_PER_SPSession(TrainingSPSession):
             how many games a opponent policy is changed
             
         play_last_policy_prob: float, optional
-            probability to play against last policy copied"""
+            probability to play against last policy copied
+
+        action_repeat: int, optional
+            number of frames an action chosen by training bot is held (a transition is stored once every these frames)"""
         
-        super().__init__(n_policies, copy_policy_games, change_opp_policy_games, play_last_policy_prob)
+        super().__init__(n_policies, copy_policy_games, change_opp_policy_games, play_last_policy_prob, action_repeat)
 
         self.n_episodes = n_episodes
         self.memory = ProportionalPrioritizedMemory(mem_size, FULL_OBSERVATION_SIZE)
@@ -138,6 +141,7 @@ class DuelingDDQNTraining_PER_SPSession(TrainingSPSession):
                          "epsilon": self.epsilon,
                          "epsilon_min": self.epsilon_min,
                          "epsilon_decay": self.epsilon_decay,
+                         "action_repeat": self.action_repeat,
                          "n_policies": self.n_policies,
                          "copy_policy_games": self.copy_policy_games,
                          "change_opp_policy_games": self.change_opp_policy_games,
@@ -174,6 +178,7 @@ class DuelingDDQNTraining_PER_SPSession(TrainingSPSession):
         self.epsilon                    = last_infos["epsilon"]
         self.epsilon_min                = last_infos["epsilon_min"]
         self.epsilon_decay              = last_infos["epsilon_decay"]
+        self.action_repeat              = last_infos.get("action_repeat", 1)          #Missing on sessions saved before action repeat existed.
         self.n_policies                 = last_infos["n_policies"]
         self.copy_policy_games          = last_infos["copy_policy_games"]
         self.change_opp_policy_games    = last_infos["change_opp_policy_games"]